@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# ---------------------------
+# Состояние процесса без блокировок
+# ---------------------------
+# Кэши и счётчики в памяти процесса (TTLCache, ResponseCache, EventHub, ReadRouter,
+# Metrics, счётчики PasswordHashingPool) трогает только поток event loop: между await
+# код не прерывается, поэтому блокировки им не нужны. Из потоков пулов (run_in_executor,
+# to_thread) это состояние не менять.
+
+
+class TTLCache(Generic[K, V]):
+    """Small in-process LRU cache with per-entry expiry.
+
+    Expired entries are dropped lazily on lookup; the LRU bound keeps memory fixed
+    regardless.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        # per-entry ttl can only shorten the cache-wide one
+        if ttl is None:
+            ttl = self.ttl
+        elif self.ttl is not None:
+            ttl = min(ttl, self.ttl)
+        if self.maxsize <= 0 or (ttl is not None and ttl <= 0):
+            return
+        expires_at = float("inf") if ttl is None else self._clock() + ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,47 @@
+"""Versioned schema migrations (Alembic scripts in adapters/migrations).
+
+    python -m adapters.migrate         # upgrade DATABASE_URL to head
+    alembic downgrade -1               # anything else goes through the alembic CLI
+
+The app runs the same upgrade on startup unless DB_AUTO_MIGRATE=0. A database built by
+the old create_all (tables, no alembic_version) is stamped at the baseline first.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+from adapters.persistence import engine as default_engine
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+# schema that Base.metadata.create_all used to build at import time
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    cfg = Config()
+    cfg.set_main_option("script_location", str(MIGRATIONS_DIR))
+    if connection is not None:
+        cfg.attributes["connection"] = connection
+    return cfg
+
+
+def upgrade_database(engine: Engine | None = None, revision: str = "head") -> None:
+    """Bring the database to `revision`, adopting pre-migration databases in place."""
+    with (engine or default_engine).begin() as connection:
+        cfg = alembic_config(connection)
+        tables = set(inspect(connection).get_table_names())
+        if "alembic_version" not in tables and "users" in tables:
+            # база создана старым create_all: её схема совпадает с baseline
+            command.stamp(cfg, BASELINE_REVISION)
+        command.upgrade(cfg, revision)
+
+
+if __name__ == "__main__":
+    upgrade_database(revision=sys.argv[1] if len(sys.argv) > 1 else "head")
@@ -0,0 +1,31 @@
+"""indexes for assignment filters, login lookup and membership by user
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-11-01
+"""
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_assignments_group_status_due", "assignments", ["group_id", "status", "due_date"]
+    )
+    op.create_index(
+        "ix_assignments_assignee_status", "assignments", ["assigned_to_user_id", "status"]
+    )
+    op.create_index("ix_users_name", "users", ["name"])
+    op.create_index("ix_group_users_user_id", "group_users", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_group_users_user_id", table_name="group_users")
+    op.drop_index("ix_users_name", table_name="users")
+    op.drop_index("ix_assignments_assignee_status", table_name="assignments")
+    op.drop_index("ix_assignments_group_status_due", table_name="assignments")
@@ -0,0 +1,32 @@
+"""(status, due_date) indexes for the overdue-assignments query
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-11-12
+"""
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_assignments_status_due", "assignments", ["status", "due_date"])
+    # (assignee, status) -> (assignee, status, due_date): прежний префикс сохраняется
+    op.create_index(
+        "ix_assignments_assignee_status_due",
+        "assignments",
+        ["assigned_to_user_id", "status", "due_date"],
+    )
+    op.drop_index("ix_assignments_assignee_status", table_name="assignments")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_assignments_assignee_status", "assignments", ["assigned_to_user_id", "status"]
+    )
+    op.drop_index("ix_assignments_assignee_status_due", table_name="assignments")
+    op.drop_index("ix_assignments_status_due", table_name="assignments")
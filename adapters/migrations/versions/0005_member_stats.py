@@ -0,0 +1,73 @@
+"""member_stats / member_daily_stats summary tables for group statistics, backfilled
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-11-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "member_stats",
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("pending", sa.Integer(), nullable=False),
+        sa.Column("done", sa.Integer(), nullable=False),
+        sa.Column("skipped", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("group_id", "user_id"),
+    )
+    op.create_table(
+        "member_daily_stats",
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("done", sa.Integer(), nullable=False),
+        sa.Column("skipped", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("group_id", "day", "user_id"),
+    )
+
+    # счётчики для уже существующих назначений; дальше их ведёт приложение
+    op.execute(
+        """
+        INSERT INTO member_stats (group_id, user_id, pending, done, skipped)
+        SELECT group_id, assigned_to_user_id,
+               SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END)
+        FROM assignments
+        GROUP BY group_id, assigned_to_user_id
+        """
+    )
+    day = (
+        "date(completed_at)"
+        if op.get_bind().dialect.name == "sqlite"
+        else "CAST(completed_at AS DATE)"
+    )
+    op.execute(
+        f"""
+        INSERT INTO member_daily_stats (group_id, day, user_id, done, skipped)
+        SELECT group_id, {day}, assigned_to_user_id,
+               SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END)
+        FROM assignments
+        WHERE status IN ('done', 'skipped') AND completed_at IS NOT NULL
+        GROUP BY group_id, {day}, assigned_to_user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("member_daily_stats")
+    op.drop_table("member_stats")
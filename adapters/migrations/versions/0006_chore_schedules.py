@@ -0,0 +1,51 @@
+"""chore_schedules and assignments.schedule_id for recurring chores
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-11-20
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chore_schedules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("chore_id", sa.Integer(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("interval_days", sa.Integer(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("assigned_to_user_id", sa.Integer(), nullable=True),
+        sa.Column("assigned_by_user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["chore_id"], ["chores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["assigned_to_user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["assigned_by_user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # SQLite не умеет ADD CONSTRAINT: batch пересоздаёт таблицу с данными и индексами
+    with op.batch_alter_table("assignments") as batch:
+        batch.add_column(sa.Column("schedule_id", sa.Integer(), nullable=True))
+        batch.create_foreign_key(
+            "fk_assignments_schedule_id",
+            "chore_schedules",
+            ["schedule_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+        batch.create_unique_constraint("uq_assignments_schedule_due", ["schedule_id", "due_date"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("assignments") as batch:
+        batch.drop_constraint("uq_assignments_schedule_due", type_="unique")
+        batch.drop_constraint("fk_assignments_schedule_id", type_="foreignkey")
+        batch.drop_column("schedule_id")
+    op.drop_table("chore_schedules")
@@ -0,0 +1,36 @@
+"""change_log: append-only entity changes behind GET /changes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-11-24
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "change_log",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=True),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("op", sa.String(), nullable=False),
+        sa.Column("data", sa.Text(), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_change_log_group_id_id", "change_log", ["group_id", "id"])
+    op.create_index("ix_change_log_entity", "change_log", ["entity", "entity_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_change_log_entity", table_name="change_log")
+    op.drop_index("ix_change_log_group_id_id", table_name="change_log")
+    op.drop_table("change_log")
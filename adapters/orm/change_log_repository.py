@@ -0,0 +1,81 @@
+from typing import Iterable, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.models import ChangeLogModel
+from adapters.orm.version_repository import get_versions, set_version
+
+# id последней записи, выброшенной ограничением размера: курсоры младше — устарели
+COMPACTED_SCOPE = "changes:compacted"
+# ключ pg_advisory_xact_lock писателей журнала
+_APPEND_LOCK = 0x6368616E6765  # "change"
+
+
+async def append_changes(db: AsyncSession, changes: Iterable) -> None:
+    """Insert changes (group_id, entity, entity_id, op, data) in the caller's transaction.
+
+    On PostgreSQL writers of the log are serialized by a transaction-level advisory
+    lock, so ids become visible in commit order and a reader that has seen id N will
+    never find a smaller id committed later. The lock is taken right before the
+    caller commits and only by transactions that log something. SQLite serializes
+    writers anyway.
+    """
+    rows = [
+        {
+            "group_id": c.group_id,
+            "entity": c.entity,
+            "entity_id": c.entity_id,
+            "op": c.op,
+            "data": orjson.dumps(c.data).decode(),
+        }
+        for c in changes
+    ]
+    if not rows:
+        return
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(select(func.pg_advisory_xact_lock(_APPEND_LOCK)))
+    await db.execute(insert(ChangeLogModel), rows)
+
+
+async def changes_since(
+    db: AsyncSession, since: int, group_id: Optional[int], limit: int
+) -> List[Row]:
+    """Up to `limit` changes after cursor `since`, oldest first; with `group_id`, that
+    group's changes plus the group-less ones (chores)."""
+    c = ChangeLogModel
+    q = select(c.__table__).where(c.id > since)
+    if group_id is not None:
+        q = q.where(or_(c.group_id == group_id, c.group_id.is_(None)))
+    return list(await db.execute(q.order_by(c.id).limit(limit)))
+
+
+async def change_log_bounds(db: AsyncSession) -> Tuple[int, int]:
+    """(compacted_through, head): valid cursors lie in [compacted_through, head]."""
+    horizon = (await get_versions(db, [COMPACTED_SCOPE]))[COMPACTED_SCOPE]
+    head = (await db.execute(select(func.max(ChangeLogModel.id)))).scalar()
+    return horizon, max(head or 0, horizon)
+
+
+async def compact_change_log(db: AsyncSession, max_rows: int) -> Tuple[int, int]:
+    """Bound the log in the caller's transaction; returns (superseded, dropped).
+
+    1. Rows superseded by a newer row for the same entity are deleted. Every row
+       carries the full entity after the change, so a reader from any cursor still
+       ends up with the latest state; no cursor is invalidated.
+    2. If more than `max_rows` remain, the oldest are deleted and COMPACTED_SCOPE
+       moves to the last deleted id: older cursors get 410 and resync from the lists.
+    """
+    t = ChangeLogModel.__table__
+    latest = select(func.max(t.c.id)).group_by(t.c.entity, t.c.group_id, t.c.entity_id)
+    superseded = (await db.execute(delete(t).where(t.c.id.not_in(latest)))).rowcount
+    cutoff = (
+        await db.execute(select(t.c.id).order_by(t.c.id.desc()).offset(max_rows).limit(1))
+    ).scalar()
+    dropped = 0
+    if cutoff is not None:
+        dropped = (await db.execute(delete(t).where(t.c.id <= cutoff))).rowcount
+        await set_version(db, COMPACTED_SCOPE, cutoff)
+    return superseded, dropped
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence, Set
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.models import AssignmentModel, ChoreModel
+from adapters.orm.upsert import dialect_insert
+
+
+async def existing_chore_ids(db: AsyncSession, ids: Iterable[int]) -> Set[int]:
+    ids = set(ids)
+    if not ids:
+        return set()
+    return set((await db.execute(select(ChoreModel.id).where(ChoreModel.id.in_(ids)))).scalars())
+
+
+async def _insert_many(db: AsyncSession, model, rows: Sequence[Dict[str, Any]]) -> List[Row]:
+    """Insert many rows via executemany and return the stored rows in input order.
+
+    SQLAlchemy batches this into multi-row INSERT ... VALUES ... RETURNING statements,
+    whose RETURNING order the database doesn't promise; `sort_by_parameter_order` makes
+    it match the input (on Postgres through an ordered sentinel, still batched). SQLite
+    would fall back to one INSERT per row for it (an integer PK is not a sentinel
+    there), but it hands out ids in VALUES order, so its rows are ordered by id instead.
+    """
+    if not rows:
+        return []
+    columns = model.__table__.c
+    if db.bind.dialect.name == "sqlite":
+        result = await db.execute(insert(model).returning(*columns), list(rows))
+        return sorted(result, key=lambda row: row.id)
+    stmt = insert(model).returning(*columns, sort_by_parameter_order=True)
+    return list(await db.execute(stmt, list(rows)))
+
+
+async def insert_chores(db: AsyncSession, rows: Sequence[Dict[str, Any]]) -> List[Row]:
+    return await _insert_many(db, ChoreModel, rows)
+
+
+async def insert_assignments(db: AsyncSession, rows: Sequence[Dict[str, Any]]) -> List[Row]:
+    return await _insert_many(db, AssignmentModel, rows)
+
+
+async def lock_assignments(db: AsyncSession, ids: Iterable[int]) -> List[Row]:
+    """Current state of assignments about to change, locked until commit.
+
+    Postgres locks the rows with FOR UPDATE (in id order, so overlapping batches don't
+    deadlock). SQLite ignores FOR UPDATE: there a no-op UPDATE takes the database write
+    lock first, so the statuses read next can't be changed by a concurrent transition.
+    """
+    ids = set(ids)
+    if not ids:
+        return []
+    a = AssignmentModel
+    if db.bind.dialect.name == "sqlite":
+        await db.execute(
+            update(a)
+            .where(a.id.in_(ids))
+            .values(status=a.status)
+            .execution_options(synchronize_session=False)
+        )
+    stmt = (
+        select(a.id, a.group_id, a.assigned_to_user_id, a.status, a.completed_at)
+        .where(a.id.in_(ids))
+        .order_by(a.id)
+        .with_for_update()
+    )
+    return list(await db.execute(stmt))
+
+
+async def set_assignments_status(
+    db: AsyncSession, ids: Iterable[int], status: str, completed_at: datetime
+) -> List[Row]:
+    """Move assignments to `status` with one UPDATE ... RETURNING; rows come back per hit id."""
+    ids = set(ids)
+    if not ids:
+        return []
+    stmt = (
+        update(AssignmentModel)
+        .where(AssignmentModel.id.in_(ids))
+        .values(status=status, completed_at=completed_at)
+        .returning(*AssignmentModel.__table__.c)
+        .execution_options(synchronize_session=False)
+    )
+    return list(await db.execute(stmt))
+
+
+async def insert_generated_assignments(
+    db: AsyncSession, rows: Sequence[Dict[str, Any]]
+) -> List[Row]:
+    """Insert schedule occurrences, skipping (schedule_id, due_date) pairs that exist.
+
+    Returns only the rows actually created, so re-running a generation is a no-op.
+    """
+    if not rows:
+        return []
+    table = AssignmentModel.__table__
+    stmt = (
+        dialect_insert(db)(table)
+        .on_conflict_do_nothing(index_elements=[table.c.schedule_id, table.c.due_date])
+        .returning(*table.c)
+    )
+    return list(await db.execute(stmt, list(rows)))
@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from sqlalchemy import delete, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.models import GroupModel
+from domain.db import group_users
+
+
+async def user_ids_by_group(db: AsyncSession, group_ids: Sequence[int]) -> Dict[int, List[int]]:
+    """Member ids for a batch of groups in a single query (see `group_ids_by_user`)."""
+    result: Dict[int, List[int]] = {gid: [] for gid in group_ids}
+    if not result:
+        return result
+    rows = await db.execute(
+        select(group_users.c.group_id, group_users.c.user_id)
+        .where(group_users.c.group_id.between(min(result), max(result)))
+        .order_by(group_users.c.group_id, group_users.c.user_id)
+    )
+    for group_id, user_id in rows:
+        if group_id in result:
+            result[group_id].append(user_id)
+    return result
+
+
+async def existing_group_ids(db: AsyncSession, ids: Iterable[int]) -> Set[int]:
+    ids = set(ids)
+    if not ids:
+        return set()
+    return set((await db.execute(select(GroupModel.id).where(GroupModel.id.in_(ids)))).scalars())
+
+
+async def existing_memberships(
+    db: AsyncSession, pairs: Iterable[Tuple[int, int]]
+) -> Set[Tuple[int, int]]:
+    """Which of the (group_id, user_id) pairs are memberships, in one query."""
+    pairs = set(pairs)
+    if not pairs:
+        return set()
+    rows = await db.execute(
+        select(group_users.c.group_id, group_users.c.user_id).where(
+            tuple_(group_users.c.group_id, group_users.c.user_id).in_(pairs)
+        )
+    )
+    return {(group_id, user_id) for group_id, user_id in rows}
+
+
+async def is_member(db: AsyncSession, group_id: int, user_id: int) -> bool:
+    row = (
+        await db.execute(
+            select(group_users.c.user_id).where(
+                group_users.c.group_id == group_id, group_users.c.user_id == user_id
+            )
+        )
+    ).first()
+    return row is not None
+
+
+async def add_member(db: AsyncSession, group_id: int, user_id: int) -> None:
+    await db.execute(insert(group_users).values(group_id=group_id, user_id=user_id))
+
+
+async def remove_member(db: AsyncSession, group_id: int, user_id: int) -> None:
+    await db.execute(
+        delete(group_users).where(
+            group_users.c.group_id == group_id, group_users.c.user_id == user_id
+        )
+    )
+
+
+async def lock_groups(db: AsyncSession, group_ids: Iterable[int]) -> None:
+    """Serialize writers that decide by the groups' current state until commit.
+
+    A no-op UPDATE takes row locks on Postgres and the database write lock on SQLite,
+    so reads that follow already see what a concurrent transaction committed.
+    """
+    ids = sorted(set(group_ids))
+    if ids:
+        await db.execute(
+            update(GroupModel)
+            .where(GroupModel.id.in_(ids))
+            .values(name=GroupModel.name)
+            .execution_options(synchronize_session=False)
+        )
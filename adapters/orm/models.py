@@ -1,9 +1,20 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
-from adapters.persistence import Base, engine
+from adapters.persistence import Base
 from domain.db import group_users
 
 # ---------------------------
@@ -14,7 +25,7 @@ from domain.db import group_users
 class UserModel(Base):
     __tablename__ = "users"
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False, unique=False)
+    name = Column(String, nullable=False, unique=False, index=True)
     hashed_password = Column(String, nullable=False)
 
     groups = relationship("GroupModel", secondary=group_users, back_populates="users")
@@ -38,8 +49,37 @@ class ChoreModel(Base):
     created_by = relationship("UserModel", foreign_keys=[created_by_user_id])
 
 
+class ChoreScheduleModel(Base):
+    """Recurrence rule: `chore` is due in `group` every `interval_days` from `start_date`.
+
+    With `assigned_to_user_id` unset the occurrences rotate over the group's members
+    (ordered by user id); see domain/recurrence.py.
+    """
+
+    __tablename__ = "chore_schedules"
+    id = Column(Integer, primary_key=True)
+    chore_id = Column(Integer, ForeignKey("chores.id", ondelete="CASCADE"), nullable=False)
+    group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
+    interval_days = Column(Integer, nullable=False)
+    start_date = Column(Date, nullable=False)
+    assigned_to_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    assigned_by_user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+
 class AssignmentModel(Base):
     __tablename__ = "assignments"
+    # Горячие фильтры list_assignments и дашбордов; схема меняется только миграциями
+    # (adapters/migrations), индексы здесь нужны для create_all в тестах и autogenerate.
+    __table_args__ = (
+        Index("ix_assignments_group_status_due", "group_id", "status", "due_date"),
+        Index("ix_assignments_assignee_status_due", "assigned_to_user_id", "status", "due_date"),
+        # просроченные без фильтров: status = 'pending' AND due_date < :as_of
+        Index("ix_assignments_status_due", "status", "due_date"),
+        # генератор повторяющихся дел вставляет с ON CONFLICT DO NOTHING по этой паре
+        UniqueConstraint("schedule_id", "due_date", name="uq_assignments_schedule_due"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     chore_id = Column(Integer, ForeignKey("chores.id", ondelete="CASCADE"), nullable=False)
     group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
@@ -53,6 +93,11 @@ class AssignmentModel(Base):
     due_date = Column(Date, nullable=True)
     status = Column(String, default="pending", nullable=False)  # pending/done/skipped
     completed_at = Column(DateTime, nullable=True)
+    schedule_id = Column(
+        Integer,
+        ForeignKey("chore_schedules.id", ondelete="SET NULL", name="fk_assignments_schedule_id"),
+        nullable=True,
+    )
 
     chore = relationship("ChoreModel")
     group = relationship("GroupModel")
@@ -60,5 +105,60 @@ class AssignmentModel(Base):
     assigned_by = relationship("UserModel", foreign_keys=[assigned_by_user_id])
 
 
-# Создаём таблицы (если не существуют)
-Base.metadata.create_all(bind=engine)
+class EntityVersionModel(Base):
+    """Monotonic change counter per list scope ("chores", "assignments:group:5", ...)."""
+
+    __tablename__ = "entity_versions"
+    scope = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+# ---------------------------
+# Сводные счётчики для /groups/{id}/stats
+# ---------------------------
+# Поддерживаются в тех же транзакциях, что и назначения (adapters/orm/stats_repository.py),
+# поэтому статистика группы читается за O(участников), а не за O(назначений).
+class MemberStatsModel(Base):
+    """Current number of assignments per (group, assignee) in each status."""
+
+    __tablename__ = "member_stats"
+    __table_args__ = (PrimaryKeyConstraint("group_id", "user_id"),)
+    group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    pending = Column(Integer, nullable=False, default=0)
+    done = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+
+
+class MemberDailyStatsModel(Base):
+    """Assignments finished per (group, assignee, UTC day of completed_at)."""
+
+    __tablename__ = "member_daily_stats"
+    __table_args__ = (PrimaryKeyConstraint("group_id", "day", "user_id"),)
+    group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    done = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+
+
+# ---------------------------
+# Журнал изменений для GET /changes
+# ---------------------------
+# Пишется в транзакции каждой записи (app.changes.commit_changes); id — курсор клиента.
+class ChangeLogModel(Base):
+    """Append-only log of entity changes; `data` is the entity as JSON after the change."""
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_group_id_id", "group_id", "id"),
+        Index("ix_change_log_entity", "entity", "entity_id"),
+    )
+    id = Column(Integer, primary_key=True)
+    # без FK: записи о группе переживают её саму; NULL — общие сущности (дела)
+    group_id = Column(Integer, nullable=True)
+    entity = Column(String, nullable=False)  # chore / assignment / membership
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)  # created / done / skipped / added / removed
+    data = Column(Text, nullable=False)
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Dict, Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.models import ChoreScheduleModel
+from domain.db import group_users
+
+
+async def schedules_page(
+    db: AsyncSession, after_id: int, starting_before: date, limit: int
+) -> List[Row]:
+    """Next `limit` schedules by id that have started before `starting_before`."""
+    s = ChoreScheduleModel
+    q = (
+        select(s.__table__)
+        .where(s.id > after_id, s.start_date < starting_before)
+        .order_by(s.id)
+        .limit(limit)
+    )
+    return list(await db.execute(q))
+
+
+async def members_of_groups(db: AsyncSession, group_ids: Iterable[int]) -> Dict[int, List[int]]:
+    """Sorted member ids per group for an arbitrary (non-contiguous) set of groups."""
+    result: Dict[int, List[int]] = {gid: [] for gid in group_ids}
+    if not result:
+        return result
+    rows = await db.execute(
+        select(group_users.c.group_id, group_users.c.user_id)
+        .where(group_users.c.group_id.in_(result))
+        .order_by(group_users.c.group_id, group_users.c.user_id)
+    )
+    for group_id, user_id in rows:
+        result[group_id].append(user_id)
+    return result
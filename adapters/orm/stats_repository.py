@@ -0,0 +1,117 @@
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.models import MemberDailyStatsModel, MemberStatsModel
+from adapters.orm.upsert import dialect_insert
+from domain.db import group_users
+
+FINISHED = ("done", "skipped")
+
+MemberKey = Tuple[int, int]  # (group_id, user_id)
+DailyKey = Tuple[int, int, date]  # (group_id, user_id, day)
+
+
+def transition_deltas(
+    before: Iterable[Row], new_status: str, completed_at: datetime
+) -> Tuple[Dict[MemberKey, Counter], Dict[DailyKey, Counter]]:
+    """Counter changes for moving `before` rows (id, group, assignee, status,
+    completed_at as they were) to `new_status` finished at `completed_at`.
+
+    The old contribution is always taken back and the new one added, so repeated
+    transitions (done -> done moves completed_at) keep the day buckets right too.
+    """
+    member: Dict[MemberKey, Counter] = defaultdict(Counter)
+    daily: Dict[DailyKey, Counter] = defaultdict(Counter)
+    for row in before:
+        key = (row.group_id, row.assigned_to_user_id)
+        member[key][row.status] -= 1
+        member[key][new_status] += 1
+        if row.status in FINISHED and row.completed_at is not None:
+            daily[(*key, row.completed_at.date())][row.status] -= 1
+        if new_status in FINISHED:
+            daily[(*key, completed_at.date())][new_status] += 1
+    return member, daily
+
+
+async def _apply(db: AsyncSession, model, keys: Sequence[str], deltas: Dict[tuple, Counter]):
+    counters = [c.name for c in model.__table__.c if c.name not in keys]
+    rows = [
+        {**dict(zip(keys, key)), **{c: delta[c] for c in counters}}
+        for key, delta in deltas.items()
+        if any(delta[c] for c in counters)
+    ]
+    if not rows:
+        return
+    table = model.__table__
+    stmt = dialect_insert(db)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c[k] for k in keys],
+        set_={c: table.c[c] + stmt.excluded[c] for c in counters},
+    )
+    # ключи в фиксированном порядке: параллельные транзакции берут блокировки одинаково
+    await db.execute(stmt, sorted(rows, key=lambda r: tuple(r[k] for k in keys)))
+
+
+async def record_assignments_created(db: AsyncSession, rows: Iterable) -> None:
+    created = Counter((r.group_id, r.assigned_to_user_id) for r in rows)
+    deltas = {key: Counter(pending=n) for key, n in created.items()}
+    await _apply(db, MemberStatsModel, ("group_id", "user_id"), deltas)
+
+
+async def record_assignments_transition(
+    db: AsyncSession, before: Iterable[Row], new_status: str, completed_at: datetime
+) -> None:
+    member, daily = transition_deltas(before, new_status, completed_at)
+    await _apply(db, MemberStatsModel, ("group_id", "user_id"), member)
+    await _apply(db, MemberDailyStatsModel, ("group_id", "user_id", "day"), daily)
+
+
+async def group_member_stats(
+    db: AsyncSession, group_id: int, since: Optional[date] = None, until: Optional[date] = None
+) -> Dict[int, Dict[str, int]]:
+    """Per-assignee counters of one group: current `pending`, and `done`/`skipped`
+    either all-time or finished within [since, until] (UTC days)."""
+    m = MemberStatsModel
+    rows = await db.execute(
+        select(m.user_id, m.pending, m.done, m.skipped).where(m.group_id == group_id)
+    )
+    stats = {r.user_id: {"pending": r.pending, "done": r.done, "skipped": r.skipped} for r in rows}
+    if since is None and until is None:
+        return stats
+
+    d = MemberDailyStatsModel
+    q = select(d.user_id, func.sum(d.done), func.sum(d.skipped)).where(d.group_id == group_id)
+    if since is not None:
+        q = q.where(d.day >= since)
+    if until is not None:
+        q = q.where(d.day <= until)
+    window = {
+        uid: (done, skipped) for uid, done, skipped in await db.execute(q.group_by(d.user_id))
+    }
+    for user_id, counters in stats.items():
+        counters["done"], counters["skipped"] = window.get(user_id, (0, 0))
+    return stats
+
+
+async def pending_by_member(
+    db: AsyncSession, group_ids: Iterable[int]
+) -> Dict[int, Dict[int, int]]:
+    """Pending counter of every current member, 0 for members with no stats row yet."""
+    result: Dict[int, Dict[int, int]] = {gid: {} for gid in group_ids}
+    if not result:
+        return result
+    gu, m = group_users, MemberStatsModel
+    joined = gu.outerjoin(m, and_(m.group_id == gu.c.group_id, m.user_id == gu.c.user_id))
+    rows = await db.execute(
+        select(gu.c.group_id, gu.c.user_id, func.coalesce(m.pending, 0))
+        .select_from(joined)
+        .where(gu.c.group_id.in_(result))
+    )
+    for group_id, user_id, pending in rows:
+        result[group_id][user_id] = pending
+    return result
@@ -0,0 +1,13 @@
+from typing import Callable
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# INSERT ... ON CONFLICT есть у обоих поддерживаемых диалектов, но конструкторы разные
+_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+
+def dialect_insert(db: AsyncSession) -> Callable:
+    """`insert()` with `on_conflict_do_update` for the session's database."""
+    return _INSERTS[db.bind.dialect.name]
@@ -0,0 +1,35 @@
+from typing import Dict, Iterable, List, Sequence, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.models import UserModel
+from domain.db import group_users
+
+
+async def group_ids_by_user(db: AsyncSession, user_ids: Sequence[int]) -> Dict[int, List[int]]:
+    """Group ids for a batch of users in a single query.
+
+    List endpoints hand over id-ordered pages, so the batch is selected with an id range
+    rather than an IN list: one statement regardless of page size and no bind-parameter
+    limits. Rows outside the batch (gaps in a filtered page) are dropped here.
+    """
+    result: Dict[int, List[int]] = {uid: [] for uid in user_ids}
+    if not result:
+        return result
+    rows = await db.execute(
+        select(group_users.c.user_id, group_users.c.group_id)
+        .where(group_users.c.user_id.between(min(result), max(result)))
+        .order_by(group_users.c.user_id, group_users.c.group_id)
+    )
+    for user_id, group_id in rows:
+        if user_id in result:
+            result[user_id].append(group_id)
+    return result
+
+
+async def existing_user_ids(db: AsyncSession, ids: Iterable[int]) -> Set[int]:
+    ids = set(ids)
+    if not ids:
+        return set()
+    return set((await db.execute(select(UserModel.id).where(UserModel.id.in_(ids)))).scalars())
@@ -0,0 +1,45 @@
+from typing import Dict, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.models import EntityVersionModel
+from adapters.orm.upsert import dialect_insert
+
+
+async def bump_versions(db: AsyncSession, scopes: Iterable[str]) -> None:
+    """Increment the counters in the caller's transaction (one executemany upsert).
+
+    Parameters go through executemany rather than a multi-row VALUES clause, so the
+    statement compiles once and is cached no matter how many scopes a write touches.
+    """
+    scopes = sorted(set(scopes))  # fixed order: concurrent writers lock rows alike
+    if not scopes:
+        return
+    table = EntityVersionModel.__table__
+    stmt = dialect_insert(db)(table).on_conflict_do_update(
+        index_elements=[table.c.scope], set_={"version": table.c.version + 1}
+    )
+    await db.execute(stmt, [{"scope": scope, "version": 1} for scope in scopes])
+
+
+async def get_versions(db: AsyncSession, scopes: Iterable[str]) -> Dict[str, int]:
+    scopes = set(scopes)
+    rows = await db.execute(
+        select(EntityVersionModel.scope, EntityVersionModel.version).where(
+            EntityVersionModel.scope.in_(scopes)
+        )
+    )
+    versions = {scope: 0 for scope in scopes}
+    versions.update({scope: version for scope, version in rows})
+    return versions
+
+
+async def set_version(db: AsyncSession, scope: str, version: int) -> None:
+    table = EntityVersionModel.__table__
+    stmt = dialect_insert(db)(table).values(scope=scope, version=version)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.scope], set_={"version": stmt.excluded.version}
+        )
+    )
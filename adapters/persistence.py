@@ -1,8 +1,26 @@
 import os
-from typing import Generator
+import time
+from typing import Any, AsyncContextManager, AsyncGenerator, Callable, Dict, Generator, List
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    Session,
+    SessionTransaction,
+    declarative_base,
+    sessionmaker,
+)
+from sqlalchemy.pool import QueuePool
+from starlette.requests import Request
+
+from adapters.replicas import ReadRouter, client_key, replica_urls
 
 # Use DATABASE_URL env var if present (e.g. for Postgres in compose/CI).
 # Fallback to SQLite file used by the project.
@@ -10,16 +28,162 @@ DEFAULT_SQLITE_URL = os.getenv("DEFAULT_SQLITE_URL", "sqlite:///./data/chores_tr
 # allow overriding in tests while keeping a sensible local default
 DATABASE_URL = os.getenv("DATABASE_URL") or os.getenv("TEST_DB_URL") or DEFAULT_SQLITE_URL
 
-# If using SQLite we need check_same_thread; for other DBs it's not required and should be omitted
-connect_args = (
-    {"check_same_thread": False} if DATABASE_URL and DATABASE_URL.startswith("sqlite") else {}
-)
+# async drivers used by the request path for each sync backend
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def to_async_url(url: str) -> str:
+    """Swap the DBAPI driver of a sync URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+# ASYNC_DATABASE_URL is only needed when the async driver can't be derived from DATABASE_URL
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+# Pool settings; unset variables keep SQLAlchemy's defaults for the dialect.
+POOL_SETTINGS = {
+    "DB_POOL_SIZE": ("pool_size", int),
+    "DB_MAX_OVERFLOW": ("max_overflow", int),
+    "DB_POOL_TIMEOUT": ("pool_timeout", float),
+    "DB_POOL_RECYCLE": ("pool_recycle", int),
+}
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """`create_engine()` keyword arguments for `url` from the environment.
+
+    DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT / DB_POOL_RECYCLE size the pool,
+    DB_POOL_PRE_PING=1 checks connections on checkout, DB_STATEMENT_TIMEOUT_MS caps
+    each statement on PostgreSQL (passed in the driver's own connect arguments).
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    connect_args: Dict[str, Any] = {}
+    options: Dict[str, Any] = {
+        "connect_args": connect_args,
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "0") == "1",
+    }
+    for env, (name, cast) in POOL_SETTINGS.items():
+        if os.getenv(env):
+            options[name] = cast(os.environ[env])
+    if backend == "sqlite":
+        # pooled connections move between threads (TestClient, run_in_threadpool)
+        connect_args["check_same_thread"] = False
+    timeout = os.getenv("DB_STATEMENT_TIMEOUT_MS")
+    if timeout and backend == "postgresql":
+        if parsed.get_driver_name() == "asyncpg":
+            connect_args["server_settings"] = {"statement_timeout": timeout}
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+    return options
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+
+def sqlite_pragmas() -> List[str]:
+    """Pragmas run on every new SQLite connection.
+
+    WAL lets readers proceed while a writer commits (the rollback journal serializes
+    them), and synchronous=NORMAL is durable in WAL mode except for the last commits
+    on power loss. SQLITE_JOURNAL_MODE=DELETE / SQLITE_SYNCHRONOUS=FULL restore the
+    SQLite defaults; busy_timeout makes a blocked writer wait instead of failing.
+    """
+    return [
+        f"PRAGMA journal_mode={os.getenv('SQLITE_JOURNAL_MODE', 'WAL')}",
+        f"PRAGMA synchronous={os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')}",
+        f"PRAGMA busy_timeout={int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))}",
+    ]
+
+
+def _apply_sqlite_pragmas(sync_engine: Engine) -> None:
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+# Sync engine: migrations, CLI jobs and test fixtures.
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
 
 SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
 Base = declarative_base()
 
+# Async engine: the HTTP request path, so DB round trips don't block the event loop.
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+
+for _sync_engine in (engine, async_engine.sync_engine):
+    if _sync_engine.dialect.name == "sqlite":
+        _apply_sqlite_pragmas(_sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+# Read replicas: comma-separated sync URLs, same form as DATABASE_URL. GET handlers read
+# through `get_read_db`; writes and reads that lock rows stay on the primary.
+DATABASE_READ_URLS = replica_urls(os.getenv("DATABASE_READ_URLS", ""))
+
+
+def _replica_engine(url: str) -> AsyncEngine:
+    async_url = to_async_url(url)
+    replica = create_async_engine(async_url, **engine_options(async_url))
+    if replica.dialect.name == "sqlite":
+        _apply_sqlite_pragmas(replica.sync_engine)
+    return replica
+
+
+read_router = ReadRouter(
+    async_engine,
+    [_replica_engine(url) for url in DATABASE_READ_URLS],
+    sticky_seconds=float(os.getenv("READ_AFTER_WRITE_SECONDS", "5")),
+)
+
+_COMMITTED = "committed"
+
+# Called with (pool, seconds) when a session got its connection; app.metrics subscribes.
+# The wait runs from the statement that needed a connection to the start of the session
+# transaction on it (right after the pool checkout), so sessions stay lazy: a request
+# answered without a query takes nothing from the pool.
+checkout_observers: List[Callable[[str, float], None]] = []
+_CHECKOUT_STARTED = "checkout_started"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_checkout_start(state: ORMExecuteState) -> None:
+    session = state.session
+    if checkout_observers and not session.in_transaction():
+        session.info[_CHECKOUT_STARTED] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_begin")
+def _observe_checkout(session: Session, transaction: SessionTransaction, connection) -> None:
+    start = session.info.pop(_CHECKOUT_STARTED, None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    pool = "primary" if connection.engine in (engine, async_engine.sync_engine) else "replica"
+    for observe in checkout_observers:
+        observe(pool, elapsed)
+
+
+def pool_stats() -> Dict[str, int]:
+    """Connections of the request-path pool; empty for pools that don't count them."""
+    pool = async_engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {"size": pool.size(), "checked_out": pool.checkedout()}
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_commit(session: Session) -> None:
+    session.info[_COMMITTED] = True
+
 
 def get_db() -> Generator:
     """Yield a SQLAlchemy session (used as FastAPI dependency)."""
@@ -28,3 +192,27 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield an AsyncSession on the primary (FastAPI dependency for async handlers).
+
+    A request that committed makes its client read from the primary for a while
+    (read-your-writes, see `ReadRouter`).
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+        if db.info.get(_COMMITTED):
+            read_router.mark_write(client_key(request))
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield an AsyncSession for read-only handlers: a replica when configured."""
+    async with read_router.session(client_key(request)) as db:
+        yield db
+
+
+def read_sessions(request: Request) -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """Session factory for work that outlives the request (streamed bodies)."""
+    key = client_key(request)
+    return lambda: read_router.session(key)
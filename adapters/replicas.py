@@ -0,0 +1,115 @@
+import itertools
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Hashable, List, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from starlette.requests import Request
+
+
+def client_key(request: Request) -> Hashable:
+    """Who is reading: the bearer token if any, else the client address."""
+    auth = request.headers.get("authorization")
+    if auth:
+        return hash(auth)  # сам токен в памяти процесса не держим
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+class ReadRouter:
+    """Chooses the database for read-only sessions.
+
+    Reads go to the replica with the fewest sessions in flight (ties rotate, so an
+    idle set of replicas is used round-robin). A client that has just written reads
+    from the primary for `sticky_seconds`, so it sees its own writes despite
+    replication lag. Without replicas every read goes to the primary.
+
+    Stickiness is remembered per process for at most `max_clients` clients (least
+    recently written first out).
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        *,
+        sticky_seconds: float = 5.0,
+        max_clients: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.sticky_seconds = sticky_seconds
+        self.max_clients = max_clients
+        self.clock = clock
+        self._primary_sessions = async_sessionmaker(bind=primary, expire_on_commit=False)
+        self._replica_sessions = [
+            async_sessionmaker(bind=engine, expire_on_commit=False) for engine in self.replicas
+        ]
+        self._in_flight = [0] * len(self.replicas)
+        self._rotation = itertools.count()
+        self._sticky: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.primary_reads = 0
+        self.replica_reads = [0] * len(self.replicas)
+
+    def mark_write(self, client: Hashable) -> None:
+        if not self.replicas:
+            return
+        self._sticky[client] = self.clock() + self.sticky_seconds
+        self._sticky.move_to_end(client)
+        while len(self._sticky) > self.max_clients:
+            self._sticky.popitem(last=False)
+
+    def _is_sticky(self, client: Optional[Hashable]) -> bool:
+        until = self._sticky.get(client)
+        if until is None:
+            return False
+        if until <= self.clock():
+            del self._sticky[client]
+            return False
+        return True
+
+    def pick(self, client: Optional[Hashable] = None) -> Optional[int]:
+        """Replica index for the next read, or None for the primary."""
+        if not self.replicas or self._is_sticky(client):
+            return None
+        n = len(self.replicas)
+        start = next(self._rotation) % n
+        # min отдаёт первый из равных, а обход начинается с очередной реплики
+        return min((i % n for i in range(start, start + n)), key=self._in_flight.__getitem__)
+
+    @asynccontextmanager
+    async def session(self, client: Optional[Hashable] = None) -> AsyncIterator[AsyncSession]:
+        index = self.pick(client)
+        if index is None:
+            self.primary_reads += 1
+            async with self._primary_sessions() as db:
+                yield db
+            return
+        self.replica_reads[index] += 1
+        self._in_flight[index] += 1
+        try:
+            async with self._replica_sessions[index]() as db:
+                yield db
+        finally:
+            self._in_flight[index] -= 1
+
+    async def dispose(self) -> None:
+        for engine in self.replicas:
+            await engine.dispose()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "replicas": len(self.replicas),
+            "primary_reads": self.primary_reads,
+            "replica_reads": list(self.replica_reads),
+            "in_flight": list(self._in_flight),
+            "sticky_clients": len(self._sticky),
+        }
+
+
+def replica_urls(value: str) -> List[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
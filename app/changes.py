@@ -0,0 +1,50 @@
+from typing import Iterable, List, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.change_log_repository import append_changes
+from adapters.orm.version_repository import bump_versions
+from app.etag import ASSIGNMENTS, group_assignments
+from app.events import Event, event_hub
+from app.response_cache import response_cache
+
+# ---------------------------
+# Фиксация изменений
+# ---------------------------
+# Единая точка коммита для всех пишущих путей (эндпойнты, генератор расписаний):
+# scope — это имена списков, которые запись делает устаревшими (app.etag),
+# events — изменения сущностей: журнал GET /changes и push-уведомления (app.events).
+
+
+async def commit_changes(
+    db: AsyncSession, scopes: Sequence[str], events: Iterable[Event] = ()
+) -> None:
+    # версии и журнал пишутся в той же транзакции, что и данные: ETag, кэш ответов
+    # и курсоры /changes не могут увидеть новые строки без их следа
+    events = list(events)
+    await bump_versions(db, scopes)
+    await append_changes(db, events)
+    await db.commit()
+    response_cache.invalidate(scopes)
+    # только после коммита: подписчик не узнает о том, что откатилось
+    event_hub.publish(events)
+
+
+def assignment_scopes(rows: Sequence) -> List[str]:
+    if not rows:
+        return []
+    return [ASSIGNMENTS, *{group_assignments(r.group_id) for r in rows}]
+
+
+# Строки RETURNING несут все колонки: каждое событие — сущность целиком после
+# изменения, поэтому сжатие журнала может оставлять только последнее событие.
+def assignment_events(op: str, rows: Sequence) -> List[Event]:
+    return [Event(r.group_id, "assignment", r.id, op, dict(r._mapping)) for r in rows]
+
+
+def chore_events(op: str, rows: Sequence) -> List[Event]:
+    return [Event(None, "chore", r.id, op, dict(r._mapping)) for r in rows]
+
+
+def membership_event(op: str, group_id: int, user_id: int) -> Event:
+    return Event(group_id, "membership", user_id, op, {"group_id": group_id, "user_id": user_id})
@@ -0,0 +1,70 @@
+"""Bound the change log behind GET /changes.
+
+    python -m app.compaction [--max-rows 1000000]
+
+The same job runs inside the app as a periodic task (CHANGE_LOG_COMPACTOR=1, every
+CHANGE_LOG_COMPACT_INTERVAL_SECONDS, CHANGE_LOG_MAX_ROWS rows kept). Superseded rows
+are always dropped; the size bound only bites when the number of distinct entities
+alone exceeds it, and then moves the oldest valid cursor forward.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from typing import Optional, Tuple
+
+from adapters.orm.change_log_repository import compact_change_log
+from adapters.persistence import AsyncSessionLocal, async_engine
+
+logger = logging.getLogger(__name__)
+
+
+def max_rows_from_env() -> int:
+    return int(os.getenv("CHANGE_LOG_MAX_ROWS", "1000000"))
+
+
+async def compact(max_rows: Optional[int] = None) -> Tuple[int, int]:
+    """One compaction pass in its own transaction; returns (superseded, dropped)."""
+    async with AsyncSessionLocal() as db:
+        result = await compact_change_log(db, max_rows or max_rows_from_env())
+        await db.commit()
+    return result
+
+
+async def run_compactor(interval: float) -> None:
+    """Compact every `interval` seconds until cancelled; failures are logged and retried."""
+    while True:
+        try:
+            superseded, dropped = await compact()
+            if superseded or dropped:
+                logger.info("change log: %d superseded, %d dropped", superseded, dropped)
+        except Exception:
+            logger.exception("change log compaction failed")
+        await asyncio.sleep(interval)
+
+
+def start_compactor() -> Optional[asyncio.Task]:
+    if os.getenv("CHANGE_LOG_COMPACTOR", "1") != "1":
+        return None
+    interval = float(os.getenv("CHANGE_LOG_COMPACT_INTERVAL_SECONDS", "3600"))
+    return asyncio.create_task(run_compactor(interval))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-rows", type=int, default=None)
+    args = parser.parse_args()
+
+    async def run() -> Tuple[int, int]:
+        try:
+            return await compact(args.max_rows)
+        finally:
+            await async_engine.dispose()
+
+    superseded, dropped = asyncio.run(run())
+    print(f"superseded {superseded}, dropped {dropped} change log rows")
+
+
+if __name__ == "__main__":
+    main()
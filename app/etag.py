@@ -0,0 +1,50 @@
+from typing import Iterable
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.orm.version_repository import get_versions
+
+# ---------------------------
+# ETag / If-None-Match для list-эндпойнтов
+# ---------------------------
+# Каждая запись увеличивает счётчики своих scope в той же транзакции
+# (adapters.orm.version_repository.bump_versions). ETag страницы — это версии её
+# scope, поэтому повторный запрос без изменений стоит одного чтения по PK вместо
+# выборки и сериализации всего списка. Счётчики лежат в БД, а не в процессе:
+# иначе воркер, не видевший записи, отвечал бы 304 на устаревшие данные.
+USERS = "users"
+GROUPS = "groups"
+CHORES = "chores"
+ASSIGNMENTS = "assignments"
+
+
+def group_assignments(group_id: int) -> str:
+    return f"{ASSIGNMENTS}:group:{group_id}"
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # сравнение слабое (RFC 9110, 13.1.2): префикс W/ не учитывается
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+async def check_not_modified(
+    db: AsyncSession, request: Request, response: Response, scopes: Iterable[str]
+) -> str:
+    """Answer 304 if the client's ETag is current, otherwise stamp it on the response.
+
+    Versions are read before the page itself, so a write landing in between can only
+    make the ETag older than the body (next request gets 200), never newer.
+    """
+    versions = await get_versions(db, scopes)
+    tag = ".".join(f"{scope}={versions[scope]}" for scope in sorted(versions))
+    etag = f'W/"{tag}"'
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return etag
@@ -0,0 +1,179 @@
+import asyncio
+import os
+from typing import AsyncIterator, Dict, Iterable, NamedTuple, Optional, Set
+
+from app.serialization import to_json
+
+# ---------------------------
+# Push-уведомления об изменениях назначений (Server-Sent Events)
+# ---------------------------
+# Хаб живёт в процессе: commit_changes публикует события после коммита, а каждый
+# подписчик `GET /groups/{id}/events` читает свою ограниченную очередь. Публикация
+# никогда не ждёт медленного клиента: переполненная очередь заменяется одним
+# событием `reset` и подписка закрывается — клиент перечитывает список и
+# переподписывается. В нескольких воркерах подписчик видит записи своего воркера.
+
+
+class Event(NamedTuple):
+    """One entity change; also a row of the change log (adapters/orm/change_log_repository)."""
+
+    group_id: Optional[int]  # None — сущность вне групп (дело): в SSE не уходит
+    entity: str
+    entity_id: int
+    op: str
+    data: dict
+
+    @property
+    def name(self) -> str:
+        return f"{self.entity}.{self.op}"
+
+
+RESET = b"event: reset\ndata: {}\n\n"
+KEEP_ALIVE = b": keep-alive\n\n"
+_CLOSED = b""
+
+
+def encode_event(name: str, data: dict) -> bytes:
+    return b"event: " + name.encode() + b"\ndata: " + to_json(data) + b"\n\n"
+
+
+class Subscription:
+    """One client's bounded buffer of encoded events for one group."""
+
+    __slots__ = ("group_id", "_queue", "closed")
+
+    def __init__(self, group_id: int, max_events: int) -> None:
+        self.group_id = group_id
+        # +1: место под завершающий reset/закрытие есть всегда
+        self._queue: "asyncio.Queue[bytes]" = asyncio.Queue(max_events + 1)
+        self.closed = False
+
+    def offer(self, chunk: bytes) -> bool:
+        """Enqueue without waiting; False once the buffer is full."""
+        if self._queue.qsize() >= self._queue.maxsize - 1:
+            return False
+        self._queue.put_nowait(chunk)
+        return True
+
+    def close(self, last: bytes = _CLOSED) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if last is RESET:
+            # недоставленное уже бесполезно: клиент всё равно перечитает список
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        self._queue.put_nowait(last)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Next chunk, b"" after close, None if nothing arrived within `timeout`."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventHub:
+    """Fan-out of assignment events to per-group subscribers.
+
+    Every event is encoded once per publish, not once per subscriber.
+    """
+
+    def __init__(self, max_events: int, max_subscribers: int) -> None:
+        self.max_events = max_events
+        self.max_subscribers = max_subscribers
+        self._by_group: Dict[int, Set[Subscription]] = {}
+        self._count = 0
+        self.published = 0
+        self.delivered = 0
+        self.resets = 0
+
+    @classmethod
+    def from_env(cls) -> "EventHub":
+        return cls(
+            max_events=int(os.getenv("EVENTS_QUEUE_SIZE", "256")),
+            max_subscribers=int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "10000")),
+        )
+
+    def subscribe(self, group_id: int) -> Optional[Subscription]:
+        """New subscription, or None when the process is at `max_subscribers`."""
+        if self.full:
+            return None
+        sub = Subscription(group_id, self.max_events)
+        self._by_group.setdefault(group_id, set()).add(sub)
+        self._count += 1
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._by_group.get(sub.group_id)
+        if subs is None or sub not in subs:
+            return
+        subs.remove(sub)
+        self._count -= 1
+        if not subs:
+            del self._by_group[sub.group_id]
+
+    def publish(self, events: Iterable[Event]) -> None:
+        for event in events:
+            self.published += 1
+            subs = self._by_group.get(event.group_id)
+            if not subs:
+                continue
+            chunk = encode_event(event.name, event.data)
+            for sub in list(subs):
+                if sub.offer(chunk):
+                    self.delivered += 1
+                else:
+                    self.resets += 1
+                    sub.close(RESET)
+                    self.unsubscribe(sub)
+
+    @property
+    def full(self) -> bool:
+        return self._count >= self.max_subscribers
+
+    async def stream(self, group_id: int, heartbeat: float) -> AsyncIterator[bytes]:
+        """SSE body for one subscriber: events as they come, comments while idle.
+
+        The subscription is taken when the body starts, and dropped in `finally`
+        when the client goes away, so a response that is never sent holds nothing.
+        """
+        sub = self.subscribe(group_id)
+        if sub is None:
+            yield RESET
+            return
+        try:
+            # первый кусок уходит после подписки: прочитавший его клиент ничего не пропустит
+            yield b"retry: 3000\n\n"
+            while True:
+                chunk = await sub.get(heartbeat)
+                if chunk is None:
+                    yield KEEP_ALIVE
+                    continue
+                if not chunk:
+                    return
+                yield chunk
+                if chunk is RESET:
+                    return
+        finally:
+            self.unsubscribe(sub)
+
+    def close(self) -> None:
+        """End every open stream (application shutdown)."""
+        for subs in list(self._by_group.values()):
+            for sub in list(subs):
+                sub.close()
+                self.unsubscribe(sub)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": self._count,
+            "groups": len(self._by_group),
+            "max_events": self.max_events,
+            "published": self.published,
+            "delivered": self.delivered,
+            "resets": self.resets,
+        }
+
+
+event_hub = EventHub.from_env()
@@ -1,52 +1,219 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import List, Optional
-
-from fastapi import Depends, FastAPI, HTTPException, status
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-
-from adapters.orm.models import AssignmentModel, ChoreModel, GroupModel, UserModel
-from adapters.persistence import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.migrate import upgrade_database
+from adapters.orm.change_log_repository import change_log_bounds, changes_since
+from adapters.orm.chore_repository import (
+    existing_chore_ids,
+    insert_assignments,
+    insert_chores,
+    lock_assignments,
+    set_assignments_status,
+)
+from adapters.orm.group_repository import (
+    add_member,
+    existing_group_ids,
+    existing_memberships,
+    is_member,
+    lock_groups,
+    remove_member,
+    user_ids_by_group,
+)
+from adapters.orm.models import (
+    AssignmentModel,
+    ChoreModel,
+    ChoreScheduleModel,
+    GroupModel,
+    UserModel,
+)
+from adapters.orm.stats_repository import (
+    group_member_stats,
+    pending_by_member,
+    record_assignments_created,
+    record_assignments_transition,
+)
+from adapters.orm.user_repository import existing_user_ids, group_ids_by_user
+from adapters.persistence import (
+    async_engine,
+    checkout_observers,
+    get_async_db,
+    get_read_db,
+    pool_stats,
+    read_router,
+    read_sessions,
+)
+from app.changes import (
+    assignment_events,
+    assignment_scopes,
+    chore_events,
+    commit_changes,
+    membership_event,
+)
+from app.compaction import start_compactor
+from app.etag import ASSIGNMENTS, CHORES, GROUPS, USERS, check_not_modified, group_assignments
+from app.events import Event, event_hub
+from app.metrics import CONTENT_TYPE, metrics
+from app.middleware.metrics import MetricsMiddleware
 from app.middleware.rate_limiter import SimpleRateLimiterMiddleware
-from domain.auth import authenticate_user, create_access_token, get_current_user, get_password_hash
+from app.pagination import (
+    MAX_PAGE_SIZE,
+    PageParams,
+    keyset,
+    ndjson_response,
+    page_params,
+    paginate,
+    wants_ndjson,
+)
+from app.recurring import start_scheduler
+from app.response_cache import cached_json, response_cache
+from app.serialization import row_dicts, schema_columns, to_json
+from domain.auth import (
+    CurrentUser,
+    authenticate_user,
+    create_access_token,
+    get_current_user,
+    get_password_hash_async,
+    invalidate_cached_user,
+)
+from domain.clock import utc_today
+from domain.hashing import password_pool
 from domain.jwt import ACCESS_TOKEN_EXPIRE_MINUTES
-from schemas.assignment import AssignmentCreate, AssignmentRead
-from schemas.chore import ChoreCreate, ChoreRead
-from schemas.groupe import GroupCreate, GroupRead
+from schemas.assignment import (
+    AssignmentBatchCreate,
+    AssignmentBatchItem,
+    AssignmentBatchRead,
+    AssignmentCreate,
+    AssignmentRead,
+    AssignmentStatusResult,
+    AssignmentStatusUpdate,
+)
+from schemas.change import ChangesPage
+from schemas.chore import ChoreBatchCreate, ChoreBatchItem, ChoreBatchRead, ChoreCreate, ChoreRead
+from schemas.groupe import GroupCreate, GroupRead, GroupStats, MemberStats
+from schemas.schedule import ScheduleCreate, ScheduleRead
 from schemas.token import Token
 from schemas.user import UserCreate, UserRead
 
+
 # ---------------------------
 # FastAPI приложение
 # ---------------------------
-app = FastAPI(title="Household Chores Tracker (with Auth)", version="1.1")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Схема поднимается миграциями. При нескольких репликах лучше выключить
+    # (DB_AUTO_MIGRATE=0) и запускать `python -m adapters.migrate` шагом деплоя.
+    if os.getenv("DB_AUTO_MIGRATE", "1") == "1":
+        upgrade_database()
+    # генератор повторяющихся дел и сжатие журнала идемпотентны, поэтому могут
+    # работать в каждом воркере
+    tasks = [t for t in (start_scheduler(), start_compactor()) if t is not None]
+    yield
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    # оставшиеся SSE-потоки получают конец тела, а не обрыв
+    event_hub.close()
+    # соединения пула привязаны к event loop приложения
+    await async_engine.dispose()
+    await read_router.dispose()
+    password_pool.shutdown()
+
+
+app = FastAPI(title="Household Chores Tracker (with Auth)", version="1.1", lifespan=lifespan)
 app.add_middleware(SimpleRateLimiterMiddleware)
+# снаружи лимитера: отказы 429 тоже попадают в гистограммы
+if os.getenv("METRICS", "1") == "1":
+    app.add_middleware(MetricsMiddleware)
+    checkout_observers.append(metrics.observe_checkout)
+metrics.register_stats("db_pool", pool_stats)
+metrics.register_stats("hashing", password_pool.stats)
+metrics.register_stats("response_cache", response_cache.stats)
+metrics.register_stats("events", event_hub.stats)
+
+
+# ---------------------------
+# ORM -> схемы ответа
+# ---------------------------
+# Списки сериализуются пачками: id связей подгружаются одним запросом на пачку,
+# а не ленивой загрузкой relationship на каждую строку (N+1). Строки идут сразу в
+# dict для app.serialization, без промежуточных моделей ответа.
+async def _user_rows(db: AsyncSession, users: Sequence) -> List[dict]:
+    group_ids = await group_ids_by_user(db, [u.id for u in users])
+    return [{"id": u.id, "name": u.name, "group_ids": group_ids[u.id]} for u in users]
+
+
+async def _group_rows(db: AsyncSession, groups: Sequence) -> List[dict]:
+    user_ids = await user_ids_by_group(db, [g.id for g in groups])
+    return [{"id": g.id, "name": g.name, "user_ids": user_ids[g.id]} for g in groups]
+
+
+async def _plain_rows(db: AsyncSession, rows: Sequence) -> List[dict]:
+    return row_dicts(rows)
+
+
+def _chore_read(c: ChoreModel) -> ChoreRead:
+    return ChoreRead(
+        id=c.id,
+        title=c.title,
+        description=c.description,
+        created_by_user_id=c.created_by_user_id,
+    )
+
+
+def _assignment_read(a: AssignmentModel) -> AssignmentRead:
+    return AssignmentRead(
+        id=a.id,
+        chore_id=a.chore_id,
+        group_id=a.group_id,
+        assigned_to_user_id=a.assigned_to_user_id,
+        assigned_by_user_id=a.assigned_by_user_id,
+        assigned_at=a.assigned_at,
+        due_date=a.due_date,
+        status=a.status,
+        completed_at=a.completed_at,
+        schedule_id=a.schedule_id,
+    )
 
 
 # ---------------------------
 # Эндпойнты авторизации / регистрации
 # ---------------------------
 @app.post("/auth/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register(payload: UserCreate, db: Session = Depends(get_db)):
+async def register(payload: UserCreate, db: AsyncSession = Depends(get_async_db)):
     # Проверим, нет ли уже пользователя с таким именем
-    existing = db.query(UserModel).filter(UserModel.name == payload.name).first()
+    existing = (
+        await db.execute(select(UserModel.id).where(UserModel.name == payload.name).limit(1))
+    ).first()
     if existing:
         raise HTTPException(status_code=400, detail="User with this name already exists")
-    hashed = get_password_hash(payload.password)
+    # bcrypt занимает CPU на сотни миллисекунд — уходит в ограниченный пул
+    hashed = await get_password_hash_async(payload.password)
     user = UserModel(name=payload.name, hashed_password=hashed)
     db.add(user)
-    db.commit()
-    db.refresh(user)
-    return UserRead(id=user.id, name=user.name, group_ids=[g.id for g in user.groups])
+    await commit_changes(db, [USERS])
+    # только что созданный пользователь ещё ни в одной группе
+    return UserRead(id=user.id, name=user.name, group_ids=[])
 
 
 @app.post("/auth/token", response_model=Token)
-def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)
 ):
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -64,20 +231,27 @@ def login_for_access_token(
 # Пользователи (чтение)
 # ---------------------------
 @app.get("/users/", response_model=List[UserRead])
-def list_users(db: Session = Depends(get_db)):
-    users = db.query(UserModel).order_by(UserModel.id).all()
-    result = []
-    for u in users:
-        result.append(UserRead(id=u.id, name=u.name, group_ids=[g.id for g in u.groups]))
-    return result
+async def list_users(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    q = select(UserModel.id, UserModel.name).order_by(UserModel.id)
+    if wants_ndjson(request):
+        return ndjson_response(keyset(q, UserModel.id, page), _user_rows, read_sessions(request))
+    etag = await check_not_modified(db, request, response, [USERS])
+
+    async def build():
+        return await _user_rows(db, await paginate(db, q, UserModel.id, page, response))
+
+    return await cached_json(request, response, etag, [USERS], build, asdict(page))
 
 
 @app.get("/users/me", response_model=UserRead)
-def read_own_profile(current_user: UserModel = Depends(get_current_user)):
+async def read_own_profile(current_user: CurrentUser = Depends(get_current_user)):
     return UserRead(
-        id=current_user.id,
-        name=current_user.name,
-        group_ids=[g.id for g in current_user.groups],
+        id=current_user.id, name=current_user.name, group_ids=list(current_user.group_ids)
     )
 
 
@@ -85,59 +259,119 @@ def read_own_profile(current_user: UserModel = Depends(get_current_user)):
 # Группы (создание защищено)
 # ---------------------------
 @app.post("/groups/", response_model=GroupRead, status_code=status.HTTP_201_CREATED)
-def create_group(
+async def create_group(
     payload: GroupCreate,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     g = GroupModel(name=payload.name)
     db.add(g)
-    db.commit()
-    db.refresh(g)
-    return GroupRead(id=g.id, name=g.name, user_ids=[u.id for u in g.users])
+    await db.flush()
+    created = GroupRead(id=g.id, name=g.name, user_ids=[])
+    await commit_changes(
+        db, [GROUPS], [Event(g.id, "group", g.id, "created", created.model_dump())]
+    )
+    return created
 
 
 @app.get("/groups/", response_model=List[GroupRead])
-def list_groups(db: Session = Depends(get_db)):
-    groups = db.query(GroupModel).order_by(GroupModel.id).all()
-    result = []
-    for g in groups:
-        result.append(GroupRead(id=g.id, name=g.name, user_ids=[u.id for u in g.users]))
-    return result
+async def list_groups(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    q = select(GroupModel.id, GroupModel.name).order_by(GroupModel.id)
+    if wants_ndjson(request):
+        return ndjson_response(keyset(q, GroupModel.id, page), _group_rows, read_sessions(request))
+    etag = await check_not_modified(db, request, response, [GROUPS])
+
+    async def build():
+        return await _group_rows(db, await paginate(db, q, GroupModel.id, page, response))
+
+    return await cached_json(request, response, etag, [GROUPS], build, asdict(page))
+
+
+@app.get("/groups/{group_id}/stats", response_model=GroupStats)
+async def read_group_stats(
+    group_id: int,
+    since: Optional[date] = Query(None, description="First UTC day of the window"),
+    until: Optional[date] = Query(None, description="Last UTC day of the window"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    # сводные таблицы: O(участников) (+ дни окна), без просмотра назначений
+    if await db.get(GroupModel, group_id) is None:
+        raise HTTPException(status_code=404, detail="Group not found")
+    stats = await group_member_stats(db, group_id, since, until)
+    # участники без назначений тоже попадают в таблицу лидеров
+    for user_id in (await user_ids_by_group(db, [group_id]))[group_id]:
+        stats.setdefault(user_id, {"pending": 0, "done": 0, "skipped": 0})
+    members = [
+        MemberStats(
+            user_id=user_id,
+            **c,
+            completion_rate=(
+                c["done"] / (c["done"] + c["skipped"]) if c["done"] + c["skipped"] else None
+            ),
+        )
+        for user_id, c in stats.items()
+    ]
+    members.sort(key=lambda m: (-m.done, m.user_id))
+    return GroupStats(group_id=group_id, since=since, until=until, members=members)
+
+
+@app.get("/groups/{group_id}/events", response_class=StreamingResponse)
+async def stream_group_events(group_id: int, db: AsyncSession = Depends(get_read_db)):
+    # Server-Sent Events вместо опроса GET /assignments/?group_id=...: события
+    # assignment.created / assignment.done / assignment.skipped после коммита.
+    # `reset` — буфер переполнен, список нужно перечитать и переподписаться.
+    if await db.get(GroupModel, group_id) is None:
+        raise HTTPException(status_code=404, detail="Group not found")
+    if event_hub.full:
+        raise HTTPException(status_code=503, detail="Too many event subscribers")
+    heartbeat = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+    return StreamingResponse(
+        event_hub.stream(group_id, heartbeat),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.post("/groups/{group_id}/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def add_user_to_group(
+async def add_user_to_group(
     group_id: int,
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    g = db.get(GroupModel, group_id)
-    u = db.get(UserModel, user_id)
+    g = await db.get(GroupModel, group_id)
+    u = await db.get(UserModel, user_id)
     if not g or not u:
         raise HTTPException(status_code=404, detail="Group or User not found")
-    if u in g.users:
+    if await is_member(db, group_id, user_id):
         return
-    g.users.append(u)
-    db.commit()
+    await add_member(db, group_id, user_id)
+    # состав группы виден и в GroupRead.user_ids, и в UserRead.group_ids
+    await commit_changes(db, [GROUPS, USERS], [membership_event("added", group_id, user_id)])
+    invalidate_cached_user(user_id)
     return
 
 
 @app.delete("/groups/{group_id}/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def remove_user_from_group(
+async def remove_user_from_group(
     group_id: int,
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    g = db.get(GroupModel, group_id)
-    u = db.get(UserModel, user_id)
+    g = await db.get(GroupModel, group_id)
+    u = await db.get(UserModel, user_id)
     if not g or not u:
         raise HTTPException(status_code=404, detail="Group or User not found")
-    if u in g.users:
-        g.users.remove(u)
-        db.commit()
+    if await is_member(db, group_id, user_id):
+        await remove_member(db, group_id, user_id)
+        await commit_changes(db, [GROUPS, USERS], [membership_event("removed", group_id, user_id)])
+        invalidate_cached_user(user_id)
     return
 
 
@@ -145,15 +379,15 @@ def remove_user_from_group(
 # Chores (создание защищено)
 # ---------------------------
 @app.post("/chores/", response_model=ChoreRead, status_code=status.HTTP_201_CREATED)
-def create_chore(
+async def create_chore(
     payload: ChoreCreate,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     # если клиент не передал created_by_user_id — используем текущего пользователя
     created_by = payload.created_by_user_id or current_user.id
     # проверим, что указанный creator существует
-    if created_by is not None and db.get(UserModel, created_by) is None:
+    if created_by is not None and await db.get(UserModel, created_by) is None:
         raise HTTPException(status_code=404, detail="Creator user not found")
     chore = ChoreModel(
         title=payload.title,
@@ -161,137 +395,368 @@ def create_chore(
         created_by_user_id=created_by,
     )
     db.add(chore)
-    db.commit()
-    db.refresh(chore)
-    return ChoreRead(
-        id=chore.id,
-        title=chore.title,
-        description=chore.description,
-        created_by_user_id=chore.created_by_user_id,
+    await db.flush()
+    created = _chore_read(chore)
+    await commit_changes(
+        db, [CHORES], [Event(None, "chore", created.id, "created", created.model_dump())]
     )
+    return created
+
+
+@app.post("/chores/batch", response_model=ChoreBatchRead)
+async def create_chores_batch(
+    payload: ChoreBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    # одна выборка на всех создателей, один executemany, одна транзакция
+    creators = [item.created_by_user_id or current_user.id for item in payload.items]
+    known_users = await existing_user_ids(db, creators)
+    results: List[Optional[ChoreBatchItem]] = [None] * len(payload.items)
+    rows, row_indexes = [], []
+    for index, (item, created_by) in enumerate(zip(payload.items, creators)):
+        if created_by not in known_users:
+            results[index] = ChoreBatchItem(index=index, status=404, error="Creator user not found")
+            continue
+        rows.append(
+            {"title": item.title, "description": item.description, "created_by_user_id": created_by}
+        )
+        row_indexes.append(index)
+    inserted = await insert_chores(db, rows)
+    await commit_changes(db, [CHORES] if inserted else [], chore_events("created", inserted))
+    for index, row in zip(row_indexes, inserted):
+        results[index] = ChoreBatchItem(index=index, status=201, chore=_chore_read(row))
+    return ChoreBatchRead(created=len(inserted), results=results)
 
 
 @app.get("/chores/", response_model=List[ChoreRead])
-def list_chores(db: Session = Depends(get_db)):
-    chores = db.query(ChoreModel).order_by(ChoreModel.id).all()
-    return [
-        ChoreRead(
-            id=c.id,
-            title=c.title,
-            description=c.description,
-            created_by_user_id=c.created_by_user_id,
+async def list_chores(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    q = select(*schema_columns(ChoreRead, ChoreModel.__table__)).order_by(ChoreModel.id)
+    if wants_ndjson(request):
+        return ndjson_response(keyset(q, ChoreModel.id, page), _plain_rows, read_sessions(request))
+    etag = await check_not_modified(db, request, response, [CHORES])
+
+    async def build():
+        return await _plain_rows(db, await paginate(db, q, ChoreModel.id, page, response))
+
+    return await cached_json(request, response, etag, [CHORES], build, asdict(page))
+
+
+# ---------------------------
+# Повторяющиеся дела (расписания)
+# ---------------------------
+@app.post(
+    "/chores/{chore_id}/schedules",
+    response_model=ScheduleRead,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_schedule(
+    chore_id: int,
+    payload: ScheduleCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    # назначения по расписанию создаёт генератор (app.recurring), не этот эндпойнт
+    if (
+        await db.get(ChoreModel, chore_id) is None
+        or await db.get(GroupModel, payload.group_id) is None
+    ):
+        raise HTTPException(status_code=404, detail="chore/group not found")
+    fixed = payload.assigned_to_user_id
+    if fixed is not None and not await is_member(db, payload.group_id, fixed):
+        raise HTTPException(
+            status_code=400,
+            detail="User to be assigned is not a member of the specified group",
         )
-        for c in chores
-    ]
+    assigned_by = payload.assigned_by_user_id or current_user.id
+    if await db.get(UserModel, assigned_by) is None:
+        raise HTTPException(status_code=404, detail="Assigned-by user not found")
+    schedule = ChoreScheduleModel(
+        chore_id=chore_id,
+        group_id=payload.group_id,
+        interval_days=payload.interval_days,
+        start_date=payload.start_date,
+        assigned_to_user_id=fixed,
+        assigned_by_user_id=assigned_by,
+    )
+    db.add(schedule)
+    await db.flush()
+    created = ScheduleRead.model_validate(schedule)
+    # у списка расписаний нет ETag-scope, поэтому только событие
+    await commit_changes(
+        db, [], [Event(created.group_id, "schedule", created.id, "created", created.model_dump())]
+    )
+    return created
+
+
+@app.get("/groups/{group_id}/schedules", response_model=List[ScheduleRead])
+async def list_group_schedules(group_id: int, db: AsyncSession = Depends(get_read_db)):
+    q = select(ChoreScheduleModel.__table__).where(ChoreScheduleModel.group_id == group_id)
+    rows = (await db.execute(q.order_by(ChoreScheduleModel.id))).all()
+    return Response(to_json(row_dicts(rows)), media_type="application/json")
 
 
 # ---------------------------
 # Assignments (создание защищено)
 # ---------------------------
+def _least_loaded(pending: Dict[int, int]) -> Optional[int]:
+    # при равенстве — меньший id: выбор детерминирован
+    return min(pending, key=lambda user_id: (pending[user_id], user_id), default=None)
+
+
 @app.post("/assignments/", response_model=AssignmentRead, status_code=status.HTTP_201_CREATED)
-def create_assignment(
+async def create_assignment(
     payload: AssignmentCreate,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    chore = db.get(ChoreModel, payload.chore_id)
-    group = db.get(GroupModel, payload.group_id)
-    to_user = db.get(UserModel, payload.assigned_to_user_id)
-    if not chore or not group or not to_user:
+    chore = await db.get(ChoreModel, payload.chore_id)
+    group = await db.get(GroupModel, payload.group_id)
+    to_user_id = payload.assigned_to_user_id
+    if to_user_id is None and chore and group:
+        # авто-режим: группа заблокирована до коммита, поэтому параллельные
+        # авто-назначения видят счётчики друг друга и не выбирают одного и того же
+        await lock_groups(db, [group.id])
+        to_user_id = _least_loaded((await pending_by_member(db, [group.id]))[group.id])
+        if to_user_id is None:
+            raise HTTPException(status_code=400, detail="Group has no members to assign")
+    elif not chore or not group or await db.get(UserModel, to_user_id) is None:
         raise HTTPException(status_code=404, detail="chore/group/user not found")
-
     # Проверка: назначаемый должен быть в группе
-    if to_user not in group.users:
+    elif not await is_member(db, group.id, to_user_id):
         raise HTTPException(
             status_code=400,
             detail="User to be assigned is not a member of the specified group",
         )
 
     assigned_by = payload.assigned_by_user_id or current_user.id
-    if db.get(UserModel, assigned_by) is None:
+    if await db.get(UserModel, assigned_by) is None:
         raise HTTPException(status_code=404, detail="Assigned-by user not found")
 
     assign = AssignmentModel(
         chore_id=payload.chore_id,
         group_id=payload.group_id,
-        assigned_to_user_id=payload.assigned_to_user_id,
+        assigned_to_user_id=to_user_id,
         assigned_by_user_id=assigned_by,
         due_date=payload.due_date,
     )
     db.add(assign)
-    db.commit()
-    db.refresh(assign)
-    return AssignmentRead(
-        id=assign.id,
-        chore_id=assign.chore_id,
-        group_id=assign.group_id,
-        assigned_to_user_id=assign.assigned_to_user_id,
-        assigned_by_user_id=assign.assigned_by_user_id,
-        assigned_at=assign.assigned_at,
-        due_date=assign.due_date,
-        status=assign.status,
-        completed_at=assign.completed_at,
+    await db.flush()
+    created = _assignment_read(assign)
+    await record_assignments_created(db, [assign])
+    await commit_changes(
+        db,
+        [ASSIGNMENTS, group_assignments(payload.group_id)],
+        [Event(created.group_id, "assignment", created.id, "created", created.model_dump())],
+    )
+    return created
+
+
+@app.post("/assignments/batch", response_model=AssignmentBatchRead)
+async def create_assignments_batch(
+    payload: AssignmentBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    # Те же проверки, что в create_assignment, но множествами: по запросу на каждую
+    # сущность и на членства, затем один executemany в одной транзакции.
+    items = payload.items
+    assigners = [item.assigned_by_user_id or current_user.id for item in items]
+    known_chores = await existing_chore_ids(db, (i.chore_id for i in items))
+    known_groups = await existing_group_ids(db, (i.group_id for i in items))
+    explicit = [i for i in items if i.assigned_to_user_id is not None]
+    known_users = await existing_user_ids(db, [i.assigned_to_user_id for i in explicit] + assigners)
+    members = await existing_memberships(
+        db, ((i.group_id, i.assigned_to_user_id) for i in explicit)
     )
+    # авто-назначения: одна блокировка и одна выборка счётчиков на все группы пакета,
+    # дальше нагрузка досчитывается локально по мере распределения
+    auto_groups = {
+        i.group_id for i in items if i.assigned_to_user_id is None and i.group_id in known_groups
+    }
+    await lock_groups(db, auto_groups)
+    loads = await pending_by_member(db, auto_groups)
+
+    results: List[Optional[AssignmentBatchItem]] = [None] * len(items)
+    rows, row_indexes = [], []
+    for index, (item, assigned_by) in enumerate(zip(items, assigners)):
+        to_user_id = item.assigned_to_user_id
+        auto = to_user_id is None
+        if (
+            item.chore_id not in known_chores
+            or item.group_id not in known_groups
+            or (not auto and to_user_id not in known_users)
+        ):
+            status_code, error = 404, "chore/group/user not found"
+        elif auto and not loads[item.group_id]:
+            status_code, error = 400, "Group has no members to assign"
+        elif not auto and (item.group_id, to_user_id) not in members:
+            status_code, error = 400, "User to be assigned is not a member of the specified group"
+        elif assigned_by not in known_users:
+            status_code, error = 404, "Assigned-by user not found"
+        else:
+            if auto:
+                to_user_id = _least_loaded(loads[item.group_id])
+                loads[item.group_id][to_user_id] += 1
+            rows.append(
+                {
+                    "chore_id": item.chore_id,
+                    "group_id": item.group_id,
+                    "assigned_to_user_id": to_user_id,
+                    "assigned_by_user_id": assigned_by,
+                    "due_date": item.due_date,
+                }
+            )
+            row_indexes.append(index)
+            continue
+        results[index] = AssignmentBatchItem(index=index, status=status_code, error=error)
+
+    inserted = await insert_assignments(db, rows)
+    await record_assignments_created(db, inserted)
+    await commit_changes(db, assignment_scopes(inserted), assignment_events("created", inserted))
+    for index, row in zip(row_indexes, inserted):
+        results[index] = AssignmentBatchItem(
+            index=index, status=201, assignment=_assignment_read(row)
+        )
+    return AssignmentBatchRead(created=len(inserted), results=results)
 
 
 @app.get("/assignments/", response_model=List[AssignmentRead])
-def list_assignments(
+async def list_assignments(
+    request: Request,
+    response: Response,
     group_id: Optional[int] = None,
     user_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    q = db.query(AssignmentModel)
+    q = select(*schema_columns(AssignmentRead, AssignmentModel.__table__))
     if group_id is not None:
-        q = q.filter(AssignmentModel.group_id == group_id)
+        q = q.where(AssignmentModel.group_id == group_id)
     if user_id is not None:
-        q = q.filter(AssignmentModel.assigned_to_user_id == user_id)
-    assignments = q.order_by(AssignmentModel.id).all()
-    return [
-        AssignmentRead(
-            id=a.id,
-            chore_id=a.chore_id,
-            group_id=a.group_id,
-            assigned_to_user_id=a.assigned_to_user_id,
-            assigned_by_user_id=a.assigned_by_user_id,
-            assigned_at=a.assigned_at,
-            due_date=a.due_date,
-            status=a.status,
-            completed_at=a.completed_at,
+        q = q.where(AssignmentModel.assigned_to_user_id == user_id)
+    q = q.order_by(AssignmentModel.id)
+    if wants_ndjson(request):
+        return ndjson_response(
+            keyset(q, AssignmentModel.id, page), _plain_rows, read_sessions(request)
         )
-        for a in assignments
-    ]
+    # выборка по группе зависит только от своей группы; остальные — от общего счётчика
+    scope = ASSIGNMENTS if group_id is None else group_assignments(group_id)
+    etag = await check_not_modified(db, request, response, [scope])
+
+    async def build():
+        return row_dicts(await paginate(db, q, AssignmentModel.id, page, response))
+
+    params = {**asdict(page), "group_id": group_id, "user_id": user_id}
+    return await cached_json(request, response, etag, [scope], build, params)
+
+
+@app.get("/assignments/overdue", response_model=List[AssignmentRead])
+async def list_overdue_assignments(
+    group_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    as_of: Optional[date] = Query(None, description="Reference date, today (UTC) by default"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db),
+):
+    # диапазон по индексу (…, status, due_date): читаются только просроченные строки,
+    # самые давние первыми
+    as_of = as_of or utc_today()
+    q = select(*schema_columns(AssignmentRead, AssignmentModel.__table__)).where(
+        AssignmentModel.status == "pending", AssignmentModel.due_date < as_of
+    )
+    if group_id is not None:
+        q = q.where(AssignmentModel.group_id == group_id)
+    if user_id is not None:
+        q = q.where(AssignmentModel.assigned_to_user_id == user_id)
+    q = q.order_by(AssignmentModel.due_date, AssignmentModel.id).limit(limit)
+    rows = (await db.execute(q)).all()
+    return Response(to_json(row_dicts(rows)), media_type="application/json")
+
+
+async def _transition_assignments(
+    db: AsyncSession, ids: Sequence[int], new_status: str
+) -> AssignmentStatusResult:
+    # один UPDATE ... WHERE id IN (...) RETURNING вместо загрузки каждой строки;
+    # прежние статусы читаются под блокировкой записи заранее — по ним сдвигаются
+    # счётчики, и параллельный переход не применит ту же дельту второй раз
+    completed_at = datetime.utcnow()
+    before = await lock_assignments(db, ids)
+    rows = await set_assignments_status(db, ids, new_status, completed_at=completed_at)
+    await record_assignments_transition(db, before, new_status, completed_at)
+    await commit_changes(db, assignment_scopes(rows), assignment_events(new_status, rows))
+    updated = {row.id for row in rows}
+    return AssignmentStatusResult(updated=sorted(updated), not_found=sorted(set(ids) - updated))
+
+
+@app.post("/assignments/status", response_model=AssignmentStatusResult)
+async def set_assignments_status_bulk(
+    payload: AssignmentStatusUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    return await _transition_assignments(db, payload.ids, payload.status)
 
 
 @app.post("/assignments/{assignment_id}/done", status_code=status.HTTP_204_NO_CONTENT)
-def mark_assignment_done(
+async def mark_assignment_done(
     assignment_id: int,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    a = db.get(AssignmentModel, assignment_id)
-    if not a:
+    result = await _transition_assignments(db, [assignment_id], "done")
+    if result.not_found:
         raise HTTPException(status_code=404, detail="Assignment not found")
-    a.status = "done"
-    a.completed_at = datetime.utcnow()
-    db.commit()
     return
 
 
 @app.post("/assignments/{assignment_id}/skip", status_code=status.HTTP_204_NO_CONTENT)
-def mark_assignment_skipped(
+async def mark_assignment_skipped(
     assignment_id: int,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    a = db.get(AssignmentModel, assignment_id)
-    if not a:
+    result = await _transition_assignments(db, [assignment_id], "skipped")
+    if result.not_found:
         raise HTTPException(status_code=404, detail="Assignment not found")
-    a.status = "skipped"
-    a.completed_at = datetime.utcnow()
-    db.commit()
     return
 
 
+# ---------------------------
+# Инкрементальная синхронизация
+# ---------------------------
+@app.get("/changes", response_model=ChangesPage)
+async def list_changes(
+    since: int = Query(0, ge=0, description="Cursor from the previous page; 0 — from the start"),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    group_id: Optional[int] = Query(None, description="Only this group (and chores)"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    # догон за O(изменений): диапазон по первичному ключу журнала после курсора
+    compacted_through, head = await change_log_bounds(db)
+    if since < compacted_through:
+        # часть журнала после курсора выброшена: клиент перечитывает списки и
+        # продолжает с курсора из заголовка (взятого до перечитывания)
+        raise HTTPException(
+            status_code=410,
+            detail="Cursor is older than the change log, resync from the lists",
+            headers={"X-Change-Cursor": str(head)},
+        )
+    rows = await changes_since(db, since, group_id, limit + 1)
+    page = [{**row._asdict(), "data": orjson.loads(row.data)} for row in rows[:limit]]
+    body = {
+        "changes": page,
+        "cursor": page[-1]["id"] if page else since,
+        "has_more": len(rows) > limit,
+    }
+    return Response(to_json(body), media_type="application/json")
+
+
 # ---------------------------
 # Health / root
 # ---------------------------
@@ -303,3 +768,28 @@ def read_root():
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+
+@app.get("/health/hashing")
+def hashing_pool_stats():
+    return password_pool.stats()
+
+
+@app.get("/health/cache")
+def response_cache_stats():
+    return response_cache.stats()
+
+
+@app.get("/health/events")
+def event_hub_stats():
+    return event_hub.stats()
+
+
+@app.get("/health/replicas")
+def read_replica_stats():
+    return read_router.stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
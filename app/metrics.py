@@ -0,0 +1,182 @@
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+# ---------------------------
+# Метрики процесса в текстовом формате Prometheus (`GET /metrics`)
+# ---------------------------
+# Счётчики и гистограммы — обычные dict/list этого процесса (см. adapters/cache.py),
+# запись — пара инкрементов. Каждый воркер отдаёт свои числа; сборщик опрашивает
+# воркеры как отдельные цели и суммирует сам.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (128, 1024, 8192, 65536, 524288, 4194304)
+CHECKOUT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED = "unmatched"
+METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts are stored per bucket and summed on render."""
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # последний — +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        # le в Prometheus включительный: value == bound попадает в этот bucket
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+
+def _labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    pairs = []
+    for name, value in zip(names, values):
+        text = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{text}"')
+    return ",".join(pairs)
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """Per-process registry of request, rate limiter and DB pool metrics.
+
+    Label values are bounded: routes are path templates, unknown methods collapse
+    into "OTHER".
+    """
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self.in_flight = 0
+        self.reset()
+
+    def reset(self) -> None:
+        # in_flight не трогаем: запросы, идущие прямо сейчас, его ещё уменьшат
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.sizes: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = {}
+        self.rate_limited: Dict[str, int] = {}
+        self.checkout: Dict[str, Histogram] = {}
+
+    def observe_request(
+        self, method: str, route: str, status: int, seconds: float, size: int
+    ) -> None:
+        key = (method if method in METHODS else "OTHER", route)
+        latency = self.latency.get(key)
+        if latency is None:
+            latency = self.latency[key] = Histogram(LATENCY_BUCKETS)
+            self.sizes[key] = Histogram(SIZE_BUCKETS)
+        latency.observe(seconds)
+        self.sizes[key].observe(size)
+        status_key = key + (status,)
+        self.responses[status_key] = self.responses.get(status_key, 0) + 1
+
+    def observe_rate_limited(self, limit_class: str) -> None:
+        self.rate_limited[limit_class] = self.rate_limited.get(limit_class, 0) + 1
+
+    def observe_checkout(self, pool: str, seconds: float) -> None:
+        histogram = self.checkout.get(pool)
+        if histogram is None:
+            histogram = self.checkout[pool] = Histogram(CHECKOUT_BUCKETS)
+        histogram.observe(seconds)
+
+    def register_stats(self, name: str, stats: Callable[[], Dict[str, Any]]) -> None:
+        """Expose the numeric values of a `stats()` dict as `app_<name>_<key>` gauges."""
+        self.stats[name] = stats
+
+    def render(self) -> str:
+        lines: List[str] = []
+        self._histograms(
+            lines,
+            "http_request_duration_seconds",
+            "Request latency by route template.",
+            ("method", "route"),
+            self.latency,
+        )
+        self._histograms(
+            lines,
+            "http_response_size_bytes",
+            "Response body size by route template.",
+            ("method", "route"),
+            self.sizes,
+        )
+        self._counters(
+            lines,
+            "http_responses_total",
+            "Responses by route template and status code.",
+            ("method", "route", "status"),
+            self.responses.items(),
+        )
+        lines.append("# HELP http_requests_in_flight Requests being handled by this process.")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        lines.append(f"http_requests_in_flight {self.in_flight}")
+        self._counters(
+            lines,
+            "rate_limited_requests_total",
+            "Requests rejected with 429 by the rate limiter.",
+            ("limit_class",),
+            [((name,), count) for name, count in self.rate_limited.items()],
+        )
+        self._histograms(
+            lines,
+            "db_pool_checkout_seconds",
+            "Wait for a pool connection when a session first needs one.",
+            ("pool",),
+            {(pool,): histogram for pool, histogram in self.checkout.items()},
+        )
+        for name, stats in self.stats.items():
+            for key, value in stats().items():
+                if isinstance(value, (int, float)):
+                    metric = f"app_{name}_{key}"
+                    lines.append(f"# TYPE {metric} gauge")
+                    lines.append(f"{metric} {_number(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _counters(
+        lines: List[str],
+        name: str,
+        doc: str,
+        label_names: Sequence[str],
+        items: Iterable[Tuple[Tuple[Any, ...], int]],
+    ) -> None:
+        lines.append(f"# HELP {name} {doc}")
+        lines.append(f"# TYPE {name} counter")
+        for labels, count in items:
+            lines.append(f"{name}{{{_labels(label_names, labels)}}} {count}")
+
+    @staticmethod
+    def _histograms(
+        lines: List[str],
+        name: str,
+        doc: str,
+        label_names: Sequence[str],
+        histograms: Dict[Tuple[Any, ...], Histogram],
+    ) -> None:
+        lines.append(f"# HELP {name} {doc}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in histograms.items():
+            base = _labels(label_names, labels)
+            total = 0
+            for bound, count in zip(histogram.bounds, histogram.counts):
+                total += count
+                lines.append(f'{name}_bucket{{{base},le="{_number(bound)}"}} {total}')
+            total += histogram.counts[-1]
+            lines.append(f'{name}_bucket{{{base},le="+Inf"}} {total}')
+            lines.append(f"{name}_sum{{{base}}} {_number(histogram.sum)}")
+            lines.append(f"{name}_count{{{base}}} {total}")
+
+
+metrics = Metrics()
@@ -0,0 +1,45 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import UNMATCHED, Metrics, metrics
+
+# Request instrumentation as a plain ASGI middleware: two clock reads, a wrapped `send`
+# and a few dict updates per request. Added last, so it is the outermost user middleware
+# and also times the requests the rate limiter turns away. The route label is the path
+# template the router matched (`/groups/{group_id}/assignments`), read from the scope
+# after the app ran; requests that matched no route are counted under "unmatched".
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, *, registry: Metrics = metrics) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        status = 500  # исключение до начала ответа ServerErrorMiddleware превратит в 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        registry.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            registry.in_flight -= 1
+            route = scope.get("route")
+            template = getattr(route, "path", None) or UNMATCHED
+            registry.observe_request(scope["method"], template, status, elapsed, size)
@@ -0,0 +1,440 @@
+import asyncio
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Protocol, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------
+# Бэкенды счётчиков для SimpleRateLimiterMiddleware
+# ---------------------------
+# The middleware only needs `await backend.hit(key, now) -> (allowed, retry_after)`.
+# InProcessBackend keeps exact counters per worker; SharedWindowBackend counts against a
+# CounterStore shared by all workers/replicas and pre-aggregates hits locally so the store
+# sees one batched round trip per flush instead of one per request.
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, now: float) -> Tuple[bool, int]: ...
+
+    def clear(self) -> None: ...
+
+
+def _window_estimate(previous: float, current: float, elapsed: float, window: float) -> float:
+    return previous * (1 - elapsed / window) + current
+
+
+class _Counter:
+    __slots__ = ("window_start", "previous", "current")
+
+    def __init__(self, window_start: float) -> None:
+        self.window_start = window_start
+        self.previous = 0
+        self.current = 0
+
+
+class SlidingWindowStore:
+    """Per-client counters for one (limit, window) pair.
+
+    The estimate is `previous * (1 - elapsed / window) + current`, which smooths the burst
+    a fixed window allows at its boundary while keeping O(1) state per client.
+    """
+
+    def __init__(self, limit: int, window: float, max_keys: int) -> None:
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._counters: "OrderedDict[str, _Counter]" = OrderedDict()
+        self._next_sweep = 0.0
+
+    def hit(self, key: str, now: float) -> Tuple[bool, int]:
+        """Count one request; return (allowed, retry_after_seconds)."""
+        if now >= self._next_sweep:
+            self.sweep(now)
+        window_start = now - (now % self.window)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = _Counter(window_start)
+            if len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+        else:
+            self._counters.move_to_end(key)
+            if counter.window_start != window_start:
+                adjacent = window_start - counter.window_start == self.window
+                counter.previous = counter.current if adjacent else 0
+                counter.current = 0
+                counter.window_start = window_start
+
+        elapsed = now - window_start
+        estimate = _window_estimate(counter.previous, counter.current, elapsed, self.window)
+        if estimate + 1 > self.limit:
+            return False, max(math.ceil(self.window - elapsed), 1)
+        counter.current += 1
+        return True, 0
+
+    def sweep(self, now: float) -> None:
+        """Drop clients idle for two windows: their counters would estimate to zero."""
+        horizon = now - (now % self.window) - self.window
+        stale = [k for k, c in self._counters.items() if c.window_start < horizon]
+        for key in stale:
+            del self._counters[key]
+        self._next_sweep = now + self.window
+
+    def clear(self) -> None:
+        self._counters.clear()
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class InProcessBackend:
+    """Exact per-worker counters (the limit effectively multiplies by the worker count)."""
+
+    def __init__(self, limit: int, window: float, max_keys: int) -> None:
+        self.store = SlidingWindowStore(limit, window, max_keys)
+
+    async def hit(self, key: str, now: float) -> Tuple[bool, int]:
+        return self.store.hit(key, now)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+
+# ---------------------------
+# Общие хранилища счётчиков
+# ---------------------------
+class CounterStore(Protocol):
+    async def incr_many(self, increments: Dict[str, int], ttl: float) -> Dict[str, int]:
+        """Atomically add each amount (0 just reads) and return the new totals."""
+        ...
+
+
+class KVPipeline(Protocol):
+    """Commands queued on a MULTI/EXEC pipeline; `execute` sends them in one round trip."""
+
+    def incrby(self, key: str, amount: int) -> Any: ...
+
+    def expire(self, key: str, seconds: int) -> Any: ...
+
+    async def execute(self) -> List[Any]: ...
+
+
+class KVClient(Protocol):
+    """The subset of a Redis-style client the KV store relies on."""
+
+    def pipeline(self, transaction: bool = True) -> KVPipeline: ...
+
+
+class _InMemoryPipeline:
+    def __init__(self, kv: "InMemoryKV") -> None:
+        self._kv = kv
+        self._commands: List[Tuple[Any, tuple]] = []
+
+    def incrby(self, key: str, amount: int) -> "_InMemoryPipeline":
+        self._commands.append((self._kv._incrby, (key, amount)))
+        return self
+
+    def expire(self, key: str, seconds: int) -> "_InMemoryPipeline":
+        self._commands.append((self._kv._expire, (key, seconds)))
+        return self
+
+    async def execute(self) -> List[Any]:
+        # без await между командами: пачка применяется целиком, как MULTI/EXEC
+        self._kv.round_trips += 1
+        results = [command(*args) for command, args in self._commands]
+        self._commands = []
+        return results
+
+
+class InMemoryKV:
+    """Local stand-in for a network KV server (tests, single-process dev runs)."""
+
+    def __init__(self, clock=time.time) -> None:
+        self._clock = clock
+        self._data: Dict[str, Tuple[int, float]] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> _InMemoryPipeline:
+        return _InMemoryPipeline(self)
+
+    def _incrby(self, key: str, amount: int) -> int:
+        value, expires_at = self._data.get(key, (0, math.inf))
+        if expires_at <= self._clock():
+            value, expires_at = 0, math.inf
+        self._data[key] = (value + amount, expires_at)
+        return value + amount
+
+    def _expire(self, key: str, seconds: int) -> bool:
+        if key not in self._data:
+            return False
+        self._data[key] = (self._data[key][0], self._clock() + seconds)
+        return True
+
+
+class KVCounterStore:
+    """Counters in a network KV (Redis protocol).
+
+    A batch is one MULTI/EXEC pipeline of INCRBY + EXPIRE per key: a single round trip,
+    and no key is left without a TTL if the connection drops halfway.
+    """
+
+    def __init__(self, client: KVClient) -> None:
+        self.client = client
+
+    async def incr_many(self, increments: Dict[str, int], ttl: float) -> Dict[str, int]:
+        pipe = self.client.pipeline(transaction=True)
+        seconds = math.ceil(ttl)
+        for key, amount in increments.items():
+            pipe.incrby(key, amount)
+            pipe.expire(key, seconds)
+        results = await pipe.execute()
+        # ответы идут парами (INCRBY, EXPIRE) в порядке ключей
+        return dict(zip(increments, results[::2]))
+
+
+class SQLiteCounterStore:
+    """Counters in a SQLite file shared by the workers of one host.
+
+    Put the file on tmpfs (e.g. /dev/shm) to keep it in shared memory. A whole batch is
+    applied in one BEGIN IMMEDIATE transaction; calls run in a thread to keep file I/O
+    off the event loop.
+    """
+
+    _PURGE_EVERY = 100
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._flushes = 0
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=2000")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_counters ("
+            "key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    async def incr_many(self, increments: Dict[str, int], ttl: float) -> Dict[str, int]:
+        return await asyncio.to_thread(self._incr_many, increments, ttl)
+
+    def _incr_many(self, increments: Dict[str, int], ttl: float) -> Dict[str, int]:
+        now = time.time()
+        totals = {}
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for key, amount in increments.items():
+                    totals[key] = self._conn.execute(
+                        "INSERT INTO rate_limit_counters (key, value, expires_at) "
+                        "VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                        "value = value + excluded.value, expires_at = excluded.expires_at "
+                        "RETURNING value",
+                        (key, amount, now + ttl),
+                    ).fetchone()[0]
+                self._flushes += 1
+                if self._flushes % self._PURGE_EVERY == 0:
+                    self._conn.execute(
+                        "DELETE FROM rate_limit_counters WHERE expires_at < ?", (now,)
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return totals
+
+
+# ---------------------------
+# Лимитер поверх общего хранилища
+# ---------------------------
+class _SharedCounter:
+    __slots__ = ("window_start", "previous", "current", "pending", "synced")
+
+    def __init__(self, window_start: float) -> None:
+        self.window_start = window_start
+        self.previous = 0  # global count of the previous window, as last seen
+        self.current = 0  # global count of this window, as last seen
+        self.pending = 0  # local hits not yet pushed to the store
+        self.synced = False
+
+
+class SharedWindowBackend:
+    """Sliding-window limiter whose counts are shared through a CounterStore.
+
+    Hits are counted locally and pushed in batches, either every `flush_interval` seconds
+    or after `flush_batch` hits, whichever comes first. Between flushes the estimate is
+    the last global count seen plus local pending hits, so the overshoot is bounded by
+    what other processes accept in one flush interval.
+    """
+
+    def __init__(
+        self,
+        store: CounterStore,
+        limit: int,
+        window: float,
+        max_keys: int,
+        *,
+        namespace: str = "rl",
+        flush_interval: float = 0.5,
+        flush_batch: int = 50,
+    ) -> None:
+        self.store = store
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self.namespace = namespace
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self._counters: "OrderedDict[str, _SharedCounter]" = OrderedDict()
+        # pending hits of windows a key has already rolled past (or of evicted keys)
+        self._outbox: Dict[Tuple[str, float], int] = defaultdict(int)
+        # keys with pending hits or an unsynced window: the only ones a flush visits
+        self._dirty: Set[str] = set()
+        self._unflushed = 0
+        self._last_flush = 0.0
+        self._flushing = False
+        self.flushes = 0
+
+    def _store_key(self, key: str, window_start: float) -> str:
+        return f"{self.namespace}:{int(window_start)}:{key}"
+
+    async def hit(self, key: str, now: float) -> Tuple[bool, int]:
+        window_start = now - (now % self.window)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = _SharedCounter(window_start)
+            self._dirty.add(key)
+            if len(self._counters) > self.max_keys:
+                old_key, old = self._counters.popitem(last=False)
+                self._dirty.discard(old_key)
+                if old.pending:
+                    self._outbox[(old_key, old.window_start)] += old.pending
+        else:
+            self._counters.move_to_end(key)
+            if counter.window_start != window_start:
+                if counter.pending:
+                    self._outbox[(key, counter.window_start)] += counter.pending
+                adjacent = window_start - counter.window_start == self.window
+                counter.previous = counter.current + counter.pending if adjacent else 0
+                counter.current = counter.pending = 0
+                counter.window_start = window_start
+                counter.synced = False
+                self._dirty.add(key)
+
+        elapsed = now - window_start
+        estimate = _window_estimate(
+            counter.previous, counter.current + counter.pending, elapsed, self.window
+        )
+        allowed = estimate + 1 <= self.limit
+        if allowed:
+            counter.pending += 1
+            self._unflushed += 1
+            self._dirty.add(key)
+        if self._unflushed >= self.flush_batch or now - self._last_flush >= self.flush_interval:
+            await self.flush(now)
+        if allowed:
+            return True, 0
+        return False, max(math.ceil(self.window - elapsed), 1)
+
+    async def flush(self, now: Optional[float] = None) -> None:
+        if self._flushing:
+            return
+        self._flushing = True
+        now = time.time() if now is None else now
+        batch: Dict[Tuple[str, float], int] = dict(self._outbox)
+        self._outbox.clear()
+        # counters whose current-window total should be refreshed from the result
+        slots: Dict[Tuple[str, float], _SharedCounter] = {}
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty:
+            counter = self._counters.get(key)
+            if counter is None:
+                continue
+            slot = (key, counter.window_start)
+            batch[slot] = batch.get(slot, 0) + counter.pending
+            counter.pending = 0
+            slots[slot] = counter
+            if not counter.synced:
+                # amount 0 only reads: the previous window's global total
+                batch.setdefault((key, counter.window_start - self.window), 0)
+        self._unflushed = 0
+        self._last_flush = now
+        try:
+            if not batch:
+                return
+            increments = {self._store_key(*slot): amount for slot, amount in batch.items()}
+            totals = await self.store.incr_many(increments, ttl=2 * self.window)
+        except Exception:
+            # fail open: the hits are retried with the next flush, requests keep flowing
+            logger.warning("rate limit flush failed", exc_info=True)
+            for slot, amount in batch.items():
+                if amount:
+                    self._outbox[slot] += amount
+            # их окна остаются несинхронизированными: перечитать при следующем flush
+            self._dirty.update(key for key, _ in slots)
+            self._trim_outbox(now)
+            return
+        finally:
+            self._flushing = False
+        self.flushes += 1
+        for (key, window_start), counter in slots.items():
+            if counter.window_start != window_start:
+                continue
+            counter.current = totals[self._store_key(key, window_start)]
+            if not counter.synced:
+                counter.previous = totals[self._store_key(key, window_start - self.window)]
+                counter.synced = True
+
+    def _trim_outbox(self, now: float) -> None:
+        """Bound the hits kept for retry while the store is unreachable.
+
+        Hits of a window that ended before the previous one no longer weigh in any
+        estimate (and its store key has expired), so they are dropped; beyond that at
+        most `max_keys` slots are kept, oldest first out.
+        """
+        horizon = now - (now % self.window) - self.window
+        lost = 0
+        for slot in [slot for slot in self._outbox if slot[1] < horizon]:
+            lost += self._outbox.pop(slot)
+        while len(self._outbox) > self.max_keys:
+            lost += self._outbox.pop(next(iter(self._outbox)))
+        if lost:
+            logger.warning("rate limit store unreachable, dropped %d unflushed hits", lost)
+
+    def clear(self) -> None:
+        self._counters.clear()
+        self._outbox.clear()
+        self._dirty.clear()
+        self._unflushed = 0
+
+
+def backend_from_env(name: str, limit: int, window: float, max_keys: int) -> RateLimitBackend:
+    """Build the backend selected by RATE_LIMIT_BACKEND (memory | sqlite | redis)."""
+    kind = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    if kind == "memory":
+        return InProcessBackend(limit, window, max_keys)
+    if kind == "sqlite":
+        store: CounterStore = SQLiteCounterStore(
+            os.getenv("RATE_LIMIT_SQLITE_PATH", "/tmp/chore-tracker-ratelimit.sqlite")
+        )
+    elif kind == "redis":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:  # optional dependency, only needed for this backend
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package") from exc
+        store = KVCounterStore(Redis.from_url(os.environ["RATE_LIMIT_REDIS_URL"]))
+    else:
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {kind}")
+    return SharedWindowBackend(
+        store,
+        limit,
+        window,
+        max_keys,
+        namespace=f"rl:{name}",
+        flush_interval=float(os.getenv("RATE_LIMIT_FLUSH_INTERVAL", "0.5")),
+        flush_batch=int(os.getenv("RATE_LIMIT_FLUSH_BATCH", "50")),
+    )
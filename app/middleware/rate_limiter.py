@@ -1,62 +1,92 @@
 import os
 import time
-from typing import Callable, Dict, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple
 
-from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.errors import make_problem_detail
+from app.metrics import metrics
+from app.middleware.rate_limit_backends import RateLimitBackend, backend_from_env
 
-# TODO: make changes to avoid plagiarism in rate_limiter
-# INFO: Copy Rights to @leonidlivshits
+# Sliding-window-counter limiter as a plain ASGI middleware (no BaseHTTPMiddleware task and
+# stream wrapping per request). Counting is delegated to a backend per limit class
+# (RATE_LIMIT_BACKEND): in-process by default, or shared between workers and replicas.
+# State is bounded: every limit class keeps at most `max_keys` clients locally.
 
+AUTH_PATHS = ("/auth/token", "/auth/register")
 
-class SimpleRateLimiterMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp, **kwargs) -> None:
-        super().__init__(app)
-        self._ensure_init()
 
-    def _ensure_init(self) -> None:
-        if getattr(self, "_initialized", False):
+@dataclass
+class LimitClass:
+    name: str
+    backend: RateLimitBackend
+    prefixes: Tuple[str, ...] = field(default_factory=tuple)
+
+
+class SimpleRateLimiterMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limit: Optional[int] = None,
+        window: Optional[float] = None,
+        auth_limit: Optional[int] = None,
+        auth_window: Optional[float] = None,
+        max_keys: Optional[int] = None,
+        backend_factory: Callable[..., RateLimitBackend] = backend_from_env,
+        # wall clock: shared backends align windows across processes
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.app = app
+        self.clock = clock
+        self.limit = limit or int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
+        self.window = window or float(os.getenv("RATE_LIMIT_WINDOW", "60"))
+        max_keys = max_keys or int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+        auth_limit = auth_limit or int(os.getenv("RATE_LIMIT_AUTH_REQUESTS", "10"))
+        auth_window = auth_window or float(os.getenv("RATE_LIMIT_AUTH_WINDOW", str(self.window)))
+        # первый класс, чей префикс совпал с путём, выигрывает; default — последний
+        self.classes = (
+            LimitClass(
+                "auth", backend_factory("auth", auth_limit, auth_window, max_keys), AUTH_PATHS
+            ),
+            LimitClass("default", backend_factory("default", self.limit, self.window, max_keys)),
+        )
+
+    def _classify(self, path: str) -> LimitClass:
+        for limit_class in self.classes:
+            if not limit_class.prefixes or path.startswith(limit_class.prefixes):
+                return limit_class
+        return self.classes[-1]
+
+    @staticmethod
+    def _get_client_key(scope: Scope) -> str:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit_class = self._classify(scope["path"])
+        key = self._get_client_key(scope)
+        allowed, retry_after = await limit_class.backend.hit(key, self.clock())
+        if allowed:
+            await self.app(scope, receive, send)
             return
-        self.limit = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
-        self.window = int(os.getenv("RATE_LIMIT_WINDOW", "60"))
-        self._store: Dict[str, Tuple[int, int]] = {}
-        self._initialized = True
-
-    def _get_client_key(self, request: Request) -> str:
-        xff = request.headers.get("x-forwarded-for")
-        if xff:
-            return xff.split(",")[0].strip()
-        client = request.client.host if request.client else "unknown"
-        return client
-
-    async def dispatch(self, request: Request, call_next: Callable):
-        self._ensure_init()
-
-        key = self._get_client_key(request)
-        now = int(time.time())
-
-        window_start, count = self._store.get(key, (now, 0))
-        if now - window_start >= self.window:
-            window_start, count = now, 0
-        count += 1
-        self._store[key] = (window_start, count)
-
-        if count > self.limit:
-            retry_after = self.window - (now - window_start)
-            if retry_after < 0:
-                retry_after = 0
-            detail = f"Too many requests, retry after {retry_after} seconds"
-            problem = make_problem_detail(status=429, title="TooManyRequests", detail=detail)
-            headers = {"Retry-After": str(retry_after)}
-            return JSONResponse(status_code=429, content=problem, headers=headers)
-
-        response = await call_next(request)
-        return response
+
+        metrics.observe_rate_limited(limit_class.name)
+        detail = f"Too many requests, retry after {retry_after} seconds"
+        problem = make_problem_detail(status=429, title="TooManyRequests", detail=detail)
+        headers = {"Retry-After": str(retry_after)}
+        response = JSONResponse(status_code=429, content=problem, headers=headers)
+        await response(scope, receive, send)
 
     def _reset(self) -> None:
-        self._ensure_init()
-        self._store.clear()
+        for limit_class in self.classes:
+            limit_class.backend.clear()
@@ -0,0 +1,111 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+from fastapi import HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.persistence import AsyncSessionLocal
+from app.serialization import to_json
+
+# ---------------------------
+# Keyset-пагинация по id и NDJSON-стриминг для list-эндпойнтов
+# ---------------------------
+MAX_PAGE_SIZE = 1000
+STREAM_CHUNK_SIZE = 500
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_CURSOR_PREFIX = "id:"
+
+
+@dataclass(frozen=True)
+class PageParams:
+    limit: Optional[int] = None
+    after: Optional[int] = None
+
+
+def encode_cursor(last_id: int) -> str:
+    raw = f"{_CURSOR_PREFIX}{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        if not raw.startswith(_CURSOR_PREFIX):
+            raise ValueError(raw)
+        return int(raw[len(_CURSOR_PREFIX) :])
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def page_params(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+) -> PageParams:
+    return PageParams(limit=limit, after=decode_cursor(after) if after else None)
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def keyset(stmt: Select, id_column, page: PageParams) -> Select:
+    """Apply `id > after` and the page size to a select already ordered by `id_column`."""
+    if page.after is not None:
+        stmt = stmt.where(id_column > page.after)
+    if page.limit is not None:
+        stmt = stmt.limit(page.limit)
+    return stmt
+
+
+async def paginate(
+    db: AsyncSession, stmt: Select, id_column, page: PageParams, response: Response
+) -> List[Any]:
+    """Fetch one page (one extra row to detect the next one) and set X-Next-Cursor."""
+    if page.limit is None:
+        return (await db.execute(keyset(stmt, id_column, page))).all()
+    extra = PageParams(limit=page.limit + 1, after=page.after)
+    rows = (await db.execute(keyset(stmt, id_column, extra))).all()
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].id)
+    return rows
+
+
+def ndjson_response(
+    stmt: Select,
+    serialize: Callable[[AsyncSession, Sequence[Any]], Awaitable[List[Dict[str, Any]]]],
+    sessions: Callable[[], AsyncContextManager[AsyncSession]] = AsyncSessionLocal,
+) -> StreamingResponse:
+    """Stream rows one JSON document per line.
+
+    The request-scoped session is closed before the body is sent, so the stream owns
+    its own session and reads through a server-side cursor (`AsyncSession.stream`),
+    keeping memory flat regardless of table size. Rows are handed to `serialize` in
+    chunks so related ids can be batch-loaded per chunk.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        async with sessions() as db:
+            result = await db.stream(stmt.execution_options(yield_per=STREAM_CHUNK_SIZE))
+            async for chunk in result.partitions():
+                items = await serialize(db, chunk)
+                yield b"".join(to_json(item) + b"\n" for item in items)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
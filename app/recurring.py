@@ -0,0 +1,117 @@
+"""Materialize assignments from recurring chore schedules.
+
+    python -m app.recurring [--as-of 2030-01-01] [--days 1] [--batch-size 5000]
+
+--as-of defaults to today in UTC, the calendar of every stored timestamp.
+
+The same generator runs inside the app as a periodic task (RECURRING_SCHEDULER=1,
+every RECURRING_INTERVAL_SECONDS). Re-running it, concurrently too, is safe: rows are
+inserted with ON CONFLICT DO NOTHING on (schedule_id, due_date), and only the rows that
+were actually created touch the stats counters and list versions.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from datetime import date, timedelta
+from typing import Optional
+
+from adapters.orm.chore_repository import insert_generated_assignments
+from adapters.orm.schedule_repository import members_of_groups, schedules_page
+from adapters.orm.stats_repository import record_assignments_created
+from adapters.persistence import AsyncSessionLocal, async_engine
+from app.changes import assignment_events, assignment_scopes, commit_changes
+from domain.clock import utc_today
+from domain.recurrence import occurrences, pick_assignee
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+async def generate_assignments(
+    as_of: Optional[date] = None, days: int = 1, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Create the occurrences due in [as_of, as_of + days) for every schedule.
+
+    Schedules are walked by id in batches; each batch costs one query for the
+    schedules, one for the members of their groups and one multi-row INSERT, and is
+    committed on its own so a large run never holds one long transaction.
+    Returns the number of assignments created.
+    """
+    as_of = as_of or utc_today()
+    window_end = as_of + timedelta(days=days)
+    created, after_id = 0, 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            schedules = await schedules_page(db, after_id, window_end, batch_size)
+            if not schedules:
+                break
+            after_id = schedules[-1].id
+            members = await members_of_groups(db, {s.group_id for s in schedules})
+            rows = []
+            for s in schedules:
+                for k, due in occurrences(s.start_date, s.interval_days, as_of, window_end):
+                    assignee = pick_assignee(members[s.group_id], k, s.assigned_to_user_id)
+                    if assignee is None:
+                        continue
+                    rows.append(
+                        {
+                            "chore_id": s.chore_id,
+                            "group_id": s.group_id,
+                            "assigned_to_user_id": assignee,
+                            "assigned_by_user_id": s.assigned_by_user_id,
+                            "due_date": due,
+                            "schedule_id": s.id,
+                        }
+                    )
+            inserted = await insert_generated_assignments(db, rows)
+            await record_assignments_created(db, inserted)
+            await commit_changes(
+                db,
+                assignment_scopes(inserted),
+                assignment_events("created", inserted),
+            )
+            created += len(inserted)
+    return created
+
+
+async def run_scheduler(interval: float, days: int) -> None:
+    """Generate every `interval` seconds until cancelled; failures are logged and retried."""
+    while True:
+        try:
+            created = await generate_assignments(days=days)
+            if created:
+                logger.info("recurring chores: %d assignments created", created)
+        except Exception:
+            logger.exception("recurring chores generation failed")
+        await asyncio.sleep(interval)
+
+
+def start_scheduler() -> Optional[asyncio.Task]:
+    if os.getenv("RECURRING_SCHEDULER", "1") != "1":
+        return None
+    interval = float(os.getenv("RECURRING_INTERVAL_SECONDS", "3600"))
+    days = int(os.getenv("RECURRING_HORIZON_DAYS", "1"))
+    return asyncio.create_task(run_scheduler(interval, days))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None)
+    parser.add_argument("--days", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    async def run() -> int:
+        try:
+            return await generate_assignments(args.as_of, args.days, args.batch_size)
+        finally:
+            await async_engine.dispose()
+
+    print(f"created {asyncio.run(run())} assignments")
+
+
+if __name__ == "__main__":
+    main()
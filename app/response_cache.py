@@ -0,0 +1,169 @@
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from fastapi import Request, Response
+
+from app.serialization import to_json
+
+# ---------------------------
+# Read-through кэш готовых JSON-ответов для горячих списков
+# ---------------------------
+# Запись хранит байты ответа вместе с ETag, под которым они посчитаны (app.etag).
+# ETag строится из версий в БД, поэтому запись, пережившая чужую запись в другом
+# воркере, просто не совпадёт по тегу и будет пересобрана. Записи этого процесса
+# вдобавок выкидываются сразу (`invalidate`), чтобы не держать мёртвые байты.
+
+# грубая цена записи сверх байтов: объекты записи, заголовков, узлы LRU и индекса
+ENTRY_OVERHEAD = 512
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    body: bytes
+    headers: Dict[str, str]
+    scopes: FrozenSet[str] = field(default_factory=frozenset)
+
+
+class ResponseCache:
+    """LRU of serialized responses bounded by entry count and by approximate memory.
+
+    The byte budget counts the key, body, ETag and headers of every entry plus a fixed
+    per-entry overhead (`entry_size`). An index from scope to keys keeps invalidation
+    proportional to the entries it drops.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int = 10_000) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._by_scope: Dict[str, Set[str]] = {}
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        return cls(
+            max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+            max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000")),
+        )
+
+    @staticmethod
+    def entry_size(key: str, entry: CachedResponse) -> int:
+        headers = sum(len(name) + len(value) for name, value in entry.headers.items())
+        return ENTRY_OVERHEAD + len(key) + len(entry.body) + len(entry.etag) + headers
+
+    def get(self, key: str, etag: str) -> Optional[CachedResponse]:
+        entry = self._data.get(key)
+        if entry is None or entry.etag != etag:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self._discard(key)
+        size = self.entry_size(key, entry)
+        if size > self.max_bytes or self.max_entries < 1:
+            return
+        self._data[key] = entry
+        self._sizes[key] = size
+        self._size += size
+        for scope in entry.scopes:
+            self._by_scope.setdefault(scope, set()).add(key)
+        while self._size > self.max_bytes or len(self._data) > self.max_entries:
+            self._discard(next(iter(self._data)))
+            self.evictions += 1
+
+    def invalidate(self, scopes: Iterable[str]) -> None:
+        stale: Set[str] = set()
+        for scope in scopes:
+            stale |= self._by_scope.get(scope, set())
+        for key in stale:
+            self._discard(key)
+        self.invalidations += len(stale)
+
+    def _discard(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        self._size -= self._sizes.pop(key)
+        for scope in entry.scopes:
+            keys = self._by_scope[scope]
+            keys.discard(key)
+            if not keys:
+                del self._by_scope[scope]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._sizes.clear()
+        self._by_scope.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+response_cache = ResponseCache.from_env()
+
+
+def cache_key(path: str, params: Mapping[str, Any]) -> str:
+    """Key from the endpoint's own parsed parameters, in a fixed order.
+
+    Unknown query parameters, their order and spelling (`limit=05`) don't reach the
+    key, so they can't multiply entries for the same response.
+    """
+    query = "&".join(
+        f"{name}={value}" for name, value in sorted(params.items()) if value is not None
+    )
+    return f"{path}?{query}"
+
+
+async def cached_json(
+    request: Request,
+    response: Response,
+    etag: str,
+    scopes: Sequence[str],
+    build: Callable[[], Awaitable[Any]],
+    params: Mapping[str, Any],
+) -> Response:
+    """Serve the JSON of `build()` from the cache while `etag` is current.
+
+    `params` are the validated query parameters the response depends on. Headers set
+    on `response` while building (ETag, X-Next-Cursor) are stored with the body so a
+    hit reproduces the full response.
+    """
+    key = cache_key(request.url.path, params)
+    entry = response_cache.get(key, etag)
+    if entry is None:
+        body = to_json(await build())
+        entry = CachedResponse(etag, body, dict(response.headers), frozenset(scopes))
+        response_cache.set(key, entry)
+    return Response(entry.body, media_type="application/json", headers=entry.headers)
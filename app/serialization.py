@@ -0,0 +1,26 @@
+from typing import Any, Dict, List, Sequence, Type
+
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import Column, Table
+
+# ---------------------------
+# Быстрый путь сериализации списков: строки SQL -> dict -> JSON-байты
+# ---------------------------
+# List-эндпойнты не строят Pydantic-модели на каждую строку: выборка проецируется ровно
+# на поля схемы ответа, строка превращается в dict, а orjson пишет байты сам (включая
+# datetime/date в ISO 8601, как и Pydantic). response_model у эндпойнтов остаётся и
+# описывает ответ в OpenAPI; Response, возвращённый напрямую, FastAPI не перепроверяет.
+
+
+def schema_columns(schema: Type[BaseModel], table: Table) -> List[Column]:
+    """Columns of `table` named like the fields of `schema`, in field order."""
+    return [table.c[name] for name in schema.model_fields]
+
+
+def row_dicts(rows: Sequence[Any]) -> List[Dict[str, Any]]:
+    return [dict(row._mapping) for row in rows]
+
+
+def to_json(content: Any) -> bytes:
+    return orjson.dumps(content)
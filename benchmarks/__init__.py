@@ -0,0 +1 @@
+# Performance benchmarks; run modules directly, e.g. `python -m benchmarks.bench_rate_limiter`.
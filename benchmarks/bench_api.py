@@ -0,0 +1,514 @@
+"""Latency, throughput and memory of every API endpoint on a seeded dataset.
+
+    python -m benchmarks.bench_api [--driver inproc|uvicorn|both] [--concurrency 16]
+        [--requests 500] [--users 10000] [--groups 1000] [--assignments 1000000]
+        [--output bench_results.json] [--baseline baseline.json] [--threshold 0.25]
+
+The dataset is seeded once per size/seed into --dataset-dir (benchmarks.seed, in a
+subprocess) and copied for every driver, so each run starts from the same rows and
+write scenarios don't pile up between runs. Each scenario sends --requests requests
+(auth scenarios are capped, bcrypt dominates them) from --concurrency workers after a
+short warm-up; scenarios run one after another, reads first. Scenarios that close seeded
+pending assignments are shortened, or skipped, when the dataset has too few of them.
+
+Drivers: `inproc` calls the ASGI app through httpx.ASGITransport (lifespan included),
+so it measures the app without sockets; `uvicorn` starts `uvicorn app.main:app` in a
+subprocess and drives it over a real TCP socket. Peak RSS is the server's VmHWM (for
+inproc that includes the client).
+
+The report is JSON: p50/p95/p99/mean latency (ms), throughput (req/s) and error count
+per scenario, and peak RSS per driver. With --baseline the run fails (exit 1) when a
+scenario's p95 or the peak RSS grows, or its throughput drops, by more than
+--threshold relative to the baseline, or when it has more errors.
+`GET /groups/{id}/events` is a never-ending stream and is not driven.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+from domain.clock import utc_today
+
+AUTH_REQUESTS = 50
+SERVER_ENV = {
+    "DB_AUTO_MIGRATE": "0",
+    "RECURRING_SCHEDULER": "0",
+    "CHANGE_LOG_COMPACTOR": "0",
+    "RATE_LIMIT_REQUESTS": "1000000000",
+    "RATE_LIMIT_AUTH_REQUESTS": "1000000000",
+}
+
+
+@dataclass
+class Context:
+    """Ids the request factories draw from; one per driver run."""
+
+    users: int
+    groups: int
+    pending: List[int]
+    rnd: random.Random = field(default_factory=lambda: random.Random(7))
+    serial: Iterator[int] = field(default_factory=itertools.count)
+    memberships: List[tuple] = field(default_factory=list)
+
+    def group(self) -> int:
+        return self.rnd.randint(1, self.groups)
+
+    def member(self, group_id: int) -> int:
+        # участники группы g: g, g + groups, g + 2 * groups, ... (benchmarks.seed)
+        return group_id + self.groups * self.rnd.randrange(
+            (self.users - group_id) // self.groups + 1
+        )
+
+    def outsider(self) -> tuple:
+        # пара (группа, пользователь) не из посева: добавление и удаление не трогают
+        # участников, которых выдаёт member()
+        user_id = self.rnd.randint(1, self.users)
+        home = (user_id - 1) % self.groups
+        return (home + self.rnd.randint(1, self.groups - 1)) % self.groups + 1, user_id
+
+    def take_pending(self, n: int = 1) -> List[int]:
+        taken, self.pending = self.pending[:n], self.pending[n:]
+        return taken
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    request: Callable[[Context], Dict[str, Any]]  # kwargs for httpx: url, json, data, ...
+    auth: bool = False
+    max_requests: Optional[int] = None
+    takes_pending: int = 0  # сколько seeded pending-назначений расходует один запрос
+
+
+def _add_membership(ctx: Context) -> Dict[str, Any]:
+    # одна пара дважды в полёте — гонка двух INSERT за одну строку group_users
+    added = set(ctx.memberships)
+    pair = ctx.outsider()
+    for _ in range(100):
+        if pair not in added:
+            break
+        pair = ctx.outsider()
+    ctx.memberships.append(pair)
+    return {"url": f"/groups/{pair[0]}/users/{pair[1]}"}
+
+
+def _remove_membership(ctx: Context) -> Dict[str, Any]:
+    group_id, user_id = ctx.memberships.pop() if ctx.memberships else ctx.outsider()
+    return {"url": f"/groups/{group_id}/users/{user_id}"}
+
+
+def _assignment(ctx: Context, auto: bool = False) -> Dict[str, Any]:
+    group_id = ctx.group()
+    item = {"chore_id": ctx.rnd.randint(1, 100), "group_id": group_id}
+    if not auto:
+        item["assigned_to_user_id"] = ctx.member(group_id)
+    return item
+
+
+SCENARIOS = [
+    Scenario("health", "GET", lambda ctx: {"url": "/health"}),
+    Scenario("users.list", "GET", lambda ctx: {"url": "/users/", "params": {"limit": 100}}),
+    Scenario("users.me", "GET", lambda ctx: {"url": "/users/me"}, auth=True),
+    Scenario("groups.list", "GET", lambda ctx: {"url": "/groups/", "params": {"limit": 100}}),
+    Scenario("groups.stats", "GET", lambda ctx: {"url": f"/groups/{ctx.group()}/stats"}),
+    Scenario("groups.schedules", "GET", lambda ctx: {"url": f"/groups/{ctx.group()}/schedules"}),
+    Scenario("chores.list", "GET", lambda ctx: {"url": "/chores/", "params": {"limit": 100}}),
+    Scenario(
+        "assignments.list",
+        "GET",
+        lambda ctx: {"url": "/assignments/", "params": {"group_id": ctx.group(), "limit": 100}},
+    ),
+    Scenario(
+        "assignments.overdue",
+        "GET",
+        lambda ctx: {
+            "url": "/assignments/overdue",
+            "params": {"group_id": ctx.group(), "limit": 100},
+        },
+    ),
+    Scenario("changes", "GET", lambda ctx: {"url": "/changes", "params": {"limit": 100}}),
+    Scenario(
+        "chores.create",
+        "POST",
+        lambda ctx: {"url": "/chores/", "json": {"title": f"bench{next(ctx.serial)}"}},
+        auth=True,
+    ),
+    Scenario(
+        "chores.batch",
+        "POST",
+        lambda ctx: {"url": "/chores/batch", "json": {"items": [{"title": "bench"}] * 50}},
+        auth=True,
+    ),
+    Scenario(
+        "groups.create",
+        "POST",
+        lambda ctx: {"url": "/groups/", "json": {"name": f"bench{next(ctx.serial)}"}},
+        auth=True,
+    ),
+    Scenario("membership.add", "POST", _add_membership, auth=True),
+    Scenario("membership.remove", "DELETE", _remove_membership, auth=True),
+    Scenario(
+        "schedules.create",
+        "POST",
+        lambda ctx: {
+            "url": f"/chores/{ctx.rnd.randint(1, 100)}/schedules",
+            "json": {
+                "group_id": ctx.group(),
+                "frequency": "weekly",
+                "start_date": str(utc_today()),
+            },
+        },
+        auth=True,
+    ),
+    Scenario(
+        "assignments.create",
+        "POST",
+        lambda ctx: {"url": "/assignments/", "json": _assignment(ctx)},
+        auth=True,
+    ),
+    Scenario(
+        "assignments.create_auto",
+        "POST",
+        lambda ctx: {"url": "/assignments/", "json": _assignment(ctx, auto=True)},
+        auth=True,
+    ),
+    Scenario(
+        "assignments.batch",
+        "POST",
+        lambda ctx: {
+            "url": "/assignments/batch",
+            "json": {"items": [_assignment(ctx) for _ in range(50)]},
+        },
+        auth=True,
+    ),
+    Scenario(
+        "assignments.done",
+        "POST",
+        lambda ctx: {"url": f"/assignments/{ctx.take_pending()[0]}/done"},
+        auth=True,
+        takes_pending=1,
+    ),
+    Scenario(
+        "assignments.status",
+        "POST",
+        lambda ctx: {
+            "url": "/assignments/status",
+            "json": {"ids": ctx.take_pending(20), "status": "skipped"},
+        },
+        auth=True,
+        takes_pending=20,
+    ),
+    Scenario(
+        "auth.register",
+        "POST",
+        lambda ctx: {
+            "url": "/auth/register",
+            "json": {"name": f"bench{next(ctx.serial)}", "password": "bench"},
+        },
+        max_requests=AUTH_REQUESTS,
+    ),
+    Scenario(
+        "auth.token",
+        "POST",
+        lambda ctx: {"url": "/auth/token", "data": {"username": "user1", "password": "bench"}},
+        max_requests=AUTH_REQUESTS,
+    ),
+]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method="inclusive")[int(q) - 1]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    headers: Dict[str, str],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict[str, float]:
+    total = min(requests, scenario.max_requests or requests)
+    if scenario.takes_pending:
+        # на маленьком датасете pending-назначений может не хватить на весь прогон
+        available = len(ctx.pending) // scenario.takes_pending
+        warmup = min(warmup, available // 2)
+        total = min(total, available - warmup)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(record: bool) -> None:
+        nonlocal errors
+        kwargs = scenario.request(ctx)
+        start = time.perf_counter()
+        resp = await client.request(
+            scenario.method, **kwargs, headers=headers if scenario.auth else None
+        )
+        elapsed = time.perf_counter() - start
+        if record:
+            latencies.append(elapsed)
+            if resp.status_code >= 400:
+                errors += 1
+
+    for _ in range(min(warmup, total)):
+        await one(record=False)
+
+    remaining = itertools.count()
+
+    async def worker() -> None:
+        while next(remaining) < total:
+            await one(record=True)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    ms = [v * 1000 for v in latencies]
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / wall, 1),
+        "mean_ms": round(statistics.fmean(ms), 2),
+        "p50_ms": round(percentile(ms, 50), 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+    }
+
+
+def _peak_rss_mb(pid: str = "self") -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    if pid == "self":
+        import resource
+
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return None
+
+
+@asynccontextmanager
+async def inproc_client(concurrency: int) -> AsyncIterator[tuple]:
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client, lambda: _peak_rss_mb()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@asynccontextmanager
+async def uvicorn_client(concurrency: int) -> AsyncIterator[tuple]:
+    port = _free_port()
+    cmd = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)]
+    server = subprocess.Popen(cmd + ["--log-level", "warning"], env=dict(os.environ))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60
+        ) as client:
+            for _ in range(200):
+                try:
+                    await client.get("/health")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn did not start")
+            yield client, lambda: _peak_rss_mb(str(server.pid))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+DRIVERS = {"inproc": inproc_client, "uvicorn": uvicorn_client}
+
+
+async def run_driver(driver: str, args, ctx: Context) -> Dict[str, Any]:
+    scenarios = [s for s in SCENARIOS if not args.only or s.name in args.only]
+    results: Dict[str, Any] = {}
+    async with DRIVERS[driver](args.concurrency) as (client, peak_rss):
+        token = await client.post("/auth/token", data={"username": "user1", "password": "bench"})
+        headers = {"Authorization": f"Bearer {token.json()['access_token']}"}
+        for scenario in scenarios:
+            if scenario.takes_pending > len(ctx.pending):
+                print(
+                    f"{driver:<8} {scenario.name:<24} skipped: no pending assignments left",
+                    file=sys.stderr,
+                    flush=True,
+                )
+                continue
+            results[scenario.name] = await run_scenario(
+                client, scenario, ctx, headers, args.requests, args.concurrency, args.warmup
+            )
+            r = results[scenario.name]
+            print(
+                f"{driver:<8} {scenario.name:<24} {r['throughput_rps']:>9.1f} "
+                f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['errors']:>6}",
+                file=sys.stderr,
+                flush=True,
+            )
+        rss = peak_rss()
+    return {"peak_rss_mb": rss, "scenarios": results}
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Regressions of `report` against `baseline`, as readable lines."""
+    problems = []
+    for driver, current in report["drivers"].items():
+        base = baseline.get("drivers", {}).get(driver)
+        if base is None:
+            continue
+        rss, base_rss = current.get("peak_rss_mb"), base.get("peak_rss_mb")
+        if rss and base_rss and rss > base_rss * (1 + threshold):
+            problems.append(f"{driver}: peak RSS {base_rss} -> {rss} MB")
+        for name, r in current["scenarios"].items():
+            b = base["scenarios"].get(name)
+            if b is None:
+                continue
+            if r["p95_ms"] > b["p95_ms"] * (1 + threshold):
+                problems.append(f"{driver} {name}: p95 {b['p95_ms']} -> {r['p95_ms']} ms")
+            if r["throughput_rps"] < b["throughput_rps"] * (1 - threshold):
+                problems.append(
+                    f"{driver} {name}: throughput {b['throughput_rps']} -> {r['throughput_rps']}"
+                )
+            if r["errors"] > b["errors"]:
+                problems.append(f"{driver} {name}: errors {b['errors']} -> {r['errors']}")
+    return problems
+
+
+def prepare_dataset(args) -> Path:
+    name = f"bench-{args.users}-{args.groups}-{args.assignments}-{args.seed}.sqlite"
+    template = Path(args.dataset_dir) / name
+    if not template.exists():
+        template.parent.mkdir(parents=True, exist_ok=True)
+        partial = template.with_suffix(".partial")
+        partial.unlink(missing_ok=True)
+        cmd = [sys.executable, "-m", "benchmarks.seed", f"sqlite:///{partial}"]
+        cmd += ["--users", str(args.users), "--groups", str(args.groups)]
+        cmd += ["--assignments", str(args.assignments), "--seed", str(args.seed)]
+        subprocess.run(cmd, check=True)
+        partial.rename(template)
+    return template
+
+
+def _pending_ids(url: str, limit: int) -> List[int]:
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id FROM assignments WHERE status = 'pending' ORDER BY id LIMIT :n"),
+            {"n": limit},
+        )
+        ids = [row.id for row in rows]
+    engine.dispose()
+    return ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--driver", choices=["inproc", "uvicorn", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--groups", type=int, default=1_000)
+    parser.add_argument("--assignments", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dataset-dir", default="data/bench")
+    parser.add_argument("--only", type=lambda v: set(v.split(",")), default=None)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--driver-run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.groups < 2:
+        # membership-сценариям нужны пары вне посева, а в одной группе состоят все
+        parser.error("--groups must be at least 2")
+
+    if args.driver_run:
+        # один драйвер — один процесс: движки читают окружение при импорте,
+        # а пик RSS in-process не должен включать прошлые прогоны
+        url = os.environ["DATABASE_URL"]
+        needed = (args.requests + args.warmup) * sum(s.takes_pending for s in SCENARIOS)
+        ctx = Context(args.users, args.groups, _pending_ids(url, needed))
+        print(json.dumps(asyncio.run(run_driver(args.driver_run, args, ctx))))
+        return
+
+    template = prepare_dataset(args)
+    drivers = ["inproc", "uvicorn"] if args.driver == "both" else [args.driver]
+    report: Dict[str, Any] = {
+        "meta": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "dataset": {
+                "users": args.users,
+                "groups": args.groups,
+                "assignments": args.assignments,
+                "seed": args.seed,
+            },
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "drivers": {},
+    }
+    columns = ("req/s", "p50", "p95", "p99")
+    print(f"{'driver':<8} {'scenario':<24} " + " ".join(f"{c:>8}" for c in columns) + " errors")
+    for driver in drivers:
+        work = Path(tempfile.mkdtemp()) / "bench.sqlite"
+        shutil.copy(template, work)
+        env = {**os.environ, **SERVER_ENV, "DATABASE_URL": f"sqlite:///{work}"}
+        cmd = [sys.executable, "-m", "benchmarks.bench_api", "--driver-run", driver]
+        cmd += sys.argv[1:]
+        # строки таблицы идут в stderr по мере прогона, отчёт драйвера — последней строкой stdout
+        out = subprocess.run(cmd, env=env, check=True, stdout=subprocess.PIPE, text=True)
+        report["drivers"][driver] = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{driver:<8} peak RSS {report['drivers'][driver]['peak_rss_mb']} MB")
+        shutil.rmtree(work.parent, ignore_errors=True)
+
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"report written to {args.output}")
+    if args.baseline:
+        problems = compare(report, json.loads(Path(args.baseline).read_text()), args.threshold)
+        for line in problems:
+            print(f"REGRESSION {line}")
+        if problems:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Concurrent read/write throughput of the async engine under each pool/journal setting.
+
+    python -m benchmarks.bench_db_pool [--seconds 5] [--readers 16] [--writers 4]
+
+Every setting runs in a fresh subprocess (the engines read the environment at import)
+against a throwaway SQLite file seeded with 50 groups and 5000 assignments. Readers
+list one group's pending assignments, writers insert one assignment per transaction,
+the way the request path does. With DATABASE_URL pointing at PostgreSQL only the
+pool settings are compared, on that database.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SQLITE_SETTINGS = {
+    "rollback journal, FULL": {"SQLITE_JOURNAL_MODE": "DELETE", "SQLITE_SYNCHRONOUS": "FULL"},
+    "WAL, FULL": {"SQLITE_JOURNAL_MODE": "WAL", "SQLITE_SYNCHRONOUS": "FULL"},
+    "WAL, NORMAL (default)": {"SQLITE_JOURNAL_MODE": "WAL", "SQLITE_SYNCHRONOUS": "NORMAL"},
+}
+POOL_SETTINGS = {
+    "pool 5+10 (SQLAlchemy)": {},
+    "pool 20+0": {"DB_POOL_SIZE": "20", "DB_MAX_OVERFLOW": "0"},
+    "pool 20+0, pre-ping": {"DB_POOL_SIZE": "20", "DB_MAX_OVERFLOW": "0", "DB_POOL_PRE_PING": "1"},
+}
+GROUPS = 50
+
+
+def seed() -> None:
+    from sqlalchemy import insert
+
+    from adapters.migrate import upgrade_database
+    from adapters.orm.models import AssignmentModel, ChoreModel, GroupModel, UserModel
+    from adapters.persistence import engine
+
+    upgrade_database(engine)
+    with engine.begin() as conn:
+        if conn.execute(GroupModel.__table__.select().limit(1)).first():
+            return
+        conn.execute(insert(UserModel), [{"id": 1, "name": "u", "hashed_password": "x"}])
+        conn.execute(insert(ChoreModel), [{"id": 1, "title": "Trash"}])
+        conn.execute(insert(GroupModel), [{"id": g, "name": f"g{g}"} for g in range(1, GROUPS + 1)])
+        conn.execute(
+            insert(AssignmentModel),
+            [
+                {
+                    "chore_id": 1,
+                    "group_id": i % GROUPS + 1,
+                    "assigned_to_user_id": 1,
+                    "assigned_by_user_id": 1,
+                }
+                for i in range(5000)
+            ],
+        )
+
+
+async def load(seconds: float, readers: int, writers: int) -> dict:
+    from sqlalchemy import insert, select
+    from sqlalchemy.exc import OperationalError
+
+    from adapters.orm.models import AssignmentModel
+    from adapters.persistence import AsyncSessionLocal, async_engine
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    deadline = time.perf_counter() + seconds
+
+    async def reader() -> None:
+        while time.perf_counter() < deadline:
+            q = select(AssignmentModel.__table__).where(
+                AssignmentModel.group_id == random.randint(1, GROUPS),
+                AssignmentModel.status == "pending",
+            )
+            async with AsyncSessionLocal() as db:
+                (await db.execute(q.limit(100))).all()
+            counts["reads"] += 1
+
+    async def writer() -> None:
+        row = {"chore_id": 1, "assigned_to_user_id": 1, "assigned_by_user_id": 1}
+        while time.perf_counter() < deadline:
+            try:
+                async with AsyncSessionLocal() as db:
+                    group_id = random.randint(1, GROUPS)
+                    await db.execute(insert(AssignmentModel), [{**row, "group_id": group_id}])
+                    await db.commit()
+                counts["writes"] += 1
+            except OperationalError:  # database is locked: busy_timeout истёк
+                counts["errors"] += 1
+
+    try:
+        await asyncio.gather(
+            *[reader() for _ in range(readers)], *[writer() for _ in range(writers)]
+        )
+    finally:
+        await async_engine.dispose()
+    return {key: value / seconds for key, value in counts.items()}
+
+
+def run_setting(env: dict, args) -> dict:
+    cmd = [sys.executable, "-m", "benchmarks.bench_db_pool", "--worker"]
+    cmd += ["--seconds", str(args.seconds), "--readers", str(args.readers)]
+    cmd += ["--writers", str(args.writers)]
+    out = subprocess.run(cmd, env={**os.environ, **env}, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        seed()
+        print(json.dumps(asyncio.run(load(args.seconds, args.readers, args.writers))))
+        return
+
+    url = os.getenv("DATABASE_URL", "")
+    base = {"DB_AUTO_MIGRATE": "0", "RECURRING_SCHEDULER": "0"}
+    if url.startswith("postgresql"):
+        settings = {name: {**base, **env} for name, env in POOL_SETTINGS.items()}
+    else:
+        settings = {}
+        for name, env in {**SQLITE_SETTINGS, **POOL_SETTINGS}.items():
+            # свежий файл на каждую настройку: режим журнала хранится в самой базе
+            path = Path(tempfile.mkdtemp()) / "pool.sqlite"
+            settings[name] = {**base, **env, "DATABASE_URL": f"sqlite:///{path}"}
+
+    print(f"{'setting':<26} {'reads/s':>9} {'writes/s':>9} {'errors/s':>9}")
+    for name, env in settings.items():
+        r = run_setting(env, args)
+        print(f"{name:<26} {r['reads']:>9.0f} {r['writes']:>9.0f} {r['errors']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
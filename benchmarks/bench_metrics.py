@@ -0,0 +1,85 @@
+"""Per-request overhead of the metrics middleware and the cost of a scrape.
+
+    python -m benchmarks.bench_metrics [--requests 50000] [--routes 50]
+
+Drives the ASGI callables directly (no sockets, no TestClient), like bench_rate_limiter:
+a bare endpoint, then the same endpoint behind MetricsMiddleware with requests spread
+over `--routes` route templates. The endpoint marks the matched route in the scope the
+way FastAPI's router does. Finally times `render()` of the registry that was filled.
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from starlette.responses import PlainTextResponse
+
+from app.metrics import Metrics
+from app.middleware.metrics import MetricsMiddleware
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = scope["bench_route"]
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+def _scope(route: SimpleNamespace) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+        "bench_route": route,
+    }
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    return None
+
+
+async def _run(app, requests: int, routes: int) -> float:
+    templates = [SimpleNamespace(path=f"/things{i}/{{thing_id}}") for i in range(routes)]
+    start = time.perf_counter()
+    for i in range(requests):
+        await app(_scope(templates[i % routes]), _receive, _send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--routes", type=int, default=50)
+    args = parser.parse_args()
+
+    registry = Metrics()
+    cases = [
+        ("bare endpoint", endpoint),
+        ("metrics middleware", MetricsMiddleware(endpoint, registry=registry)),
+    ]
+    baseline = None
+    for name, app in cases:
+        per_request = asyncio.run(_run(app, args.requests, args.routes))
+        baseline = per_request if baseline is None else baseline
+        print(f"{name:<45} {per_request:8.2f} us/request  (+{per_request - baseline:.2f} us)")
+
+    start = time.perf_counter()
+    text = registry.render()
+    elapsed = (time.perf_counter() - start) * 1e3
+    print(f"{'render /metrics':<45} {elapsed:8.2f} ms  ({len(text) // 1024} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Per-request overhead of the rate limiter middleware.
+
+    python -m benchmarks.bench_rate_limiter [--requests 50000]
+
+Drives the ASGI callables directly (no sockets, no TestClient) so the numbers reflect
+only the middleware layer: a bare endpoint, the same endpoint behind a BaseHTTPMiddleware
+pass-through (what the limiter used to be built on), and behind the ASGI limiter with one
+client and with a flood of distinct X-Forwarded-For values, and behind the shared-store
+backend (in-memory KV stand-in) with many idle clients, where a flush visits only the
+clients hit since the previous one.
+"""
+
+import argparse
+import asyncio
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+
+from app.middleware.rate_limit_backends import InMemoryKV, KVCounterStore, SharedWindowBackend
+from app.middleware.rate_limiter import SimpleRateLimiterMiddleware
+
+
+async def endpoint(scope, receive, send):
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+class PassThroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def _scope(client: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"x-forwarded-for", client.encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    return None
+
+
+async def _run(app, requests: int, distinct_clients: int) -> float:
+    scopes = [
+        _scope(f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}") for i in range(distinct_clients)
+    ]
+    start = time.perf_counter()
+    for i in range(requests):
+        await app(scopes[i % distinct_clients], _receive, _send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    args = parser.parse_args()
+
+    huge = 10**9
+
+    def shared(name, limit, window, max_keys):
+        return SharedWindowBackend(KVCounterStore(InMemoryKV()), limit, window, max_keys)
+
+    cases = [
+        ("bare endpoint", endpoint, 1),
+        ("BaseHTTPMiddleware pass-through", PassThroughMiddleware(endpoint), 1),
+        ("ASGI limiter, 1 client", SimpleRateLimiterMiddleware(endpoint, limit=huge), 1),
+        (
+            "ASGI limiter, distinct client per request",
+            SimpleRateLimiterMiddleware(endpoint, limit=huge, max_keys=10_000),
+            args.requests,
+        ),
+        (
+            "shared backend, 10k clients",
+            SimpleRateLimiterMiddleware(
+                endpoint, limit=huge, max_keys=10_000, backend_factory=shared
+            ),
+            10_000,
+        ),
+    ]
+    baseline = None
+    for name, app, clients in cases:
+        per_request = asyncio.run(_run(app, args.requests, clients))
+        baseline = per_request if baseline is None else baseline
+        print(f"{name:<45} {per_request:8.2f} us/request  (+{per_request - baseline:.2f} us)")
+
+
+if __name__ == "__main__":
+    main()
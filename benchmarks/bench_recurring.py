@@ -0,0 +1,78 @@
+"""Recurring-chore generation throughput on a seeded SQLite database.
+
+    python -m benchmarks.bench_recurring [--groups 100000]
+
+Seeds a throwaway database with N groups of two members, one daily rotating schedule
+per group, then times a first generation run (N inserts) and an idempotent re-run.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    path = Path(tempfile.mkdtemp()) / "recurring.sqlite"
+    # движок создаётся при импорте adapters.persistence — URL задаётся до него
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    from sqlalchemy import insert
+
+    from adapters.migrate import upgrade_database
+    from adapters.orm.models import ChoreModel, ChoreScheduleModel, GroupModel, UserModel
+    from adapters.persistence import async_engine, engine
+    from app.recurring import generate_assignments
+    from domain.db import group_users
+
+    upgrade_database(engine)
+    n = args.groups
+    with engine.begin() as conn:
+        conn.execute(
+            insert(UserModel),
+            [{"id": i, "name": f"u{i}", "hashed_password": "x"} for i in range(1, 2 * n + 1)],
+        )
+        conn.execute(insert(GroupModel), [{"id": g, "name": f"g{g}"} for g in range(1, n + 1)])
+        conn.execute(insert(ChoreModel), [{"id": 1, "title": "Trash"}])
+        conn.execute(
+            insert(group_users),
+            [{"group_id": g, "user_id": 2 * g - m} for g in range(1, n + 1) for m in (0, 1)],
+        )
+        conn.execute(
+            insert(ChoreScheduleModel),
+            [
+                {
+                    "chore_id": 1,
+                    "group_id": g,
+                    "interval_days": 1,
+                    "start_date": date(2030, 1, 1),
+                    "assigned_by_user_id": 2 * g,
+                }
+                for g in range(1, n + 1)
+            ],
+        )
+
+    async def run(label: str) -> None:
+        start = time.perf_counter()
+        created = await generate_assignments(date(2030, 1, 10), 1, args.batch_size)
+        print(f"{label:<10} {created:>8} created in {time.perf_counter() - start:6.2f} s")
+
+    async def scenario() -> None:
+        try:
+            await run("first run")
+            await run("re-run")
+        finally:
+            await async_engine.dispose()
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    main()
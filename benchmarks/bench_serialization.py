@@ -0,0 +1,90 @@
+"""Serialization cost of a large assignment list: response_model path vs. the orjson path.
+
+    python -m benchmarks.bench_serialization [--rows 10000] [--repeat 5]
+
+Rows come from a real SELECT on an in-memory SQLite table, so both paths start from the
+same SQLAlchemy `Row` objects the handlers see. The "response_model" path mirrors what
+FastAPI did before: one AssignmentRead per row built in the handler, dumped to dicts,
+re-validated against List[AssignmentRead], dumped in JSON mode and rendered with json.
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+
+from adapters.orm.models import AssignmentModel
+from adapters.persistence import Base
+from app.serialization import row_dicts, schema_columns, to_json
+from schemas.assignment import AssignmentRead
+
+
+def _rows(count: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime(2025, 1, 1, 12, 30, 15, 123456)
+    values = [
+        {
+            "chore_id": 1,
+            "group_id": i % 50,
+            "assigned_to_user_id": i % 200,
+            "assigned_by_user_id": 1,
+            "assigned_at": now + timedelta(minutes=i),
+            "due_date": date(2025, 2, 1) if i % 2 else None,
+            "status": "done" if i % 3 == 0 else "pending",
+            "completed_at": now if i % 3 == 0 else None,
+        }
+        for i in range(count)
+    ]
+    columns = schema_columns(AssignmentRead, AssignmentModel.__table__)
+    with engine.begin() as conn:
+        conn.execute(insert(AssignmentModel), values)
+        return conn.execute(select(*columns).order_by(AssignmentModel.id)).all()
+
+
+adapter = TypeAdapter(List[AssignmentRead])
+
+
+def response_model_path(rows) -> bytes:
+    models = [AssignmentRead.model_validate(row, from_attributes=True) for row in rows]
+    content = adapter.validate_python([m.model_dump() for m in models])
+    return JSONResponse(adapter.dump_python(content, mode="json")).body
+
+
+def orjson_path(rows) -> bytes:
+    return to_json(row_dicts(rows))
+
+
+def _best(fn, rows, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    baseline = None
+    for name, fn in (
+        ("response_model + json", response_model_path),
+        ("dict rows + orjson", orjson_path),
+    ):
+        elapsed = _best(fn, rows, args.repeat)
+        baseline = elapsed if baseline is None else baseline
+        size = len(fn(rows))
+        print(f"{name:<25} {elapsed:8.1f} ms  {baseline / elapsed:5.1f}x  ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
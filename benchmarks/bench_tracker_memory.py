@@ -0,0 +1,63 @@
+"""Bytes per assignment held by the Tracker's assignment store.
+
+    python -m benchmarks.bench_tracker_memory [--assignments 200000]
+
+Counts what tracemalloc attributes to filling a store, indexes included. "dict-backed
+objects" is the pre-__slots__ Assignment dataclass in the same store, i.e. what the
+Tracker used to hold; the columnar store keeps no per-assignment objects at all.
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Optional
+
+from domain.assigment import Assignment
+from domain.assignment_store import ColumnarAssignmentStore, ObjectAssignmentStore
+from domain.status import Status
+
+
+@dataclass
+class DictAssignment:
+    id: int
+    chore_id: int
+    group_id: int
+    assigned_to_user_id: int
+    assigned_by_user_id: int
+    assigned_at: datetime = field(default_factory=datetime.utcnow)
+    due_date: Optional[date] = None
+    status: Status = Status.PENDING
+    completed_at: Optional[datetime] = None
+
+
+def _bytes_per_assignment(store, cls, count: int) -> float:
+    due = date(2030, 1, 1)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(1, count + 1):
+        store.add(cls(i, 1, i % 100 + 1, i % 1000 + 1, 1, due_date=due))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assignments", type=int, default=200_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("dict-backed objects", ObjectAssignmentStore, DictAssignment),
+        ("__slots__ objects", ObjectAssignmentStore, Assignment),
+        ("columnar arrays", ColumnarAssignmentStore, Assignment),
+    ]
+    baseline = None
+    for name, store_cls, cls in cases:
+        per_item = _bytes_per_assignment(store_cls(), cls, args.assignments)
+        baseline = per_item if baseline is None else baseline
+        print(f"{name:<22} {per_item:8.1f} bytes/assignment  ({baseline / per_item:4.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Seed a database with a synthetic household dataset for the benchmarks.
+
+    python -m benchmarks.seed sqlite:///./data/bench.sqlite [--users 10000] [--groups 1000]
+        [--assignments 1000000] [--seed 42]
+
+The target is migrated to head first, then filled in batches of executemany INSERTs:
+users (one shared bcrypt hash, password "bench"), groups of users/groups members each,
+100 chores and assignments spread over the groups with a 30/60/10 pending/done/skipped
+mix and due dates around today. The summary tables are then rebuilt from the
+assignments with the same GROUP BY as migration 0005. The same --seed gives the
+same rows.
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.engine import Connection
+
+BATCH_SIZE = 20_000
+CHORES = 100
+PASSWORD = "bench"
+
+
+def _batches(rows: Iterable[dict], size: int = BATCH_SIZE) -> Iterator[List[dict]]:
+    batch: List[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(conn: Connection, table, rows: Iterable[dict]) -> None:
+    for batch in _batches(rows):
+        conn.execute(insert(table), batch)
+
+
+def _rebuild_stats(conn: Connection) -> None:
+    conn.execute(text("DELETE FROM member_stats"))
+    conn.execute(text("DELETE FROM member_daily_stats"))
+    conn.execute(
+        text(
+            """
+            INSERT INTO member_stats (group_id, user_id, pending, done, skipped)
+            SELECT group_id, assigned_to_user_id,
+                   SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END)
+            FROM assignments
+            GROUP BY group_id, assigned_to_user_id
+            """
+        )
+    )
+    day = "date(completed_at)" if conn.dialect.name == "sqlite" else "CAST(completed_at AS DATE)"
+    conn.execute(
+        text(
+            f"""
+            INSERT INTO member_daily_stats (group_id, day, user_id, done, skipped)
+            SELECT group_id, {day}, assigned_to_user_id,
+                   SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END)
+            FROM assignments
+            WHERE status IN ('done', 'skipped') AND completed_at IS NOT NULL
+            GROUP BY group_id, {day}, assigned_to_user_id
+            """
+        )
+    )
+
+
+def seed(url: str, users: int, groups: int, assignments: int, seed: int = 42) -> Dict[str, int]:
+    """Fill an empty database at `url`; returns the row counts written."""
+    from adapters.migrate import upgrade_database
+    from adapters.orm.models import AssignmentModel, ChoreModel, GroupModel, UserModel
+    from domain.auth import get_password_hash
+    from domain.db import group_users
+
+    rnd = random.Random(seed)
+    engine = create_engine(url)
+    upgrade_database(engine)
+    hashed = get_password_hash(PASSWORD)
+    now = datetime.utcnow()
+    today = now.date()
+    # участник i живёт в группе (i - 1) % groups + 1
+    members: Dict[int, List[int]] = {g: [] for g in range(1, groups + 1)}
+    for user_id in range(1, users + 1):
+        members[(user_id - 1) % groups + 1].append(user_id)
+
+    def assignment_rows() -> Iterator[dict]:
+        for i in range(assignments):
+            group_id = i % groups + 1
+            assignee = rnd.choice(members[group_id])
+            due = today + timedelta(days=rnd.randint(-365, 30))
+            roll = rnd.random()
+            status = "pending" if roll < 0.3 else "done" if roll < 0.9 else "skipped"
+            completed = None
+            if status != "pending":
+                completed = now - timedelta(days=rnd.randint(0, 365), seconds=rnd.randint(0, 86399))
+            yield {
+                "chore_id": rnd.randint(1, CHORES),
+                "group_id": group_id,
+                "assigned_to_user_id": assignee,
+                "assigned_by_user_id": assignee,
+                "assigned_at": now - timedelta(days=400),
+                "due_date": due,
+                "status": status,
+                "completed_at": completed,
+            }
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            # одноразовая база: скорость заливки важнее надёжности
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        _insert(
+            conn,
+            UserModel,
+            ({"id": i, "name": f"user{i}", "hashed_password": hashed} for i in range(1, users + 1)),
+        )
+        _insert(conn, GroupModel, ({"id": g, "name": f"group{g}"} for g in range(1, groups + 1)))
+        _insert(
+            conn,
+            group_users,
+            ({"group_id": g, "user_id": u} for g, ids in members.items() for u in ids),
+        )
+        _insert(conn, ChoreModel, ({"id": c, "title": f"chore{c}"} for c in range(1, CHORES + 1)))
+        _insert(conn, AssignmentModel, assignment_rows())
+        _rebuild_stats(conn)
+    engine.dispose()
+    return {"users": users, "groups": groups, "chores": CHORES, "assignments": assignments}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--groups", type=int, default=1_000)
+    parser.add_argument("--assignments", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    counts = seed(args.url, args.users, args.groups, args.assignments, args.seed)
+    print(f"seeded {counts} in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,11 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Optional
 
+from domain.clock import utc_today
 from domain.status import Status
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     id: int
     chore_id: int
@@ -28,9 +29,9 @@ class Assignment:
         self.status = Status.SKIPPED
         self.completed_at = datetime.utcnow()
 
-    def is_overdue(self) -> bool:
+    def is_overdue(self, as_of: Optional[date] = None) -> bool:
         if self.due_date and self.status == Status.PENDING:
-            return date.today() > self.due_date
+            return (as_of or utc_today()) > self.due_date
         return False
 
     def __repr__(self):
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Protocol, Sequence
+
+from domain.assigment import Assignment
+from domain.status import Status
+
+# Хранилища назначений для Tracker. Оба держат вторичные индексы по группе,
+# исполнителю и статусу и отдают одинаковые результаты; различаются ценой по памяти.
+
+
+class AssignmentStore(Protocol):
+    def __len__(self) -> int: ...
+
+    def add(self, a: Assignment) -> None: ...
+
+    def get(self, assignment_id: int) -> Optional[Assignment]: ...
+
+    def transition(self, assignment_id: int, method: str) -> bool:
+        """Apply `Assignment.<method>` (mark_done / mark_skipped) and reindex."""
+
+    def select(
+        self, group_id: Optional[int], user_id: Optional[int], status: Optional[Status]
+    ) -> List[Assignment]:
+        """Assignments matching every given filter, in id order."""
+
+
+class ObjectAssignmentStore:
+    """Assignments kept as (slotted) objects; the indexes map id -> the same object."""
+
+    def __init__(self) -> None:
+        self._items: Dict[int, Assignment] = {}
+        # dict, а не set: сохраняет порядок создания
+        self._by_group: Dict[int, Dict[int, Assignment]] = {}
+        self._by_user: Dict[int, Dict[int, Assignment]] = {}
+        self._by_status: Dict[Status, Dict[int, Assignment]] = {s: {} for s in Status}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, a: Assignment) -> None:
+        self._items[a.id] = a
+        self._by_group.setdefault(a.group_id, {})[a.id] = a
+        self._by_user.setdefault(a.assigned_to_user_id, {})[a.id] = a
+        self._by_status[a.status][a.id] = a
+
+    def get(self, assignment_id: int) -> Optional[Assignment]:
+        return self._items.get(assignment_id)
+
+    def transition(self, assignment_id: int, method: str) -> bool:
+        a = self._items.get(assignment_id)
+        if not a:
+            return False
+        del self._by_status[a.status][a.id]
+        getattr(a, method)()
+        self._by_status[a.status][a.id] = a
+        return True
+
+    def select(
+        self, group_id: Optional[int], user_id: Optional[int], status: Optional[Status]
+    ) -> List[Assignment]:
+        # перебираем самый узкий индекс и проверяем остальные по ключу: O(результата)
+        candidates: List[Dict[int, Assignment]] = [self._items]
+        if group_id is not None:
+            candidates.append(self._by_group.get(group_id, {}))
+        if user_id is not None:
+            candidates.append(self._by_user.get(user_id, {}))
+        if status is not None:
+            candidates.append(self._by_status[status])
+        smallest = min(candidates, key=len)
+        others = [c for c in candidates if c is not smallest and c is not self._items]
+        found = [a for a_id, a in smallest.items() if all(a_id in c for c in others)]
+        # индекс статуса переупорядочивается при переходах; уже упорядоченный вход
+        # Timsort проходит за один линейный проход
+        return sorted(found, key=lambda a: a.id)
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NONE = -(2**63)  # «нет значения» в целочисленных колонках
+_STATUSES: Sequence[Status] = tuple(Status)
+_STATUS_CODES = {s: code for code, s in enumerate(_STATUSES)}
+
+
+def _to_micros(value: Optional[datetime]) -> int:
+    return _NONE if value is None else (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> Optional[datetime]:
+    return None if value == _NONE else _EPOCH + value * _MICROSECOND
+
+
+class ColumnarAssignmentStore:
+    """Assignments packed into typed arrays, one column per field.
+
+    Ids are dense (the Tracker hands them out from 1), so row = id - 1 and no id
+    column or per-row object is kept: ~70 bytes per assignment with indexes instead
+    of a few hundred. `get`/`select` materialize `Assignment` snapshots; mutate through the
+    Tracker, not through the returned objects. Group/assignee indexes are id arrays
+    (appended in id order); the status filter scans the one-byte status column.
+    """
+
+    def __init__(self) -> None:
+        self._chore_id = array("q")
+        self._group_id = array("q")
+        self._to_user_id = array("q")
+        self._by_user_id = array("q")
+        self._assigned_at = array("q")  # микросекунды от эпохи, UTC
+        self._due_date = array("i")  # date.toordinal(), 0 — нет срока
+        self._completed_at = array("q")
+        self._status = bytearray()
+        self._by_group: Dict[int, array] = {}
+        self._by_user: Dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    def add(self, a: Assignment) -> None:
+        if a.id != len(self) + 1:
+            raise ValueError("ColumnarAssignmentStore needs dense ids starting at 1")
+        self._chore_id.append(a.chore_id)
+        self._group_id.append(a.group_id)
+        self._to_user_id.append(a.assigned_to_user_id)
+        self._by_user_id.append(a.assigned_by_user_id)
+        self._assigned_at.append(_to_micros(a.assigned_at))
+        self._due_date.append(a.due_date.toordinal() if a.due_date else 0)
+        self._completed_at.append(_to_micros(a.completed_at))
+        self._status.append(_STATUS_CODES[a.status])
+        self._by_group.setdefault(a.group_id, array("q")).append(a.id)
+        self._by_user.setdefault(a.assigned_to_user_id, array("q")).append(a.id)
+
+    def _row(self, row: int) -> Assignment:
+        due = self._due_date[row]
+        return Assignment(
+            id=row + 1,
+            chore_id=self._chore_id[row],
+            group_id=self._group_id[row],
+            assigned_to_user_id=self._to_user_id[row],
+            assigned_by_user_id=self._by_user_id[row],
+            assigned_at=_from_micros(self._assigned_at[row]),
+            due_date=date.fromordinal(due) if due else None,
+            status=_STATUSES[self._status[row]],
+            completed_at=_from_micros(self._completed_at[row]),
+        )
+
+    def get(self, assignment_id: int) -> Optional[Assignment]:
+        if not 0 < assignment_id <= len(self):
+            return None
+        return self._row(assignment_id - 1)
+
+    def transition(self, assignment_id: int, method: str) -> bool:
+        a = self.get(assignment_id)
+        if a is None:
+            return False
+        getattr(a, method)()
+        row = assignment_id - 1
+        self._status[row] = _STATUS_CODES[a.status]
+        self._completed_at[row] = _to_micros(a.completed_at)
+        return True
+
+    def _rows_with_status(self, status: Status) -> Iterator[int]:
+        code = bytes([_STATUS_CODES[status]])
+        row = self._status.find(code)
+        while row != -1:
+            yield row
+            row = self._status.find(code, row + 1)
+
+    def select(
+        self, group_id: Optional[int], user_id: Optional[int], status: Optional[Status]
+    ) -> List[Assignment]:
+        id_lists = []
+        if group_id is not None:
+            id_lists.append(self._by_group.get(group_id, array("q")))
+        if user_id is not None:
+            id_lists.append(self._by_user.get(user_id, array("q")))
+        if id_lists:
+            rows = (i - 1 for i in min(id_lists, key=len))
+        elif status is not None:
+            rows = self._rows_with_status(status)
+        else:
+            rows = iter(range(len(self)))
+        # остальные условия проверяются прямо по колонкам, O(1) на строку
+        code = None if status is None else _STATUS_CODES[status]
+        return [
+            self._row(row)
+            for row in rows
+            if (group_id is None or self._group_id[row] == group_id)
+            and (user_id is None or self._to_user_id[row] == user_id)
+            and (code is None or self._status[row] == code)
+        ]
@@ -1,12 +1,20 @@
+import hashlib
+import os
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from adapters.cache import TTLCache
 from adapters.orm.models import UserModel
-from adapters.persistence import get_db
+from adapters.orm.user_repository import group_ids_by_user
+from adapters.persistence import get_async_db
+from domain.hashing import HashingPoolBusy, password_pool
 from domain.jwt import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
@@ -17,6 +25,39 @@ from domain.jwt import (
 from schemas.token import TokenData
 
 
+@dataclass(frozen=True)
+class CurrentUser:
+    """Identity of the authenticated caller, cheap to cache between requests."""
+
+    id: int
+    name: str
+    group_ids: Tuple[int, ...] = ()
+
+
+# ---------------------------
+# Кэши проверенных токенов и текущих пользователей
+# ---------------------------
+# sha256(token) -> user_id; запись живёт не дольше exp токена
+_token_cache: TTLCache[bytes, int] = TTLCache(
+    maxsize=int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+)
+# user_id -> CurrentUser; короткий TTL, т.к. другие воркеры не видят нашу инвалидацию
+_user_cache: TTLCache[int, CurrentUser] = TTLCache(
+    maxsize=int(os.getenv("AUTH_USER_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("AUTH_USER_CACHE_TTL", "30")),
+)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop cached identity, e.g. after the user's group membership changed."""
+    _user_cache.pop(user_id)
+
+
+def clear_auth_caches() -> None:
+    _token_cache.clear()
+    _user_cache.clear()
+
+
 # ---------------------------
 # Утилиты для auth
 # ---------------------------
@@ -28,6 +69,25 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def _offload_hashing(fn, *args):
+    try:
+        return await password_pool.run(fn, *args)
+    except HashingPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, retry later",
+            headers={"Retry-After": "1"},
+        )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _offload_hashing(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _offload_hashing(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     now = datetime.utcnow()
@@ -40,37 +100,58 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-def get_user_by_id(db: Session, user_id: int) -> Optional[UserModel]:
-    return db.get(UserModel, user_id)
+async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[UserModel]:
+    return await db.get(UserModel, user_id)
 
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[UserModel]:
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[UserModel]:
     # В нашем простом примере username == name
-    user = db.query(UserModel).filter(UserModel.name == username).first()
+    user = (
+        await db.execute(select(UserModel).where(UserModel.name == username).limit(1))
+    ).scalar_one_or_none()
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
 
+def _verify_token(token: str) -> Optional[int]:
+    digest = hashlib.sha256(token.encode()).digest()
+    user_id = _token_cache.get(digest)
+    if user_id is not None:
+        return user_id
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        token_data = TokenData(user_id=payload.get("user_id"))
+    except JWTError:
+        return None
+    if token_data.user_id is None:
+        return None
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _token_cache.set(digest, token_data.user_id, ttl=exp - time.time())
+    return token_data.user_id
+
+
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-) -> UserModel:
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: Optional[int] = payload.get("user_id")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenData(user_id=user_id)
-    except JWTError:
+    user_id = _verify_token(token)
+    if user_id is None:
         raise credentials_exception
-    user = get_user_by_id(db, token_data.user_id)
+    current = _user_cache.get(user_id)
+    if current is not None:
+        return current
+    user = await get_user_by_id(db, user_id)
     if user is None:
         raise credentials_exception
-    return user
+    group_ids = await group_ids_by_user(db, [user.id])
+    current = CurrentUser(id=user.id, name=user.name, group_ids=tuple(group_ids[user.id]))
+    _user_cache.set(user_id, current)
+    return current
@@ -0,0 +1,6 @@
+from datetime import date, datetime
+
+
+def utc_today() -> date:
+    """Today's date in UTC, the calendar of the stored timestamps (`datetime.utcnow`)."""
+    return datetime.utcnow().date()
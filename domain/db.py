@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, Table
+from sqlalchemy import Column, ForeignKey, Index, Integer, Table
 
 from adapters.persistence import Base
 
@@ -15,4 +15,6 @@ group_users = Table(
         primary_key=True,
     ),
     Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # PK (group_id, user_id) не покрывает выборку групп пользователя
+    Index("ix_group_users_user_id", "user_id"),
 )
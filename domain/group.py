@@ -1,29 +1,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Set
 
 if TYPE_CHECKING:
     from domain.user import User
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     id: int
     name: str
     user_ids: List[int] = field(default_factory=list)
+    # множество-зеркало user_ids: проверка членства за O(1), порядок хранит список
+    _members: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._members = set(self.user_ids)
+
+    def has_user(self, user_id: int) -> bool:
+        return user_id in self._members
 
     def add_user(self, user: User):
-        if user.id not in self.user_ids:
+        if user.id not in self._members:
+            self._members.add(user.id)
             self.user_ids.append(user.id)
-            if self.id not in user.group_ids:
-                user.group_ids.append(self.id)
+            if not user.in_group(self.id):
+                user.join_group(self)
 
     def remove_user(self, user: User):
-        if user.id in self.user_ids:
+        if user.id in self._members:
+            self._members.discard(user.id)
             self.user_ids.remove(user.id)
-        if self.id in user.group_ids:
-            user.group_ids.remove(self.id)
+        if user.in_group(self.id):
+            user.leave_group(self)
 
     def __repr__(self):
         return f"Group(id={self.id}, name={self.name})"
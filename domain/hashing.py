@@ -0,0 +1,90 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# bcrypt отпускает GIL, поэтому потоков достаточно; процессы — если хеширование
+# всё же упирается в интерпретатор (например, другая схема в pwd_context).
+POOL_KINDS = ("thread", "process")
+
+
+class HashingPoolBusy(Exception):
+    """Raised instead of queueing when the hashing pool backlog is full."""
+
+
+class PasswordHashingPool:
+    """Bounded executor for bcrypt work on the request path.
+
+    `workers` calls run at once and at most `queue_size` more wait for a worker;
+    anything beyond that is rejected immediately, so a login storm turns into fast
+    503s instead of an unbounded backlog that starves the rest of the API.
+    Counters change in `run` around the executor call, never inside the worker.
+    """
+
+    def __init__(self, workers: int, queue_size: int, kind: str = "thread") -> None:
+        if kind not in POOL_KINDS:
+            raise ValueError(f"Unknown hashing pool kind: {kind}")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.kind = kind
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "PasswordHashingPool":
+        return cls(
+            workers=int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))),
+            queue_size=int(os.getenv("PASSWORD_HASH_QUEUE", "32")),
+            kind=os.getenv("PASSWORD_HASH_POOL", "thread"),
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.workers + self.queue_size:
+            self._rejected += 1
+            raise HashingPoolBusy()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), fn, *args)
+        except BaseException:
+            # ошибка в воркере или отмена запроса (клиент ушёл, shutdown)
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+        self._completed += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": min(self._pending, self.workers),
+            "queued": max(self._pending - self.workers, 0),
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        # executor is recreated lazily, so the pool survives app restarts in one process
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordHashingPool.from_env()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Iterator, Optional, Sequence, Tuple
+
+# Расписание повторяющегося дела: даты start + k * interval, k = 0, 1, ...
+# Номер вхождения k выбирает исполнителя при ротации, поэтому повторный запуск
+# генератора на том же окне даёт те же пары (дата, исполнитель).
+
+FREQUENCIES = {"daily": 1, "weekly": 7}
+
+
+def occurrences(
+    start: date, interval_days: int, window_start: date, window_end: date
+) -> Iterator[Tuple[int, date]]:
+    """(k, due date) of every occurrence in [window_start, window_end)."""
+    if interval_days < 1:
+        raise ValueError("interval_days must be positive")
+    k = max(0, -(-(window_start - start).days // interval_days))  # ceil
+    due = start + timedelta(days=k * interval_days)
+    step = timedelta(days=interval_days)
+    while due < window_end:
+        yield k, due
+        k += 1
+        due += step
+
+
+def pick_assignee(
+    members: Sequence[int], occurrence: int, fixed: Optional[int] = None
+) -> Optional[int]:
+    """Fixed assignee if still a member, else round-robin over sorted member ids."""
+    if fixed is not None:
+        return fixed if fixed in members else None
+    if not members:
+        return None
+    return members[occurrence % len(members)]
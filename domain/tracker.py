@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from domain.assigment import Assignment
+from domain.assignment_store import AssignmentStore, ColumnarAssignmentStore, ObjectAssignmentStore
 from domain.chore import Chore
+from domain.clock import utc_today
 from domain.group import Group
+from domain.status import Status
 from domain.user import User
 
 
@@ -15,12 +19,18 @@ class Tracker:
     В реальном приложении это мог бы быть слой доступа к БД.
     """
 
-    def __init__(self):
-
+    def __init__(self, columnar: bool = False):
+        # columnar=True — назначения в массивах по колонкам (миллионы строк в памяти),
+        # по умолчанию — объекты со __slots__
         self._users: Dict[int, User] = {}
         self._groups: Dict[int, Group] = {}
         self._chores: Dict[int, Chore] = {}
-        self._assignments: Dict[int, Assignment] = {}
+        self._assignments: AssignmentStore = (
+            ColumnarAssignmentStore() if columnar else ObjectAssignmentStore()
+        )
+        # незавершённые назначения со сроком, упорядоченные по (due_date, id):
+        # просроченные на дату — это префикс списка
+        self._pending_by_due: List[Tuple[date, int]] = []
         # простые счетчики id
         self._next_user_id = 1
         self._next_group_id = 1
@@ -55,6 +65,14 @@ class Tracker:
         group.add_user(user)
         return True
 
+    def remove_user_from_group(self, user_id: int, group_id: int) -> bool:
+        user = self.get_user(user_id)
+        group = self._groups.get(group_id)
+        if not user or not group:
+            return False
+        group.remove_user(user)
+        return True
+
     def list_groups(self) -> List[Group]:
         return list(self._groups.values())
 
@@ -91,7 +109,7 @@ class Tracker:
         by_user = self._users.get(by_user_id)
         if not all([chore, group, to_user, by_user]):
             return None
-        if to_user_id not in group.user_ids:
+        if not group.has_user(to_user_id):
             # нельзя назначить пользователю из другой группы
             return None
         assignment = Assignment(
@@ -102,26 +120,53 @@ class Tracker:
             assigned_by_user_id=by_user_id,
             due_date=due_date,
         )
-        self._assignments[assignment.id] = assignment
+        self._assignments.add(assignment)
+        if due_date is not None:
+            insort(self._pending_by_due, (due_date, assignment.id))
         self._next_assignment_id += 1
         return assignment
 
     def list_assignments(
-        self, group_id: Optional[int] = None, user_id: Optional[int] = None
+        self,
+        group_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        status: Optional[Status] = None,
     ) -> List[Assignment]:
-        results = list(self._assignments.values())
-        if group_id is not None:
-            results = [a for a in results if a.group_id == group_id]
-        if user_id is not None:
-            results = [a for a in results if a.assigned_to_user_id == user_id]
-        return results
+        return self._assignments.select(group_id, user_id, status)
 
-    def mark_assignment_done(self, assignment_id: int) -> bool:
+    def overdue_assignments(
+        self,
+        as_of: Optional[date] = None,
+        group_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+    ) -> List[Assignment]:
+        """Pending assignments due before `as_of` (today in UTC by default), oldest due first."""
+        as_of = as_of or utc_today()
+        end = bisect_left(self._pending_by_due, (as_of,))
+        overdue = (self._assignments.get(a_id) for _, a_id in self._pending_by_due[:end])
+        return [
+            a
+            for a in overdue
+            if (group_id is None or a.group_id == group_id)
+            and (user_id is None or a.assigned_to_user_id == user_id)
+        ]
+
+    def _transition(self, assignment_id: int, method: str) -> bool:
         a = self._assignments.get(assignment_id)
         if not a:
             return False
-        a.mark_done()
-        return True
+        if a.status == Status.PENDING and a.due_date is not None:
+            key = (a.due_date, a.id)
+            i = bisect_left(self._pending_by_due, key)
+            if i < len(self._pending_by_due) and self._pending_by_due[i] == key:
+                del self._pending_by_due[i]
+        return self._assignments.transition(assignment_id, method)
+
+    def mark_assignment_done(self, assignment_id: int) -> bool:
+        return self._transition(assignment_id, "mark_done")
+
+    def mark_assignment_skipped(self, assignment_id: int) -> bool:
+        return self._transition(assignment_id, "mark_skipped")
 
     def get_assignment(self, assignment_id: int) -> Optional[Assignment]:
         return self._assignments.get(assignment_id)
@@ -1,26 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Set
 
 if TYPE_CHECKING:
     from domain.group import Group
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: int
     name: str
     # Мы храним список групп (идентификаторов) у пользователя для быстрого доступа
     group_ids: List[int] = field(default_factory=list)
+    _groups: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._groups = set(self.group_ids)
+
+    def in_group(self, group_id: int) -> bool:
+        return group_id in self._groups
 
     def join_group(self, group: "Group"):
-        if group.id not in self.group_ids:
+        if group.id not in self._groups:
+            self._groups.add(group.id)
             self.group_ids.append(group.id)
             group.add_user(self)
 
     def leave_group(self, group: "Group"):
-        if group.id in self.group_ids:
+        if group.id in self._groups:
+            self._groups.discard(group.id)
             self.group_ids.remove(group.id)
             group.remove_user(self)
 
@@ -1,13 +1,16 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from schemas.chore import MAX_BATCH_SIZE
 
 
 class AssignmentCreate(BaseModel):
     chore_id: int
     group_id: int
-    assigned_to_user_id: int
+    # не указан — участник группы с наименьшим числом незавершённых назначений
+    assigned_to_user_id: Optional[int] = None
     # assigned_by_user_id опционально - подставим текущего пользователя
     assigned_by_user_id: Optional[int] = None
     due_date: Optional[date] = None
@@ -25,3 +28,31 @@ class AssignmentRead(BaseModel):
     due_date: Optional[date]
     status: str
     completed_at: Optional[datetime]
+    # задано для назначений, созданных по расписанию
+    schedule_id: Optional[int] = None
+
+
+class AssignmentBatchCreate(BaseModel):
+    items: List[AssignmentCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class AssignmentBatchItem(BaseModel):
+    index: int
+    status: int
+    assignment: Optional[AssignmentRead] = None
+    error: Optional[str] = None
+
+
+class AssignmentBatchRead(BaseModel):
+    created: int
+    results: List[AssignmentBatchItem]
+
+
+class AssignmentStatusUpdate(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+    status: Literal["done", "skipped"]
+
+
+class AssignmentStatusResult(BaseModel):
+    updated: List[int]
+    not_found: List[int]
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class ChangeRead(BaseModel):
+    id: int
+    group_id: Optional[int]
+    entity: str  # chore / assignment / membership
+    entity_id: int
+    op: str  # created / done / skipped / added / removed
+    # сущность целиком после изменения
+    data: Dict[str, Any]
+    changed_at: datetime
+
+
+class ChangesPage(BaseModel):
+    changes: List[ChangeRead]
+    # передаётся следующим `since`
+    cursor: int
+    has_more: bool
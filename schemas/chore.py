@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChoreCreate(BaseModel):
@@ -18,3 +18,23 @@ class ChoreRead(BaseModel):
     title: str
     description: Optional[str]
     created_by_user_id: Optional[int]
+
+
+# Пакетное создание: до MAX_BATCH_SIZE элементов за запрос, результат — по каждому элементу
+MAX_BATCH_SIZE = 1000
+
+
+class ChoreBatchCreate(BaseModel):
+    items: List[ChoreCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class ChoreBatchItem(BaseModel):
+    index: int
+    status: int
+    chore: Optional[ChoreRead] = None
+    error: Optional[str] = None
+
+
+class ChoreBatchRead(BaseModel):
+    created: int
+    results: List[ChoreBatchItem]
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -13,3 +14,19 @@ class GroupRead(BaseModel):
     id: int
     name: str
     user_ids: List[int] = Field(default_factory=list)
+
+
+class MemberStats(BaseModel):
+    user_id: int
+    pending: int
+    done: int
+    skipped: int
+    # done / (done + skipped); None, пока ничего не завершено
+    completion_rate: Optional[float]
+
+
+class GroupStats(BaseModel):
+    group_id: int
+    since: Optional[date] = None
+    until: Optional[date] = None
+    members: List[MemberStats]
@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from domain.recurrence import FREQUENCIES
+
+
+class ScheduleCreate(BaseModel):
+    group_id: int
+    # daily / weekly или every_n_days с interval_days
+    frequency: Literal["daily", "weekly", "every_n_days"] = "daily"
+    interval_days: Optional[int] = Field(None, ge=1, le=366)
+    start_date: date
+    # не указан — исполнители чередуются по участникам группы
+    assigned_to_user_id: Optional[int] = None
+    assigned_by_user_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _resolve_interval(self) -> "ScheduleCreate":
+        if self.frequency == "every_n_days":
+            if self.interval_days is None:
+                raise ValueError("interval_days is required for every_n_days")
+        else:
+            self.interval_days = FREQUENCIES[self.frequency]
+        return self
+
+
+class ScheduleRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    chore_id: int
+    group_id: int
+    interval_days: int
+    start_date: date
+    assigned_to_user_id: Optional[int]
+    assigned_by_user_id: int
@@ -1,15 +1,25 @@
 # File: `tests/conftest.py`
+import asyncio
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
+from sqlalchemy import event
 
 # Configure test database URL before importing the app/ORM
 ROOT = Path(__file__).resolve().parents[1]
 TEST_DB_PATH = ROOT / "data" / "test_db.sqlite"
 TEST_DB_PATH.parent.mkdir(exist_ok=True)
 os.environ.setdefault("TEST_DB_URL", f"sqlite:///{TEST_DB_PATH}")
+# the limiter state lives for the whole session; keep it out of the way of functional tests
+os.environ.setdefault("RATE_LIMIT_REQUESTS", "100000")
+os.environ.setdefault("RATE_LIMIT_AUTH_REQUESTS", "100000")
+# schema is rebuilt from metadata per test (see clean_db); migrations have their own tests
+os.environ.setdefault("DB_AUTO_MIGRATE", "0")
+os.environ.setdefault("RECURRING_SCHEDULER", "0")
+os.environ.setdefault("CHANGE_LOG_COMPACTOR", "0")
 
 # add repo root to sys.path before importing app
 if str(ROOT) not in sys.path:
@@ -17,8 +27,11 @@ if str(ROOT) not in sys.path:
 
 from starlette.testclient import TestClient  # noqa: E402
 
-from adapters.persistence import Base, engine  # noqa: E402
+from adapters.persistence import Base, async_engine, engine  # noqa: E402
 from app.main import app  # noqa: E402
+from app.metrics import metrics  # noqa: E402
+from app.response_cache import response_cache  # noqa: E402
+from domain.auth import clear_auth_caches  # noqa: E402
 
 
 @pytest.fixture(autouse=True)
@@ -26,6 +39,11 @@ def clean_db():
     """Recreate schema for each test to keep isolation."""
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    # ids are reused after the schema is recreated, so cached identities must go too
+    clear_auth_caches()
+    # version counters restart from zero too, so cached responses would match again
+    response_cache.clear()
+    metrics.reset()
     yield
 
 
@@ -33,3 +51,72 @@ def clean_db():
 def client():
     with TestClient(app) as c:
         yield c
+
+
+@pytest.fixture
+def run_async():
+    """`asyncio.run` for a coroutine that uses the async engine.
+
+    Pooled connections belong to the loop that opened them, so the engine is disposed
+    before that loop closes.
+    """
+
+    def _run(coro):
+        async def main():
+            try:
+                return await coro
+            finally:
+                await async_engine.dispose()
+
+        return asyncio.run(main())
+
+    return _run
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Bearer header of a freshly registered user "boss"."""
+    client.post("/auth/register", json={"name": "boss", "password": "pwd"})
+    token = client.post("/auth/token", data={"username": "boss", "password": "pwd"})
+    return {"Authorization": f"Bearer {token.json()['access_token']}"}
+
+
+@pytest.fixture
+def make_group(client, auth_headers):
+    """Factory: a group created by "boss", joined by boss (`join`) and `members` new users."""
+
+    def _make(name: str = "Flat", *, join: bool = True, members: int = 0) -> dict:
+        group = client.post("/groups/", json={"name": name}, headers=auth_headers).json()
+        user_ids = []
+        if join:
+            user_ids.append(client.get("/users/me", headers=auth_headers).json()["id"])
+        for n in range(members):
+            user = client.post("/auth/register", json={"name": f"{name}-m{n}", "password": "pwd"})
+            user_ids.append(user.json()["id"])
+        for user_id in user_ids:
+            client.post(f"/groups/{group['id']}/users/{user_id}", headers=auth_headers)
+        return {**group, "user_ids": user_ids}
+
+    return _make
+
+
+@pytest.fixture
+def count_statements():
+    """Context manager collecting SQL statements issued by the request path."""
+
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # handlers use the async engine; its events fire on the underlying sync engine
+        target = async_engine.sync_engine
+        event.listen(target, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(target, "before_cursor_execute", _record)
+
+    return _count
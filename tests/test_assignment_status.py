@@ -0,0 +1,51 @@
+import pytest
+
+
+@pytest.fixture
+def pending(client, auth_headers, make_group):
+    """Factory: ids of `count` pending assignments of boss in a fresh group."""
+
+    def _make(count: int = 3) -> list:
+        group = make_group()
+        chore = client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers).json()
+        item = {"chore_id": chore["id"], "group_id": group["id"]}
+        item["assigned_to_user_id"] = group["user_ids"][0]
+        created = client.post(
+            "/assignments/batch", json={"items": [item] * count}, headers=auth_headers
+        ).json()["results"]
+        return [r["assignment"]["id"] for r in created]
+
+    return _make
+
+
+def test_bulk_status_update_in_one_statement(client, auth_headers, pending, count_statements):
+    ids = pending()
+    with count_statements() as statements:
+        resp = client.post(
+            "/assignments/status", json={"ids": ids + [999], "status": "done"}, headers=auth_headers
+        )
+    assert resp.status_code == 200
+    assert resp.json() == {"updated": ids, "not_found": [999]}
+    # статусы пишет один UPDATE; второй (на SQLite) — пустой, ради блокировки записи
+    writes = [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+    assert sum("completed_at" in s for s in writes) == 1
+    assert len(writes) <= 2
+
+    listed = client.get("/assignments/").json()
+    assert {a["status"] for a in listed} == {"done"}
+    assert all(a["completed_at"] for a in listed)
+
+
+def test_single_item_endpoints_share_the_bulk_path(client, auth_headers, pending):
+    ids = pending(count=1)
+    assert client.post(f"/assignments/{ids[0]}/skip", headers=auth_headers).status_code == 204
+    assert client.get("/assignments/").json()[0]["status"] == "skipped"
+    assert client.post("/assignments/999/done", headers=auth_headers).status_code == 404
+
+
+def test_bulk_status_rejects_unknown_status(client, auth_headers, pending):
+    ids = pending(count=1)
+    resp = client.post(
+        "/assignments/status", json={"ids": ids, "status": "lost"}, headers=auth_headers
+    )
+    assert resp.status_code == 422
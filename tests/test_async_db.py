@@ -0,0 +1,27 @@
+import asyncio
+
+import httpx
+
+from adapters.persistence import to_async_url
+from app.main import app
+
+
+def test_async_url_swaps_driver():
+    assert to_async_url("sqlite:///./data/x.db") == "sqlite+aiosqlite:///./data/x.db"
+    assert (
+        to_async_url("postgresql+psycopg2://u:p@db:5432/app")
+        == "postgresql+asyncpg://u:p@db:5432/app"
+    )
+
+
+def test_concurrent_authenticated_requests(auth_headers, run_async):
+    async def burst():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await asyncio.gather(
+                *(ac.get("/users/me", headers=auth_headers) for _ in range(20))
+            )
+
+    responses = run_async(burst())
+    assert {r.status_code for r in responses} == {200}
+    assert {r.json()["name"] for r in responses} == {"boss"}
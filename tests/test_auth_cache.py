@@ -0,0 +1,25 @@
+def test_repeated_auth_hits_cache_without_sql(client, auth_headers, count_statements):
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+
+    with count_statements() as statements:
+        resp = client.get("/users/me", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.json()["name"] == "boss"
+    assert statements == []
+
+
+def test_membership_change_invalidates_cached_user(client, auth_headers):
+    me = client.get("/users/me", headers=auth_headers).json()
+    assert me["group_ids"] == []
+
+    group = client.post("/groups/", json={"name": "Home"}, headers=auth_headers).json()
+    client.post(f"/groups/{group['id']}/users/{me['id']}", headers=auth_headers)
+    assert client.get("/users/me", headers=auth_headers).json()["group_ids"] == [group["id"]]
+
+    client.delete(f"/groups/{group['id']}/users/{me['id']}", headers=auth_headers)
+    assert client.get("/users/me", headers=auth_headers).json()["group_ids"] == []
+
+
+def test_tampered_token_is_rejected(client, auth_headers):
+    bad = {"Authorization": auth_headers["Authorization"][:-2] + "xx"}
+    assert client.get("/users/me", headers=bad).status_code == 401
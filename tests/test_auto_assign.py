@@ -0,0 +1,65 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from app.main import app
+
+
+@pytest.fixture
+def setup(client, auth_headers, make_group):
+    # boss раздаёт дела, но сам в группу не входит
+    group = make_group(join=False, members=3)
+    chore = client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers).json()
+    return auth_headers, group, chore
+
+
+def test_auto_assign_picks_least_loaded(client, setup):
+    auth, group, chore = setup
+    base = {"chore_id": chore["id"], "group_id": group["id"]}
+    member_ids = sorted(group["user_ids"])
+    busy = member_ids[0]
+    client.post("/assignments/", json={**base, "assigned_to_user_id": busy}, headers=auth)
+
+    picked = [client.post("/assignments/", json=base, headers=auth).json() for _ in range(2)]
+    assert [a["assigned_to_user_id"] for a in picked] == member_ids[1:]
+    # все по одному — при равенстве выигрывает меньший id
+    assert (
+        client.post("/assignments/", json=base, headers=auth).json()["assigned_to_user_id"] == busy
+    )
+
+    # закрытое назначение больше не считается нагрузкой
+    client.post(f"/assignments/{picked[0]['id']}/done", headers=auth)
+    again = client.post("/assignments/", json=base, headers=auth).json()
+    assert again["assigned_to_user_id"] == member_ids[1]
+
+
+def test_auto_assign_in_batch_spreads_the_load(client, setup):
+    auth, group, chore = setup
+    empty = client.post("/groups/", json={"name": "Empty"}, headers=auth).json()
+    base = {"chore_id": chore["id"], "group_id": group["id"]}
+    items = [base] * 6 + [{**base, "group_id": empty["id"]}]
+    results = client.post("/assignments/batch", json={"items": items}, headers=auth).json()[
+        "results"
+    ]
+    assert results[-1]["status"] == 400
+    counts = Counter(r["assignment"]["assigned_to_user_id"] for r in results[:-1])
+    assert sorted(counts.values()) == [2, 2, 2]
+
+
+def test_concurrent_auto_assignments_stay_balanced(client, setup, run_async):
+    auth, group, chore = setup
+    base = {"chore_id": chore["id"], "group_id": group["id"]}
+
+    async def burst():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await asyncio.gather(
+                *(ac.post("/assignments/", json=base, headers=auth) for _ in range(9))
+            )
+
+    responses = run_async(burst())
+    assert {r.status_code for r in responses} == {201}
+    counts = Counter(r.json()["assigned_to_user_id"] for r in responses)
+    assert sorted(counts.values()) == [3, 3, 3]
@@ -0,0 +1,58 @@
+from datetime import date
+
+
+def test_chores_batch_reports_per_item_results(client, auth_headers):
+    resp = client.post(
+        "/chores/batch",
+        json={
+            "items": [
+                {"title": "Dishes"},
+                {"title": "Ghost", "created_by_user_id": 999},
+                {"title": "Laundry", "description": "whites"},
+            ]
+        },
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created"] == 2
+    assert [r["status"] for r in body["results"]] == [201, 404, 201]
+    assert body["results"][2]["chore"]["description"] == "whites"
+    assert [c["title"] for c in client.get("/chores/").json()] == ["Dishes", "Laundry"]
+
+
+def test_assignments_batch_validates_with_constant_queries(
+    client, auth_headers, make_group, count_statements
+):
+    # boss раздаёт дела, в группе — только участник
+    group = make_group(join=False, members=1)
+    outsider = client.post("/auth/register", json={"name": "outsider", "password": "pwd"}).json()
+    chores = client.post(
+        "/chores/batch",
+        json={"items": [{"title": f"c{i}"} for i in range(5)]},
+        headers=auth_headers,
+    ).json()["results"]
+    items = [
+        {
+            "chore_id": chores[i % 5]["chore"]["id"],
+            "group_id": group["id"],
+            "assigned_to_user_id": group["user_ids"][0],
+            "due_date": date.today().isoformat(),
+        }
+        for i in range(200)
+    ]
+    items.append({**items[0], "assigned_to_user_id": outsider["id"]})
+    items.append({**items[0], "chore_id": 999})
+
+    with count_statements() as statements:
+        resp = client.post("/assignments/batch", json={"items": items}, headers=auth_headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created"] == 200
+    assert [r["status"] for r in body["results"][-2:]] == [400, 404]
+    assert body["results"][0]["assignment"]["status"] == "pending"
+    # user lookups, 4 set-based checks and the insert — not one round trip per item
+    assert len(statements) <= 10
+
+    listed = client.get(f"/assignments/?group_id={group['id']}").json()
+    assert len(listed) == 200
@@ -0,0 +1,81 @@
+import pytest
+
+from app.compaction import compact
+
+
+@pytest.fixture
+def setup(client, auth_headers, make_group):
+    # boss состоит в двух группах
+    groups = make_group("A"), make_group("B")
+    chore = client.post("/chores/", json={"title": "Dishes"}, headers=auth_headers).json()
+    return auth_headers, groups, chore
+
+
+def test_changes_since_cursor(client, setup):
+    auth, (a, b), chore = setup
+    first = client.get("/changes").json()
+    assert [(c["entity"], c["op"]) for c in first["changes"]] == [
+        ("group", "created"),
+        ("membership", "added"),
+        ("group", "created"),
+        ("membership", "added"),
+        ("chore", "created"),
+    ]
+    assert first["changes"][0]["data"] == {"id": a["id"], "name": "A", "user_ids": []}
+    assert first["changes"][-1]["data"] == chore and not first["has_more"]
+
+    item = {"chore_id": chore["id"], "group_id": b["id"]}
+    created = client.post("/assignments/", json=item, headers=auth).json()
+    client.post(f"/assignments/{created['id']}/skip", headers=auth)
+    client.delete(f"/groups/{a['id']}/users/{a['user_ids'][0]}", headers=auth)
+    weekly = {"group_id": b["id"], "frequency": "weekly", "start_date": "2030-01-01"}
+    schedule = client.post(f"/chores/{chore['id']}/schedules", json=weekly, headers=auth).json()
+
+    delta = client.get("/changes", params={"since": first["cursor"], "limit": 2}).json()
+    assert [c["op"] for c in delta["changes"]] == ["created", "skipped"]
+    assert delta["changes"][0]["data"] == created
+    assert delta["changes"][1]["data"]["status"] == "skipped" and delta["has_more"]
+    rest = client.get("/changes", params={"since": delta["cursor"]}).json()
+    assert [(c["entity"], c["group_id"]) for c in rest["changes"]] == [
+        ("membership", a["id"]),
+        ("schedule", b["id"]),
+    ]
+    assert rest["changes"][1]["data"] == schedule
+    assert client.get("/changes", params={"since": rest["cursor"]}).json() == {
+        "changes": [],
+        "cursor": rest["cursor"],
+        "has_more": False,
+    }
+
+    # фильтр по группе оставляет её изменения и общие (дела)
+    only_b = client.get("/changes", params={"group_id": b["id"]}).json()["changes"]
+    assert {(c["entity"], c["group_id"]) for c in only_b} == {
+        ("group", b["id"]),
+        ("membership", b["id"]),
+        ("schedule", b["id"]),
+        ("chore", None),
+        ("assignment", b["id"]),
+    }
+
+
+def test_compaction_keeps_latest_state_and_expires_old_cursors(client, setup, run_async):
+    auth, (a, b), chore = setup
+    item = {"chore_id": chore["id"], "group_id": a["id"]}
+    batch = client.post("/assignments/batch", json={"items": [item] * 3}, headers=auth).json()
+    ids = [r["assignment"]["id"] for r in batch["results"]]
+    client.post("/assignments/status", json={"ids": ids, "status": "done"}, headers=auth)
+    before = client.get("/changes").json()["changes"]
+    assert len(before) == 11
+
+    assert run_async(compact(100)) == (3, 0)
+    after = client.get("/changes").json()["changes"]
+    assert [c["op"] for c in after] == ["created", "added"] * 2 + ["created"] + ["done"] * 3
+    assert after[5:] == before[8:]  # последнее состояние каждого назначения на месте
+
+    assert run_async(compact(2)) == (0, 6)
+    expired = client.get("/changes", params={"since": after[0]["id"]})
+    assert expired.status_code == 410
+    assert int(expired.headers["X-Change-Cursor"]) == after[-1]["id"]
+    # курсоры не старше границы сжатия по-прежнему работают
+    kept = client.get("/changes", params={"since": after[5]["id"]}).json()["changes"]
+    assert kept == after[6:]
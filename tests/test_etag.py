@@ -0,0 +1,49 @@
+def test_unchanged_list_answers_304_with_one_lookup(client, auth_headers, count_statements):
+    client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers)
+    first = client.get("/chores/")
+    etag = first.headers["ETag"]
+
+    with count_statements() as statements:
+        cached = client.get("/chores/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    assert len(statements) == 1
+
+    client.post("/chores/", json={"title": "Mop"}, headers=auth_headers)
+    fresh = client.get("/chores/", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+    assert len(fresh.json()) == 2
+
+
+def test_group_scoped_assignment_etags(client, auth_headers, make_group):
+    groups = [make_group(n) for n in "AB"]
+    me = {"id": groups[0]["user_ids"][0]}
+    chore = client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers).json()
+
+    etags = {
+        g["id"]: client.get(f"/assignments/?group_id={g['id']}").headers["ETag"] for g in groups
+    }
+    all_etag = client.get("/assignments/").headers["ETag"]
+    item = {"chore_id": chore["id"], "group_id": groups[0]["id"], "assigned_to_user_id": me["id"]}
+    client.post("/assignments/", json=item, headers=auth_headers)
+
+    def status(url, etag):
+        return client.get(url, headers={"If-None-Match": etag}).status_code
+
+    assert status(f"/assignments/?group_id={groups[0]['id']}", etags[groups[0]["id"]]) == 200
+    assert status(f"/assignments/?group_id={groups[1]['id']}", etags[groups[1]["id"]]) == 304
+    assert status("/assignments/", all_etag) == 200
+
+
+def test_membership_change_invalidates_user_and_group_lists(client, auth_headers):
+    me = client.get("/users/me", headers=auth_headers).json()
+    group = client.post("/groups/", json={"name": "Flat"}, headers=auth_headers).json()
+    users_etag = client.get("/users/").headers["ETag"]
+    groups_etag = client.get("/groups/").headers["ETag"]
+
+    client.post(f"/groups/{group['id']}/users/{me['id']}", headers=auth_headers)
+
+    assert client.get("/users/", headers={"If-None-Match": users_etag}).status_code == 200
+    assert client.get("/groups/", headers={"If-None-Match": groups_etag}).status_code == 200
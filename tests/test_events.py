@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import httpx
+
+from app.events import RESET, Event, EventHub
+from app.main import app
+
+
+def _parse(chunk: bytes):
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().split("\n"))
+    return fields["event"], json.loads(fields["data"])
+
+
+def test_hub_fans_out_and_resets_slow_subscribers():
+    async def scenario():
+        hub = EventHub(max_events=2, max_subscribers=2)
+        fast, slow = hub.stream(1, heartbeat=60), hub.stream(1, heartbeat=60)
+        await fast.__anext__(), await slow.__anext__()  # подписались
+        assert hub.full
+        hub.publish([Event(g, "assignment", g, "created", {"id": g}) for g in (1, 2)])
+        assert _parse(await fast.__anext__()) == ("assignment.created", {"id": 1})
+        hub.publish([Event(1, "assignment", n, "done", {"id": n}) for n in range(2, 4)])
+        # медленный не читал: три события в буфере на два — reset и конец потока
+        assert await slow.__anext__() == RESET
+        assert hub.stats()["subscribers"] == 1 and hub.resets == 1
+        assert [_parse(await fast.__anext__())[1]["id"] for _ in range(2)] == [2, 3]
+        hub.close()
+        assert [chunk async for chunk in fast] == []
+        assert hub.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_group_stream_pushes_assignment_changes(client, auth_headers, make_group, run_async):
+    group = make_group()
+    chore = client.post("/chores/", json={"title": "Dishes"}, headers=auth_headers).json()
+    assert client.get("/groups/999/events").status_code == 404
+
+    async def scenario():
+        # ASGITransport буферизует тело целиком, поэтому поток читается из send напрямую
+        chunks: asyncio.Queue = asyncio.Queue()
+        disconnect = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                await chunks.put(message["body"])
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/groups/{group['id']}/events",
+            "raw_path": b"",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        stream = asyncio.create_task(app(scope, receive, send))
+        transport = httpx.ASGITransport(app=app)
+        assert (await chunks.get()).startswith(b"retry:")
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            item = {"chore_id": chore["id"], "group_id": group["id"]}
+            created = (await ac.post("/assignments/", json=item, headers=auth_headers)).json()
+            await ac.post(f"/assignments/{created['id']}/done", headers=auth_headers)
+        events = [_parse(await asyncio.wait_for(chunks.get(), 5)) for _ in range(2)]
+        disconnect.set()
+        await asyncio.wait_for(stream, 5)
+        return created, events
+
+    created, events = run_async(scenario())
+    assert events[0] == ("assignment.created", created)
+    name, data = events[1]
+    assert name == "assignment.done"
+    assert data["id"] == created["id"] and data["status"] == "done" and data["completed_at"]
+    assert client.get("/health/events").json()["subscribers"] == 0
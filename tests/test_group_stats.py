@@ -0,0 +1,103 @@
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from adapters.persistence import engine
+from app.main import app
+from domain.clock import utc_today
+
+
+@pytest.fixture
+def setup(client, auth_headers, make_group):
+    # boss и второй участник, которому ничего не назначают
+    group = make_group(members=1)
+    chore = client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers).json()
+    return auth_headers, group, chore
+
+
+def test_stats_follow_assignment_writes(client, setup):
+    auth, group, chore = setup
+    me, idle = group["user_ids"]
+    item = {"chore_id": chore["id"], "group_id": group["id"], "assigned_to_user_id": me}
+    first = client.post("/assignments/", json=item, headers=auth).json()
+    batch = client.post("/assignments/batch", json={"items": [item] * 4}, headers=auth).json()
+    ids = [first["id"]] + [r["assignment"]["id"] for r in batch["results"]]
+
+    client.post("/assignments/status", json={"ids": ids[:3], "status": "done"}, headers=auth)
+    client.post(f"/assignments/{ids[3]}/skip", headers=auth)
+    client.post(f"/assignments/{ids[0]}/skip", headers=auth)  # done -> skipped
+    client.post(f"/assignments/{ids[1]}/done", headers=auth)  # done -> done
+
+    resp = client.get(f"/groups/{group['id']}/stats")
+    assert resp.status_code == 200
+    members = resp.json()["members"]
+    assert members[0] == {
+        "user_id": me,
+        "pending": 1,
+        "done": 2,
+        "skipped": 2,
+        "completion_rate": 0.5,
+    }
+    assert members[1] == {
+        "user_id": idle,
+        "pending": 0,
+        "done": 0,
+        "skipped": 0,
+        "completion_rate": None,
+    }
+
+    # сводная таблица совпадает с GROUP BY по назначениям
+    with engine.connect() as conn:
+        counted = conn.execute(
+            text("SELECT status, COUNT(*) FROM assignments GROUP BY status")
+        ).all()
+    assert dict(counted) == {"pending": 1, "done": 2, "skipped": 2}
+
+    today = utc_today()
+    window = client.get(
+        f"/groups/{group['id']}/stats",
+        params={"since": str(today - timedelta(days=1)), "until": str(today + timedelta(days=1))},
+    ).json()
+    assert window["members"][0]["done"] == 2
+    past = client.get(
+        f"/groups/{group['id']}/stats", params={"until": str(today - timedelta(days=1))}
+    ).json()
+    assert past["members"][0]["done"] == past["members"][0]["skipped"] == 0
+    assert past["members"][0]["pending"] == 1
+
+
+def test_stats_for_unknown_group(client):
+    assert client.get("/groups/999/stats").status_code == 404
+
+
+def test_concurrent_transitions_keep_counters_exact(client, setup, run_async):
+    auth, group, chore = setup
+    me = group["user_ids"][0]
+    item = {"chore_id": chore["id"], "group_id": group["id"], "assigned_to_user_id": me}
+    batch = client.post("/assignments/batch", json={"items": [item] * 20}, headers=auth).json()
+    ids = [r["assignment"]["id"] for r in batch["results"]]
+
+    async def burst():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            # каждое назначение закрывают дважды, плюс пачка поверх тех же id
+            calls = [ac.post(f"/assignments/{i}/done", headers=auth) for i in ids * 2]
+            calls.append(
+                ac.post("/assignments/status", json={"ids": ids, "status": "done"}, headers=auth)
+            )
+            return await asyncio.gather(*calls)
+
+    assert {r.status_code for r in run_async(burst())} <= {200, 204}
+    with engine.connect() as conn:
+        counted = dict(
+            conn.execute(text("SELECT status, COUNT(*) FROM assignments GROUP BY status")).all()
+        )
+        stored = conn.execute(
+            text("SELECT pending, done, skipped FROM member_stats WHERE user_id = :u"),
+            {"u": me},
+        ).one()
+    assert counted == {"done": 20}
+    assert tuple(stored) == (0, 20, 0)
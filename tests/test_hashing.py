@@ -0,0 +1,63 @@
+import asyncio
+import threading
+
+import pytest
+
+from domain.hashing import HashingPoolBusy, PasswordHashingPool
+
+
+def test_pool_rejects_when_backlog_is_full():
+    pool = PasswordHashingPool(workers=1, queue_size=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert pool.stats()["in_flight"] == 1
+        assert pool.stats()["queued"] == 1
+        with pytest.raises(HashingPoolBusy):
+            await pool.run(release.wait)
+        release.set()
+        await asyncio.gather(*running)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["failed"] == 0
+    assert stats["in_flight"] == stats["queued"] == 0
+
+
+def test_failed_and_cancelled_jobs_are_not_completed():
+    pool = PasswordHashingPool(workers=1, queue_size=1)
+    release = threading.Event()
+
+    def boom():
+        raise ValueError("bad hash")
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await pool.run(boom)
+        stuck = asyncio.create_task(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        stuck.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stuck
+        release.set()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+    stats = pool.stats()
+    assert (stats["completed"], stats["failed"]) == (0, 2)
+    assert stats["in_flight"] == stats["queued"] == 0
+
+
+def test_hashing_stats_endpoint(client):
+    resp = client.get("/health/hashing")
+    assert resp.status_code == 200
+    assert {"workers", "queue_size", "in_flight", "queued", "rejected"} <= resp.json().keys()
@@ -0,0 +1,98 @@
+import re
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from starlette.testclient import TestClient
+
+from adapters.persistence import AsyncSessionLocal, pool_stats
+from app.metrics import Histogram, Metrics, metrics
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.rate_limiter import SimpleRateLimiterMiddleware
+
+
+def _sample(text: str, name: str, **labels) -> float:
+    """Value of the one sample of `name` whose labels include `labels`."""
+    for line in text.splitlines():
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})? (\S+)", line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="([^"]*)"', match.group(2) or ""))
+        if all(found.get(k) == v for k, v in labels.items()):
+            return float(match.group(3))
+    raise AssertionError(f"{name} {labels} not in metrics")
+
+
+def test_histogram_buckets_are_inclusive_and_cumulative():
+    registry = Metrics()
+    registry.observe_request("GET", "/x", 200, 0.005, 10)
+    registry.observe_request("GET", "/x", 200, 0.007, 10)
+    registry.observe_request("GET", "/x", 500, 20.0, 10)
+    registry.observe_request("BREW", "/x", 200, 0.001, 10)
+    text = registry.render()
+    labels = {"method": "GET", "route": "/x"}
+    assert _sample(text, "http_request_duration_seconds_bucket", le="0.005", **labels) == 1
+    assert _sample(text, "http_request_duration_seconds_bucket", le="0.01", **labels) == 2
+    assert _sample(text, "http_request_duration_seconds_bucket", le="+Inf", **labels) == 3
+    assert _sample(text, "http_request_duration_seconds_count", **labels) == 3
+    assert _sample(text, "http_responses_total", status="500", **labels) == 1
+    assert _sample(text, "http_responses_total", method="OTHER") == 1
+
+    histogram = Histogram((1, 2))
+    for value in (0.5, 1, 1.5, 3):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+
+
+def test_route_templates_statuses_and_sizes(client, auth_headers, make_group):
+    group_id = make_group(join=False)["id"]
+    for _ in range(2):
+        client.get(f"/groups/{group_id}/stats", headers=auth_headers)
+    client.get("/no/such/path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    route = {"method": "GET", "route": "/groups/{group_id}/stats"}
+    assert _sample(text, "http_request_duration_seconds_count", **route) == 2
+    assert _sample(text, "http_responses_total", status="200", **route) == 2
+    assert _sample(text, "http_response_size_bytes_sum", **route) > 0
+    assert _sample(text, "http_responses_total", route="unmatched", status="404") == 1
+    assert f"/groups/{group_id}/" not in text
+    # сам запрос /metrics ещё идёт
+    assert _sample(text, "http_requests_in_flight") == 1
+    assert _sample(text, "db_pool_checkout_seconds_count", pool="primary") > 0
+    assert _sample(text, "app_response_cache_entries") >= 0
+    assert _sample(text, "app_db_pool_checked_out") >= 0
+
+
+def test_rate_limited_requests_are_counted():
+    registry = Metrics()
+    app = FastAPI()
+    app.get("/ping")(lambda: "ok")
+    app.add_middleware(SimpleRateLimiterMiddleware, limit=1, window=60)
+    app.add_middleware(MetricsMiddleware, registry=registry)
+    before = metrics.rate_limited.get("default", 0)
+    client = TestClient(app)
+    assert [client.get("/ping").status_code for _ in range(3)] == [200, 429, 429]
+
+    assert metrics.rate_limited["default"] - before == 2
+    text = registry.render()
+    assert _sample(text, "http_responses_total", route="/ping", status="200") == 1
+    # отказ случился до роутинга
+    assert _sample(text, "http_responses_total", route="unmatched", status="429") == 2
+
+
+def test_checkout_is_timed_without_making_sessions_eager(run_async):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            # сессия без запросов соединение не берёт
+            assert pool_stats()["checked_out"] == 0
+            assert "primary" not in metrics.checkout
+            await db.execute(text("SELECT 1"))
+            await db.execute(text("SELECT 2"))
+            assert pool_stats()["checked_out"] == 1
+
+    run_async(scenario())
+    assert metrics.checkout["primary"].count == 1
@@ -0,0 +1,67 @@
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+from adapters.migrate import upgrade_database
+from adapters.persistence import Base
+
+
+def _engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'migrate.sqlite'}")
+
+
+def test_migrations_match_models(tmp_path):
+    engine = _engine(tmp_path)
+    upgrade_database(engine)
+    with engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+    assert diff == []
+
+
+def test_legacy_database_is_upgraded_in_place(tmp_path):
+    engine = _engine(tmp_path)
+    # база в том виде, в котором её создавал create_all до появления миграций
+    upgrade_database(engine, "0001")
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE alembic_version"))
+        conn.execute(text("INSERT INTO users (name, hashed_password) VALUES ('old', 'x')"))
+
+    upgrade_database(engine)
+
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("assignments")}
+    assert {"ix_assignments_group_status_due", "ix_assignments_assignee_status_due"} <= indexes
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT name FROM users")).scalar() == "old"
+
+
+def test_member_stats_are_backfilled(tmp_path):
+    engine = _engine(tmp_path)
+    upgrade_database(engine, "0004")
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (id, name, hashed_password) VALUES (1, 'a', 'x')"))
+        conn.execute(text("INSERT INTO groups (id, name) VALUES (1, 'g')"))
+        conn.execute(text("INSERT INTO chores (id, title) VALUES (1, 'c')"))
+        for status, completed_at in [
+            ("pending", None),
+            ("done", "2030-01-02 10:00:00.000000"),
+            ("done", "2030-01-02 18:00:00.000000"),
+            ("skipped", "2030-01-03 09:00:00.000000"),
+        ]:
+            conn.execute(
+                text(
+                    "INSERT INTO assignments (chore_id, group_id, assigned_to_user_id,"
+                    " assigned_by_user_id, assigned_at, status, completed_at)"
+                    " VALUES (1, 1, 1, 1, '2030-01-01 00:00:00.000000', :s, :c)"
+                ),
+                {"s": status, "c": completed_at},
+            )
+
+    upgrade_database(engine)
+
+    with engine.connect() as conn:
+        totals = conn.execute(text("SELECT pending, done, skipped FROM member_stats")).one()
+        daily = conn.execute(
+            text("SELECT day, done, skipped FROM member_daily_stats ORDER BY day")
+        ).all()
+    assert tuple(totals) == (1, 2, 1)
+    assert [tuple(r) for r in daily] == [("2030-01-02", 2, 0), ("2030-01-03", 0, 1)]
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from domain import clock
+
+
+def test_overdue_endpoint_filters_pending_past_due(client, auth_headers, make_group):
+    group = make_group()
+    me = {"id": group["user_ids"][0]}
+    chore = client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers).json()
+    item = {"chore_id": chore["id"], "group_id": group["id"], "assigned_to_user_id": me["id"]}
+    due_dates = ["2030-01-05", "2030-01-01", None, "2030-01-03", "2030-01-09"]
+    items = [{**item, "due_date": d} for d in due_dates]
+    created = client.post("/assignments/batch", json={"items": items}, headers=auth_headers).json()
+    ids = [r["assignment"]["id"] for r in created["results"]]
+    client.post(f"/assignments/{ids[3]}/done", headers=auth_headers)
+
+    resp = client.get("/assignments/overdue", params={"as_of": "2030-01-06"})
+    assert resp.status_code == 200
+    assert [a["id"] for a in resp.json()] == [ids[1], ids[0]]
+
+    limited = client.get("/assignments/overdue", params={"as_of": "2030-01-06", "limit": 1})
+    assert [a["id"] for a in limited.json()] == [ids[1]]
+    other = client.get(
+        "/assignments/overdue", params={"as_of": "2030-01-06", "group_id": group["id"] + 1}
+    )
+    assert other.json() == []
+    by_user = client.get(
+        "/assignments/overdue", params={"as_of": "2030-01-06", "user_id": me["id"]}
+    )
+    assert len(by_user.json()) == 2
+
+
+class _LateUTCEvening(datetime):
+    """23:30 UTC on 2030-01-06: east of UTC the local date is already the 7th."""
+
+    @classmethod
+    def utcnow(cls):
+        return cls(2030, 1, 6, 23, 30)
+
+
+def test_overdue_default_is_the_utc_day(client, auth_headers, make_group, monkeypatch):
+    # часы подменяются в domain.clock, а не часовой пояс процесса (tzset нет на Windows)
+    monkeypatch.setattr(clock, "datetime", _LateUTCEvening)
+    group = make_group()
+    chore = client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers).json()
+    item = {"chore_id": chore["id"], "group_id": group["id"]}
+    item["assigned_to_user_id"] = group["user_ids"][0]
+    for due in ("2030-01-06", "2030-01-05"):
+        client.post("/assignments/", json={**item, "due_date": due}, headers=auth_headers)
+    overdue = client.get("/assignments/overdue").json()
+    assert [a["due_date"] for a in overdue] == ["2030-01-05"]
@@ -0,0 +1,40 @@
+import json
+
+from app.pagination import NDJSON_MEDIA_TYPE, NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+
+
+def test_cursor_roundtrip():
+    assert decode_cursor(encode_cursor(42)) == 42
+
+
+def test_invalid_cursor_is_rejected(client):
+    resp = client.get("/chores/?after=not-a-cursor")
+    assert resp.status_code == 400
+
+
+def test_keyset_pages_cover_all_rows(client, auth_headers):
+    for i in range(5):
+        client.post("/chores/", json={"title": f"chore-{i}"}, headers=auth_headers)
+
+    seen = []
+    resp = client.get("/chores/?limit=2")
+    while True:
+        assert resp.status_code == 200
+        seen.extend(c["title"] for c in resp.json())
+        cursor = resp.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+        resp = client.get(f"/chores/?limit=2&after={cursor}")
+
+    assert seen == [f"chore-{i}" for i in range(5)]
+
+
+def test_ndjson_streams_rows(client, auth_headers):
+    for i in range(3):
+        client.post("/chores/", json={"title": f"chore-{i}"}, headers=auth_headers)
+
+    resp = client.get("/chores/", headers={"Accept": NDJSON_MEDIA_TYPE})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["title"] for r in rows] == ["chore-0", "chore-1", "chore-2"]
@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+from adapters.persistence import engine, engine_options
+
+
+def test_sqlite_connections_use_wal():
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_engine_options_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "1800")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "1")
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+
+    sync = engine_options("postgresql://u:p@db/chores")
+    assert sync["pool_size"] == 20 and sync["pool_recycle"] == 1800 and sync["pool_pre_ping"]
+    assert "max_overflow" not in sync  # не задано — значение SQLAlchemy
+    assert sync["connect_args"] == {"options": "-c statement_timeout=5000"}
+    asyncpg = engine_options("postgresql+asyncpg://u:p@db/chores")
+    assert asyncpg["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+    assert engine_options("sqlite:///x.db")["connect_args"] == {"check_same_thread": False}
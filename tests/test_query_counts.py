@@ -0,0 +1,31 @@
+# сколько SQL-запросов допустимо на один list-эндпойнт, независимо от числа строк
+MAX_STATEMENTS_PER_LIST = 3
+
+
+def _seed(client, auth: dict, users: int = 12, groups: int = 4):
+    user_ids = [
+        client.post("/auth/register", json={"name": f"u{i}", "password": "pwd"}).json()["id"]
+        for i in range(users)
+    ]
+    for g in range(groups):
+        group_id = client.post("/groups/", json={"name": f"g{g}"}, headers=auth).json()["id"]
+        for uid in user_ids[g::2]:
+            client.post(f"/groups/{group_id}/users/{uid}", headers=auth)
+
+
+def test_list_users_uses_constant_number_of_queries(client, auth_headers, count_statements):
+    _seed(client, auth_headers)
+    with count_statements() as statements:
+        resp = client.get("/users/")
+    assert resp.status_code == 200
+    assert any(u["group_ids"] for u in resp.json())
+    assert len(statements) <= MAX_STATEMENTS_PER_LIST
+
+
+def test_list_groups_uses_constant_number_of_queries(client, auth_headers, count_statements):
+    _seed(client, auth_headers)
+    with count_statements() as statements:
+        resp = client.get("/groups/")
+    assert resp.status_code == 200
+    assert all(g["user_ids"] for g in resp.json())
+    assert len(statements) <= MAX_STATEMENTS_PER_LIST
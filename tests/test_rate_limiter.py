@@ -0,0 +1,179 @@
+import asyncio
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware.rate_limit_backends import (
+    InMemoryKV,
+    KVCounterStore,
+    SharedWindowBackend,
+    SlidingWindowStore,
+    SQLiteCounterStore,
+)
+from app.middleware.rate_limiter import SimpleRateLimiterMiddleware
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(clock: FakeClock, **limits) -> TestClient:
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/ping", ok), Route("/auth/token", ok, methods=["POST"])])
+    app.add_middleware(SimpleRateLimiterMiddleware, clock=clock, **limits)
+    return TestClient(app)
+
+
+def test_limit_and_retry_after():
+    clock = FakeClock()
+    client = _client(clock, limit=3, window=60)
+    assert [client.get("/ping").status_code for _ in range(3)] == [200, 200, 200]
+    blocked = client.get("/ping")
+    assert blocked.status_code == 429
+    assert int(blocked.headers["Retry-After"]) >= 1
+    assert blocked.json()["title"] == "TooManyRequests"
+
+    # two windows later the previous window no longer counts
+    clock.now += 120
+    assert client.get("/ping").status_code == 200
+
+
+def test_auth_routes_have_their_own_stricter_class():
+    client = _client(FakeClock(), limit=100, window=60, auth_limit=2)
+    assert [client.post("/auth/token").status_code for _ in range(3)] == [200, 200, 429]
+    assert client.get("/ping").status_code == 200
+
+
+def test_clients_are_limited_independently():
+    client = _client(FakeClock(), limit=1, window=60)
+    assert client.get("/ping", headers={"X-Forwarded-For": "10.0.0.1"}).status_code == 200
+    assert client.get("/ping", headers={"X-Forwarded-For": "10.0.0.1"}).status_code == 429
+    assert client.get("/ping", headers={"X-Forwarded-For": "10.0.0.2"}).status_code == 200
+
+
+def test_sliding_window_weights_previous_window():
+    store = SlidingWindowStore(limit=10, window=60, max_keys=10)
+    for _ in range(10):
+        assert store.hit("c", 0.0)[0]
+    # half-way through the next window half of the previous count still applies
+    allowed = sum(store.hit("c", 90.0)[0] for _ in range(10))
+    assert allowed == 5
+
+
+def test_store_is_capped_and_swept():
+    store = SlidingWindowStore(limit=5, window=60, max_keys=100)
+    for i in range(1000):
+        store.hit(f"spoofed-{i}", 1.0)
+    assert len(store) == 100
+
+    store.hit("fresh", 200.0)
+    assert len(store) == 1
+
+
+def test_shared_backend_enforces_one_limit_across_workers():
+    kv = KVCounterStore(InMemoryKV())
+    workers = [
+        SharedWindowBackend(kv, limit=10, window=60, max_keys=100, flush_batch=1) for _ in range(3)
+    ]
+
+    async def scenario():
+        allowed = 0
+        for i in range(30):
+            ok, _ = await workers[i % 3].hit("client", 1000.0 + i * 0.01)
+            allowed += ok
+        return allowed
+
+    # each worker alone would let 10 through; together the overshoot is one batch per worker
+    assert asyncio.run(scenario()) <= 10 + len(workers)
+
+
+def test_shared_backend_batches_store_round_trips():
+    kv = KVCounterStore(InMemoryKV())
+    backend = SharedWindowBackend(
+        kv, limit=10_000, window=60, max_keys=100, flush_batch=50, flush_interval=60
+    )
+
+    async def scenario():
+        for i in range(500):
+            await backend.hit(f"c{i % 5}", 1000.0)
+
+    asyncio.run(scenario())
+    assert backend.flushes <= 500 // 50 + 1
+
+
+def test_sqlite_counter_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "rl.sqlite")
+    first, second = SQLiteCounterStore(path), SQLiteCounterStore(path)
+
+    async def scenario():
+        await first.incr_many({"k": 3}, ttl=60)
+        return await second.incr_many({"k": 2, "other": 0}, ttl=60)
+
+    assert asyncio.run(scenario()) == {"k": 5, "other": 0}
+
+
+class _RecordingStore:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches = []
+
+    async def incr_many(self, increments, ttl):
+        self.batches.append(dict(increments))
+        if self.fail:
+            raise ConnectionError("store down")
+        return {key: amount for key, amount in increments.items()}
+
+
+def test_shared_backend_flushes_only_keys_with_new_hits():
+    store = _RecordingStore()
+    backend = SharedWindowBackend(
+        store, limit=100, window=60, max_keys=10_000, flush_batch=10**6, flush_interval=60
+    )
+
+    async def scenario():
+        for i in range(1000):
+            await backend.hit(f"c{i}", 1000.0)
+        await backend.flush(1000.0)
+        await backend.hit("c7", 1001.0)
+        await backend.flush(1001.0)
+
+    asyncio.run(scenario())
+    # каждый ключ один раз: текущее окно и чтение предыдущего
+    assert sum(len(batch) for batch in store.batches[:-1]) == 2000
+    assert store.batches[-1] == {"rl:960:c7": 1}
+
+
+def test_kv_store_sends_one_pipeline_per_batch():
+    kv = InMemoryKV()
+    totals = asyncio.run(KVCounterStore(kv).incr_many({"a": 2, "b": 0, "c": 5}, ttl=120))
+    assert totals == {"a": 2, "b": 0, "c": 5}
+    assert kv.round_trips == 1
+    assert all(expires_at < float("inf") for _, expires_at in kv._data.values())
+
+
+def test_outbox_is_bounded_while_the_store_is_down():
+    store = _RecordingStore(fail=True)
+    backend = SharedWindowBackend(
+        store, limit=100, window=60, max_keys=50, flush_batch=10**6, flush_interval=60
+    )
+
+    async def scenario():
+        for i in range(500):
+            await backend.hit(f"c{i}", 1000.0)
+            # окно ключа сдвигается: его хиты уходят в outbox
+            await backend.hit(f"c{i}", 1060.0)
+        await backend.flush(1060.0)
+        assert len(backend._outbox) <= 50
+        # два окна спустя старые хиты уже ни на что не влияют
+        await backend.flush(1200.0)
+        assert not backend._outbox
+
+    asyncio.run(scenario())
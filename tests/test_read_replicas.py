@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+import adapters.persistence as persistence
+from adapters.orm.models import ChoreModel, EntityVersionModel
+from adapters.persistence import Base, async_engine
+from adapters.replicas import ReadRouter
+
+
+@pytest.fixture
+def router(tmp_path, monkeypatch):
+    """Two SQLite files standing in for replicas that have not caught up with the primary."""
+    replicas = []
+    for version, name in enumerate(("replica-1", "replica-2")):
+        path = tmp_path / f"{name}.sqlite"
+        seed = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(seed)
+        with seed.begin() as conn:
+            conn.execute(insert(ChoreModel), [{"title": name}])
+            # разные версии: у разных данных должны быть разные ETag
+            conn.execute(insert(EntityVersionModel), [{"scope": "chores", "version": version}])
+        seed.dispose()
+        # без пула: соединения не переживают event loop TestClient
+        replicas.append(create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool))
+    now = [0.0]
+    router = ReadRouter(async_engine, replicas, sticky_seconds=5, clock=lambda: now[0])
+    router.now = now
+    monkeypatch.setattr(persistence, "read_router", router)
+    return router
+
+
+def _titles(resp):
+    return [c["title"] for c in resp.json()]
+
+
+def test_reads_go_to_replicas_except_right_after_own_write(client, router, auth_headers):
+    client.post("/chores/", json={"title": "Dishes"}, headers=auth_headers)
+
+    # своя запись видна сразу: чтение идёт в primary
+    assert _titles(client.get("/chores/", headers=auth_headers)) == ["Dishes"]
+    assert router.stats()["replica_reads"] == [0, 0]
+
+    router.now[0] += 6
+    assert _titles(client.get("/chores/", headers=auth_headers)) == ["replica-1"]
+    assert _titles(client.get("/chores/", headers=auth_headers)) == ["replica-2"]
+    ndjson = client.get("/chores/", headers={**auth_headers, "Accept": "application/x-ndjson"})
+    assert '"replica-' in ndjson.text and "Dishes" not in ndjson.text
+
+    # новая запись снова закрепляет клиента за primary
+    client.post("/chores/", json={"title": "Trash"}, headers=auth_headers)
+    assert _titles(client.get("/chores/", headers=auth_headers)) == ["Dishes", "Trash"]
+
+
+def test_least_connections_skips_busy_replica(router):
+    async def scenario():
+        async with router.session():
+            busy = router.stats()["in_flight"].index(1)
+            assert {router.pick() for _ in range(4)} == {1 - busy}
+        assert router.stats()["in_flight"] == [0, 0]
+        assert {router.pick() for _ in range(4)} == {0, 1}
+
+    asyncio.run(scenario())
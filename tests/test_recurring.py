@@ -0,0 +1,56 @@
+from datetime import date
+
+from app.recurring import generate_assignments
+from domain.recurrence import occurrences, pick_assignee
+
+
+def test_occurrences_and_rotation():
+    start = date(2030, 1, 1)
+    window = list(occurrences(start, 3, date(2030, 1, 5), date(2030, 1, 12)))
+    assert window == [(2, date(2030, 1, 7)), (3, date(2030, 1, 10))]
+    assert list(occurrences(start, 1, date(2029, 12, 30), date(2030, 1, 2))) == [(0, start)]
+    assert [pick_assignee([4, 7], k) for k in range(3)] == [4, 7, 4]
+    assert pick_assignee([4, 7], 5, fixed=9) is None
+
+
+def test_generator_rotates_and_is_idempotent(client, auth_headers, make_group, run_async):
+    group = make_group(members=1)
+    users = group["user_ids"]
+    chore = client.post("/chores/", json={"title": "Trash"}, headers=auth_headers).json()
+    schedule = client.post(
+        f"/chores/{chore['id']}/schedules",
+        json={"group_id": group["id"], "frequency": "daily", "start_date": "2030-01-01"},
+        headers=auth_headers,
+    )
+    assert schedule.status_code == 201
+    assert schedule.json()["interval_days"] == 1
+    weekly = {"group_id": group["id"], "frequency": "weekly", "start_date": "2030-01-01"}
+    client.post(
+        f"/chores/{chore['id']}/schedules",
+        json={**weekly, "assigned_to_user_id": users[1]},
+        headers=auth_headers,
+    )
+
+    assert run_async(generate_assignments(as_of=date(2030, 1, 1), days=3)) == 3 + 1
+    # повторный запуск ничего не создаёт
+    assert run_async(generate_assignments(as_of=date(2030, 1, 1), days=3)) == 0
+    assert run_async(generate_assignments(as_of=date(2030, 1, 2), days=3)) == 1  # только новый день
+
+    daily = [
+        a for a in client.get("/assignments/").json() if a["schedule_id"] == schedule.json()["id"]
+    ]
+    assert [(a["due_date"], a["assigned_to_user_id"]) for a in daily] == [
+        ("2030-01-01", users[0]),
+        ("2030-01-02", users[1]),
+        ("2030-01-03", users[0]),
+        ("2030-01-04", users[1]),
+    ]
+    stats = client.get(f"/groups/{group['id']}/stats").json()["members"]
+    assert sum(m["pending"] for m in stats) == 5
+    assert len(client.get(f"/groups/{group['id']}/schedules").json()) == 2
+
+
+def test_schedule_requires_interval_for_every_n_days(client, auth_headers):
+    body = {"group_id": 1, "frequency": "every_n_days", "start_date": "2030-01-01"}
+    resp = client.post("/chores/1/schedules", json=body, headers=auth_headers)
+    assert resp.status_code == 422
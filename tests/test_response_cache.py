@@ -0,0 +1,64 @@
+from app.response_cache import CachedResponse, ResponseCache, cache_key, response_cache
+
+
+def test_repeated_list_is_served_from_cache(client, auth_headers, count_statements):
+    for title in ("Sweep", "Mop"):
+        client.post("/chores/", json={"title": title}, headers=auth_headers)
+    first = client.get("/chores/?limit=1")
+    hits = response_cache.hits
+
+    with count_statements() as statements:
+        second = client.get("/chores/?limit=1")
+    assert second.json() == first.json()
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert len(statements) == 1  # version lookup only
+    assert response_cache.hits == hits + 1
+
+
+def test_write_invalidates_cached_list(client, auth_headers):
+    client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers)
+    assert len(client.get("/chores/").json()) == 1
+    assert response_cache.stats()["entries"] == 1
+
+    client.post("/chores/", json={"title": "Mop"}, headers=auth_headers)
+    assert response_cache.stats()["entries"] == 0
+    assert len(client.get("/chores/").json()) == 2
+
+
+def test_cache_is_bounded_by_bytes():
+    entry = CachedResponse("e", b"12345", {"etag": "e"}, frozenset({"s"}))
+    size = ResponseCache.entry_size("a", entry)
+    assert size > len(entry.body)  # ключ, заголовки и накладные расходы тоже считаются
+    cache = ResponseCache(max_bytes=2 * size)
+    for key in "abc":
+        cache.set(key, entry)
+    assert cache.get("a", "e") is None
+    assert cache.get("c", "e") is not None
+    assert cache.get("c", "other-etag") is None
+    assert cache.stats()["bytes"] == 2 * size
+    assert cache.evictions == 1
+
+
+def test_cache_is_bounded_by_entries_and_invalidates_by_scope():
+    cache = ResponseCache(max_bytes=10**9, max_entries=3)
+    for n in range(5):
+        cache.set(f"k{n}", CachedResponse("e", b"", {}, frozenset({f"s{n % 2}"})))
+    assert cache.stats()["entries"] == 3
+    assert cache.evictions == 2
+
+    cache.invalidate(["s0", "unknown"])
+    assert [k for k in ("k2", "k3", "k4") if cache.get(k, "e")] == ["k3"]
+    assert cache.invalidations == 2
+    cache.invalidate(["s1"])
+    assert cache.stats()["entries"] == cache.stats()["bytes"] == 0
+
+
+def test_unknown_query_parameters_share_one_entry(client, auth_headers):
+    client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers)
+    hits = response_cache.hits
+    for query in ("limit=5", "limit=05&x=1", "x=2&limit=5&y=3"):
+        assert client.get(f"/chores/?{query}").status_code == 200
+    assert response_cache.stats()["entries"] == 1
+    assert response_cache.hits == hits + 2
+    assert cache_key("/a", {"limit": 5, "after": None}) == "/a?limit=5"
@@ -0,0 +1,28 @@
+from typing import List
+
+from pydantic import TypeAdapter
+
+from schemas.assignment import AssignmentRead
+
+
+def test_fast_path_matches_response_model(client, auth_headers, make_group):
+    group = make_group()
+    chore = client.post("/chores/", json={"title": "Sweep"}, headers=auth_headers).json()
+    item = {
+        "chore_id": chore["id"],
+        "group_id": group["id"],
+        "assigned_to_user_id": group["user_ids"][0],
+    }
+    created = client.post(
+        "/assignments/", json={**item, "due_date": "2030-01-31"}, headers=auth_headers
+    )
+    client.post("/assignments/", json=item, headers=auth_headers)
+    client.post(f"/assignments/{created.json()['id']}/done", headers=auth_headers)
+
+    resp = client.get("/assignments/")
+    assert resp.headers["content-type"] == "application/json"
+    adapter = TypeAdapter(List[AssignmentRead])
+    # то же, что отдал бы FastAPI через response_model
+    assert resp.json() == adapter.dump_python(adapter.validate_json(resp.content), mode="json")
+    assert resp.json()[0]["due_date"] == "2030-01-31"
+    assert resp.json()[0]["completed_at"] is not None
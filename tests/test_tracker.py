@@ -1,5 +1,8 @@
 from datetime import date
 
+import pytest
+
+from domain.status import Status
 from domain.tracker import Tracker
 
 
@@ -34,3 +37,61 @@ def test_assignment_only_for_group_members():
     assert assignment.assigned_to_user_id == user2.id
     assert tracker.mark_assignment_done(assignment.id) is True
     assert tracker.get_assignment(assignment.id).status.value == "done"
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_indexed_listing_and_membership(columnar):
+    tracker = Tracker(columnar=columnar)
+    alice, bob = tracker.create_user("alice"), tracker.create_user("bob")
+    home, work = tracker.create_group("Home"), tracker.create_group("Work")
+    for user in (alice, bob):
+        tracker.add_user_to_group(user.id, home.id)
+    tracker.add_user_to_group(alice.id, work.id)
+    chore = tracker.create_chore("Dishes", None, created_by_user_id=alice.id)
+
+    def assign(group, user):
+        return tracker.assign_chore(chore.id, group.id, user.id, alice.id)
+
+    def ids(**filters):
+        return [a.id for a in tracker.list_assignments(**filters)]
+
+    a1, a2, a3 = (assign(home, alice).id, assign(home, bob).id, assign(work, alice).id)
+    assert ids(group_id=home.id) == [a1, a2]
+    assert ids(user_id=alice.id) == [a1, a3]
+    assert ids(group_id=home.id, user_id=bob.id) == [a2]
+
+    tracker.mark_assignment_done(a3)
+    tracker.mark_assignment_skipped(a1)
+    tracker.mark_assignment_done(a1)
+    assert ids(status=Status.DONE) == [a1, a3]
+    assert ids(status=Status.PENDING, user_id=bob.id) == [a2]
+    assert ids(status=Status.SKIPPED) == []
+    assert tracker.get_assignment(a1).completed_at is not None
+
+    tracker.remove_user_from_group(bob.id, home.id)
+    assert not home.has_user(bob.id) and bob.group_ids == []
+    assert home.user_ids == [alice.id]
+    assert assign(home, bob) is None
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_overdue_assignments(columnar):
+    tracker = Tracker(columnar=columnar)
+    alice = tracker.create_user("alice")
+    home = tracker.create_group("Home")
+    tracker.add_user_to_group(alice.id, home.id)
+    chore = tracker.create_chore("Dishes", None, created_by_user_id=alice.id)
+    due_dates = [date(2030, 1, 5), date(2030, 1, 1), None, date(2030, 1, 3), date(2030, 1, 9)]
+    ids = [tracker.assign_chore(chore.id, home.id, alice.id, alice.id, d).id for d in due_dates]
+
+    def overdue(as_of, **filters):
+        return [a.id for a in tracker.overdue_assignments(as_of, **filters)]
+
+    assert overdue(date(2030, 1, 6)) == [ids[1], ids[3], ids[0]]
+    tracker.mark_assignment_done(ids[3])
+    assert overdue(date(2030, 1, 6)) == [ids[1], ids[0]]
+    assert overdue(date(2030, 1, 1)) == []
+    assert overdue(date(2030, 2, 1), group_id=home.id + 1) == []
+    assert all(
+        a.is_overdue(date(2030, 2, 1)) for a in tracker.overdue_assignments(date(2030, 2, 1))
+    )